@@ -9,7 +9,7 @@ import uuid
 from datetime import date
 from typing import Optional
 
-from sqlalchemy import create_engine, inspect, select, text
+from sqlalchemy import bindparam, create_engine, inspect, select, text, update
 from sqlalchemy.orm import sessionmaker
 
 from models.database import Base
@@ -58,12 +58,14 @@ from simulation.narrative import (
     update_rivalries,
     generate_fighter_bio,
     get_tags,
+    get_traits,
     display_archetype,
     suggest_nicknames,
     generate_press_conference,
     generate_fight_headline,
     generate_fight_history_paragraph,
     extract_career_highlights,
+    _get_career_context,
 )
 from simulation.market import (
     compute_asking_salary,
@@ -95,6 +97,7 @@ def init_db(db_url: str) -> None:
     )
     Base.metadata.create_all(engine)
     _ensure_fighter_schema(engine)
+    _ensure_indexes(engine)
     _SessionFactory = sessionmaker(bind=engine, autoflush=True, expire_on_commit=False)
     _backfill_missing_portraits()
 
@@ -108,21 +111,39 @@ def _ensure_fighter_schema(engine) -> None:
         conn.execute(text("ALTER TABLE fighters ADD COLUMN portrait_key VARCHAR(255)"))
 
 
+def _ensure_indexes(engine) -> None:
+    # create_all() skips tables that already exist, so indexes added to the
+    # models later would never reach older save files without this pass
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
+
 def _backfill_missing_portraits() -> None:
     from simulation.portraits import assign_portrait_key
 
     if _SessionFactory is None:
         return
     with _SessionFactory() as session:
-        fighters = (
-            session.execute(select(Fighter).where(Fighter.portrait_key.is_(None)))
-            .scalars()
-            .all()
-        )
-        if not fighters:
+        # An upgraded save has every fighter missing a key; stream them in
+        # chunks and write the keys in one executemany so no chunk of
+        # Fighter objects has to stay alive until the commit
+        keys = [
+            {"b_id": fighter.id, "b_key": assign_portrait_key(fighter)}
+            for fighter in session.execute(
+                select(Fighter)
+                .where(Fighter.portrait_key.is_(None))
+                .execution_options(yield_per=200)
+            ).scalars()
+        ]
+        if not keys:
             return
-        for fighter in fighters:
-            fighter.portrait_key = assign_portrait_key(fighter)
+        session.execute(
+            update(Fighter.__table__)
+            .where(Fighter.__table__.c.id == bindparam("b_id"))
+            .values(portrait_key=bindparam("b_key")),
+            keys,
+        )
         session.commit()
 
 
@@ -451,10 +472,7 @@ def _fighter_dict(f: Fighter, session=None) -> dict:
 
 
 def _get_traits_list(f: Fighter) -> list[str]:
-    try:
-        return json.loads(f.traits) if f.traits else []
-    except (json.JSONDecodeError, TypeError):
-        return []
+    return get_traits(f)
 
 
 # ---------------------------------------------------------------------------
@@ -1071,12 +1089,12 @@ def _run_simulate_event(task_id: str, seed: int) -> None:
                             )
 
                     mark_rankings_dirty(session, WeightClass(fa.weight_class))
-                    apply_fight_tags(winner, loser, fight, session)
+                    fight_ctx = apply_fight_tags(winner, loser, fight, session)
 
                     # Generate headline
                     game_date = _get_game_date(session)
                     headline_text = generate_fight_headline(
-                        winner, loser, fight, session
+                        winner, loser, fight, session, fight_ctx
                     )
                     if headline_text:
                         cat = (
@@ -1243,8 +1261,10 @@ def get_fighter_bio(fighter_id: int) -> Optional[str]:
         f = session.get(Fighter, fighter_id)
         if not f:
             return None
-        character_sketch = generate_fighter_bio(f)
-        history_paragraph = generate_fight_history_paragraph(f, session)
+        # Both halves route on the same career context; build it once
+        ctx = _get_career_context(f)
+        character_sketch = generate_fighter_bio(f, ctx=ctx)
+        history_paragraph = generate_fight_history_paragraph(f, session, ctx=ctx)
         if history_paragraph:
             return character_sketch + "\n\n" + history_paragraph
         return character_sketch
@@ -1293,10 +1313,21 @@ def get_rivalries() -> list[dict]:
             .scalars()
             .all()
         )
+        # Rivals nearly always point at each other; fetch any that don't in
+        # one IN query rather than a lookup per fighter
+        fighters_by_id = {f.id: f for f in rivals}
+        missing_ids = {f.rivalry_with for f in rivals} - fighters_by_id.keys()
+        if missing_ids:
+            fighters_by_id.update(
+                (f.id, f)
+                for f in session.execute(
+                    select(Fighter).where(Fighter.id.in_(missing_ids))
+                ).scalars()
+            )
         seen: set[tuple] = set()
         result = []
         for f in rivals:
-            other = session.get(Fighter, f.rivalry_with)
+            other = fighters_by_id.get(f.rivalry_with)
             if not other:
                 continue
             pair = tuple(sorted([f.id, other.id]))
@@ -1619,8 +1650,7 @@ def _offer_evaluation_dict(
         org_id=effective_org_id,
         is_renewal=is_renewal,
     )
-    tags = json.loads(fighter.narrative_tags) if fighter.narrative_tags else []
-    if "quitter" in tags:
+    if "quitter" in get_tags(fighter):
         acceptance_probability *= 0.85
     offer_ratio = offered_salary / asking_salary if asking_salary > 0 else 1.0
     negotiation_profile = _negotiation_profile_dict(fighter, session, effective_org_id)
@@ -3475,11 +3505,13 @@ def _run_simulate_player_event(task_id: str, event_id: int, seed: int) -> None:
                     missed_weight_info.append({"fighter": fb.name, "fine": fine})
 
                 mark_rankings_dirty(session, WeightClass(fa.weight_class))
-                apply_fight_tags(winner, loser, fight, session)
+                fight_ctx = apply_fight_tags(winner, loser, fight, session)
 
                 # Generate headline
                 game_date = _get_game_date(session)
-                headline_text = generate_fight_headline(winner, loser, fight, session)
+                headline_text = generate_fight_headline(
+                    winner, loser, fight, session, fight_ctx
+                )
                 if headline_text:
                     cat = (
                         "title"
@@ -5285,10 +5317,8 @@ def _show_dict(
                     "episode_number": ep.episode_number,
                     "episode_type": ep.episode_type,
                     "air_date": ep.air_date.isoformat() if ep.air_date else None,
-                    "fight_results": json.loads(ep.fight_results)
-                    if ep.fight_results
-                    else [],
-                    "shenanigans": json.loads(ep.shenanigans) if ep.shenanigans else [],
+                    "fight_results": ep.fight_results or [],
+                    "shenanigans": ep.shenanigans or [],
                     "episode_narrative": ep.episode_narrative,
                     "episode_rating": round(ep.episode_rating, 1),
                     "hype_generated": round(ep.hype_generated, 1),
@@ -5561,11 +5591,7 @@ def get_show_bracket(show_id: int) -> dict:
                     fight_ep = ep
                     break
 
-            fight_data = (
-                json.loads(fight_ep.fight_results)
-                if fight_ep and fight_ep.fight_results
-                else []
-            )
+            fight_data = (fight_ep.fight_results if fight_ep else None) or []
 
             next_round_seeds = []
             for i, (seed_a, seed_b) in enumerate(current_matchup_seeds):
@@ -15,6 +15,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    JSON,
     String,
     Text,
     CheckConstraint,
@@ -207,15 +208,49 @@ class Fighter(Base):
     @property
     def overall(self) -> int:
         """Weighted overall rating."""
+        return Fighter.overall_from(
+            self.striking,
+            self.grappling,
+            self.wrestling,
+            self.cardio,
+            self.chin,
+            self.speed,
+        )
+
+    @staticmethod
+    def overall_from(
+        striking: int,
+        grappling: int,
+        wrestling: int,
+        cardio: int,
+        chin: int,
+        speed: int,
+    ) -> int:
+        """Weighted overall rating from raw attribute values."""
         return round(
-            self.striking * 0.2
-            + self.grappling * 0.2
-            + self.wrestling * 0.15
-            + self.cardio * 0.15
-            + self.chin * 0.15
-            + self.speed * 0.15
+            striking * 0.2
+            + grappling * 0.2
+            + wrestling * 0.15
+            + cardio * 0.15
+            + chin * 0.15
+            + speed * 0.15
         )
 
+    @property
+    def weight_class_value(self) -> str:
+        """Weight class as its plain string value."""
+        return getattr(self.weight_class, "value", self.weight_class)
+
+    @property
+    def style_value(self) -> str:
+        """Fighting style as its plain string value."""
+        return getattr(self.style, "value", self.style)
+
+    @property
+    def archetype_value(self) -> Optional[str]:
+        """Archetype as its plain string value, or None when unassigned."""
+        return getattr(self.archetype, "value", self.archetype)
+
     def __repr__(self) -> str:
         return f"<Fighter {self.name} ({self.weight_class}, {self.record})>"
 
@@ -399,8 +434,17 @@ class Fight(Base):
 
     __table_args__ = (
         Index("ix_fight_event", "event_id"),
-        Index("ix_fight_fighter_a", "fighter_a_id"),
-        Index("ix_fight_fighter_b", "fighter_b_id"),
+        # Newest-first per fighter, for streak and recent-form scans. The
+        # "either corner" filters (fighter_a_id = ? OR fighter_b_id = ?) use
+        # both through SQLite's multi-index OR, so they need no UNION rewrite.
+        Index("ix_fight_fighter_a_recent", fighter_a_id, id.desc()),
+        Index("ix_fight_fighter_b_recent", fighter_b_id, id.desc()),
+        Index(
+            "ix_fight_winner",
+            winner_id,
+            sqlite_where=winner_id.isnot(None),
+            postgresql_where=winner_id.isnot(None),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -424,7 +468,10 @@ class Ranking(Base):
     score: Mapped[float] = Column(Float, nullable=False)
     dirty: Mapped[bool] = Column(Boolean, default=True)
 
-    __table_args__ = (Index("ix_ranking_weight_class", "weight_class"),)
+    __table_args__ = (
+        Index("ix_ranking_weight_class", "weight_class"),
+        Index("ix_ranking_fighter_wc_rank", "fighter_id", "weight_class", "rank"),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -681,8 +728,11 @@ class ShowEpisode(Base):
         String(30), nullable=False
     )  # intro/quarterfinal/semifinal/finale/first_round
     air_date: Mapped[date] = Column(Date, nullable=False)
-    fight_results: Mapped[Optional[str]] = Column(Text, nullable=True)  # JSON
-    shenanigans: Mapped[Optional[str]] = Column(Text, nullable=True)  # JSON
+    # Serialized by SQLAlchemy; stored as JSON text, so existing rows still load
+    fight_results: Mapped[Optional[list]] = Column(
+        JSON(none_as_null=True), nullable=True
+    )
+    shenanigans: Mapped[Optional[list]] = Column(JSON(none_as_null=True), nullable=True)
     episode_narrative: Mapped[Optional[str]] = Column(Text, nullable=True)
     episode_rating: Mapped[float] = Column(Float, default=0.0)
     hype_generated: Mapped[float] = Column(Float, default=0.0)
@@ -1246,7 +1246,9 @@ def fabricate_history(
     # fighter's original W/L/D budget can be consumed. Update Fighter records
     # to match the actual Fight row counts so data stays consistent.
     mismatches = 0
-    all_fights = session.execute(select(Fight)).scalars().all()
+    fight_results = session.execute(
+        select(Fight.fighter_a_id, Fight.fighter_b_id, Fight.winner_id, Fight.method)
+    ).all()
 
     # Pre-compute actual win/loss/draw counts per fighter
     actual_wins_count: dict[int, int] = defaultdict(int)
@@ -1255,29 +1257,21 @@ def fabricate_history(
     actual_ko_wins: dict[int, int] = defaultdict(int)
     actual_sub_wins: dict[int, int] = defaultdict(int)
 
-    for fight in all_fights:
-        if fight.winner_id is None:
+    for fighter_a_id, fighter_b_id, winner_id, method in fight_results:
+        if winner_id is None:
             # Draw
-            actual_draws_count[fight.fighter_a_id] += 1
-            actual_draws_count[fight.fighter_b_id] += 1
+            actual_draws_count[fighter_a_id] += 1
+            actual_draws_count[fighter_b_id] += 1
         else:
-            actual_wins_count[fight.winner_id] += 1
-            loser_id = (
-                fight.fighter_b_id
-                if fight.winner_id == fight.fighter_a_id
-                else fight.fighter_a_id
-            )
+            actual_wins_count[winner_id] += 1
+            loser_id = fighter_b_id if winner_id == fighter_a_id else fighter_a_id
             actual_losses_count[loser_id] += 1
             # Track KO and sub wins
-            method_val = (
-                fight.method.value
-                if hasattr(fight.method, "value")
-                else str(fight.method)
-            )
+            method_val = method.value if hasattr(method, "value") else str(method)
             if method_val == "KO/TKO":
-                actual_ko_wins[fight.winner_id] += 1
+                actual_ko_wins[winner_id] += 1
             elif method_val == "Submission":
-                actual_sub_wins[fight.winner_id] += 1
+                actual_sub_wins[winner_id] += 1
 
     for f in fighters:
         new_wins = actual_wins_count.get(f.id, 0)
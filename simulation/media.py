@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, aliased
 
 from models.models import Contract, ContractStatus, Fighter, Organization, WeightClass
 from simulation.rankings import _compute_score
@@ -121,28 +121,17 @@ def get_fighter_storyline_effects(session: Session, fighter: Fighter) -> dict:
 
 
 def _top_rivalry_storyline(session: Session) -> dict | None:
-    rivals = (
-        session.execute(select(Fighter).where(Fighter.rivalry_with.isnot(None)))
-        .scalars()
-        .all()
-    )
-
-    seen: set[tuple[int, int]] = set()
-    best_pair: tuple[Fighter, Fighter] | None = None
-    best_score = -1.0
-
-    for fighter in rivals:
-        opponent = session.get(Fighter, fighter.rivalry_with)
-        if not opponent:
-            continue
-        pair = tuple(sorted((fighter.id, opponent.id)))
-        if pair in seen:
-            continue
-        seen.add(pair)
-        score = fighter.hype + opponent.hype + fighter.popularity + opponent.popularity
-        if score > best_score:
-            best_score = score
-            best_pair = (fighter, opponent)
+    # Best-drawing rivalry straight from SQL. A pair whose fighters point at
+    # each other appears twice; ordering ties by the pointing fighter's id
+    # keeps the lower id first, as a scan of the rivals in id order would.
+    opponent = aliased(Fighter)
+    score = Fighter.hype + opponent.hype + Fighter.popularity + opponent.popularity
+    best_pair = session.execute(
+        select(Fighter, opponent)
+        .join(opponent, opponent.id == Fighter.rivalry_with)
+        .order_by(score.desc(), Fighter.id)
+        .limit(1)
+    ).first()
 
     if not best_pair:
         return None
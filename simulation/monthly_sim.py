@@ -9,11 +9,22 @@ from __future__ import annotations
 
 import json
 import random
+from bisect import bisect_right
 from datetime import date, timedelta
+from itertools import accumulate
 from typing import Callable, Optional
 
-from sqlalchemy.orm import Session
-from sqlalchemy import select, or_ as db_or, and_ as db_and
+from sqlalchemy.orm import Session, aliased, selectinload
+from sqlalchemy import (
+    case,
+    exists,
+    func,
+    insert,
+    select,
+    update,
+    or_ as db_or,
+    and_ as db_and,
+)
 
 from models.models import (
     Fighter,
@@ -52,7 +63,11 @@ from simulation.org_strategy import (
 )
 from simulation.rankings import mark_rankings_dirty
 from simulation.narrative import (
+    _loss_streak,
+    add_tag,
     apply_fight_tags,
+    get_tags,
+    get_traits,
     decay_hype,
     update_goat_scores,
     update_rivalries,
@@ -61,6 +76,12 @@ from simulation.narrative import (
 )
 
 
+def _insert_rows(session: Session, model, rows: list[dict]) -> None:
+    """Insert accumulated rows for ``model`` in a single executemany."""
+    if rows:
+        session.execute(insert(model), rows)
+
+
 # ---------------------------------------------------------------------------
 # Aging & attribute progression
 # ---------------------------------------------------------------------------
@@ -201,15 +222,23 @@ def _process_contracts(session: Session, today: date, rng: random.Random) -> Non
 
 def _recover_injuries(session: Session) -> None:
     """Tick down injury counters and restore condition."""
-    injured = (
-        session.execute(select(Fighter).where(Fighter.injury_months > 0))
-        .scalars()
-        .all()
+    # One UPDATE; SET expressions read the pre-update injury_months, so a
+    # count of 1 is the month the fighter heals. "fetch" expires the rows
+    # on fighters the session already holds.
+    healed = Fighter.condition + 30
+    session.execute(
+        update(Fighter)
+        .where(Fighter.injury_months > 0)
+        .values(
+            injury_months=Fighter.injury_months - 1,
+            condition=case(
+                (Fighter.injury_months != 1, Fighter.condition),
+                (healed > 100.0, 100.0),
+                else_=healed,
+            ),
+        )
+        .execution_options(synchronize_session="fetch")
     )
-    for f in injured:
-        f.injury_months = max(0, f.injury_months - 1)
-        if f.injury_months == 0:
-            f.condition = min(100.0, f.condition + 30)
 
 
 # ---------------------------------------------------------------------------
@@ -354,10 +383,12 @@ def _generate_ai_event(
         mark_rankings_dirty(session, WeightClass(fa.weight_class))
 
         # Narrative tags and hype
-        apply_fight_tags(winner, loser, fight, session)
+        fight_ctx = apply_fight_tags(winner, loser, fight, session)
 
         # Generate headline
-        headline_text = generate_fight_headline(winner, loser, fight, session)
+        headline_text = generate_fight_headline(
+            winner, loser, fight, session, fight_ctx
+        )
         if headline_text:
             cat = (
                 "title"
@@ -393,22 +424,18 @@ def _generate_ai_event(
     org.bank_balance += event.total_revenue
 
 
+_CUT_PCT_THRESHOLDS = (5, 10, 15)
+_CUT_SEVERITIES = ("easy", "moderate", "severe", "extreme")
+
+
 def _get_cut_severity(f: Fighter) -> str:
     """Calculate weight cut severity for a fighter."""
-    if not getattr(f, "natural_weight", None) or not getattr(
-        f, "fighting_weight", None
-    ):
-        return "easy"
-    if f.natural_weight <= f.fighting_weight:
+    natural = f.natural_weight
+    fighting = f.fighting_weight
+    if not natural or not fighting or natural <= fighting:
         return "easy"
-    cut_pct = (f.natural_weight - f.fighting_weight) / f.natural_weight * 100
-    if cut_pct < 5:
-        return "easy"
-    elif cut_pct < 10:
-        return "moderate"
-    elif cut_pct < 15:
-        return "severe"
-    return "extreme"
+    cut_pct = (natural - fighting) / natural * 100
+    return _CUT_SEVERITIES[bisect_right(_CUT_PCT_THRESHOLDS, cut_pct)]
 
 
 def _process_broadcast_deals(
@@ -430,43 +457,46 @@ def _process_broadcast_deals(
         .all()
     )
 
-    for deal in deals:
-        # Check expiry
-        if sim_date >= deal.expiry_date:
-            deal.status = BroadcastDealStatus.EXPIRED
-            notifications.append(
-                f"Your {deal.tier} deal with {deal.network_name} has expired."
-            )
-            continue
-
-        # Apply monthly prestige gain
-        player_org.prestige = min(100.0, player_org.prestige + deal.prestige_per_month)
+    with session.no_autoflush:
+        for deal in deals:
+            # Check expiry
+            if sim_date >= deal.expiry_date:
+                deal.status = BroadcastDealStatus.EXPIRED
+                notifications.append(
+                    f"Your {deal.tier} deal with {deal.network_name} has expired."
+                )
+                continue
 
-        # Check if prestige dropped too far below minimum
-        if player_org.prestige < deal.min_prestige - 10:
-            deal.status = BroadcastDealStatus.CANCELLED
-            player_org.prestige = max(0.0, player_org.prestige - 5.0)
-            notifications.append(
-                f"DEAL CANCELLED: {deal.network_name} terminated your {deal.tier} deal — prestige fell too far below minimum."
+            # Apply monthly prestige gain
+            player_org.prestige = min(
+                100.0, player_org.prestige + deal.prestige_per_month
             )
-            continue
 
-        # Every 3 months: check event pace
-        months_elapsed = max(1, (sim_date - deal.start_date).days // 30)
-        if months_elapsed > 0 and months_elapsed % 3 == 0:
-            expected_events = deal.min_events_per_year * months_elapsed / 12
-            if deal.events_delivered < expected_events:
-                deal.compliance_warnings += 1
-                if deal.compliance_warnings >= 2:
-                    deal.status = BroadcastDealStatus.CANCELLED
-                    player_org.prestige = max(0.0, player_org.prestige - 5.0)
-                    notifications.append(
-                        f"DEAL CANCELLED: {deal.network_name} terminated your {deal.tier} deal — insufficient events."
-                    )
-                else:
-                    notifications.append(
-                        f"WARNING: {deal.network_name} is concerned about your event pace ({deal.events_delivered} events, expected {expected_events:.0f}). Warning {deal.compliance_warnings}/2."
-                    )
+            # Check if prestige dropped too far below minimum
+            if player_org.prestige < deal.min_prestige - 10:
+                deal.status = BroadcastDealStatus.CANCELLED
+                player_org.prestige = max(0.0, player_org.prestige - 5.0)
+                notifications.append(
+                    f"DEAL CANCELLED: {deal.network_name} terminated your {deal.tier} deal — prestige fell too far below minimum."
+                )
+                continue
+
+            # Every 3 months: check event pace
+            months_elapsed = max(1, (sim_date - deal.start_date).days // 30)
+            if months_elapsed > 0 and months_elapsed % 3 == 0:
+                expected_events = deal.min_events_per_year * months_elapsed / 12
+                if deal.events_delivered < expected_events:
+                    deal.compliance_warnings += 1
+                    if deal.compliance_warnings >= 2:
+                        deal.status = BroadcastDealStatus.CANCELLED
+                        player_org.prestige = max(0.0, player_org.prestige - 5.0)
+                        notifications.append(
+                            f"DEAL CANCELLED: {deal.network_name} terminated your {deal.tier} deal — insufficient events."
+                        )
+                    else:
+                        notifications.append(
+                            f"WARNING: {deal.network_name} is concerned about your event pace ({deal.events_delivered} events, expected {expected_events:.0f}). Warning {deal.compliance_warnings}/2."
+                        )
 
     return notifications
 
@@ -490,45 +520,49 @@ def _process_sponsorships(
         .all()
     )
 
-    total_income = 0.0
-    for sp in sponsorships:
-        fighter = session.get(Fighter, sp.fighter_id)
-
-        # 1. Expiry check
-        if sim_date >= sp.expiry_date:
-            sp.status = SponsorshipStatus.EXPIRED
-            notifications.append(
-                f"{sp.brand_name} sponsorship for {fighter.name if fighter else 'Unknown'} has expired ({sp.tier})."
-            )
-            continue
-
-        # 2. Contract check — fighter must still be on player roster
-        active_contract = session.execute(
-            select(Contract).where(
-                Contract.fighter_id == sp.fighter_id,
+    # Fighters with an active contract on the player roster, fetched once
+    rostered_ids = set(
+        session.execute(
+            select(Contract.fighter_id).where(
                 Contract.organization_id == player_org.id,
                 Contract.status == ContractStatus.ACTIVE,
             )
-        ).scalar_one_or_none()
-        if not active_contract:
-            sp.status = SponsorshipStatus.CANCELLED
-            notifications.append(
-                f"{sp.brand_name} dropped {fighter.name if fighter else 'Unknown'} — no longer on roster."
-            )
-            continue
+        ).scalars()
+    )
 
-        # 3. Compliance check — hype must not fall too far below minimum
-        if fighter and fighter.hype < sp.min_hype - 15:
-            sp.status = SponsorshipStatus.CANCELLED
-            notifications.append(
-                f"{sp.brand_name} dropped {fighter.name} — hype fell too low ({sp.tier})."
-            )
-            continue
+    total_income = 0.0
+    with session.no_autoflush:
+        for sp in sponsorships:
+            fighter = session.get(Fighter, sp.fighter_id)
+
+            # 1. Expiry check
+            if sim_date >= sp.expiry_date:
+                sp.status = SponsorshipStatus.EXPIRED
+                notifications.append(
+                    f"{sp.brand_name} sponsorship for {fighter.name if fighter else 'Unknown'} has expired ({sp.tier})."
+                )
+                continue
+
+            # 2. Contract check — fighter must still be on player roster
+            if sp.fighter_id not in rostered_ids:
+                sp.status = SponsorshipStatus.CANCELLED
+                notifications.append(
+                    f"{sp.brand_name} dropped {fighter.name if fighter else 'Unknown'} — no longer on roster."
+                )
+                continue
+
+            # 3. Compliance check — hype must not fall too far below minimum
+            if fighter and fighter.hype < sp.min_hype - 15:
+                sp.status = SponsorshipStatus.CANCELLED
+                notifications.append(
+                    f"{sp.brand_name} dropped {fighter.name} — hype fell too low ({sp.tier})."
+                )
+                continue
 
-        # 4. Pay stipend
-        player_org.bank_balance += sp.monthly_stipend
-        sp.total_paid += sp.monthly_stipend
-        total_income += sp.monthly_stipend
+            # 4. Pay stipend
+            player_org.bank_balance += sp.monthly_stipend
+            sp.total_paid += sp.monthly_stipend
+            total_income += sp.monthly_stipend
 
     if total_income > 0:
         notifications.append(f"Sponsorship income this month: ${total_income:,.0f}")
@@ -537,10 +571,7 @@ def _process_sponsorships(
 
 
 def _fighter_to_stats(f: Fighter) -> FighterStats:
-    try:
-        traits = json.loads(f.traits) if f.traits else []
-    except (json.JSONDecodeError, TypeError):
-        traits = []
+    traits = get_traits(f)
     style = f.style.value if hasattr(f.style, "value") else str(f.style)
     return FighterStats(
         id=f.id,
@@ -562,6 +593,25 @@ def _fighter_to_stats(f: Fighter) -> FighterStats:
 # ---------------------------------------------------------------------------
 
 
+# Bracket round reached after each episode type, by show format size
+_SHOW_ROUND_NUMBERS = {
+    8: {"intro": 0, "quarterfinal": 1, "semifinal": 2, "finale": 3},
+    16: {"intro": 0, "first_round": 1, "quarterfinal": 2, "semifinal": 3, "finale": 4},
+}
+
+_EPISODE_TITLES = {
+    "intro": "Intro",
+    "first_round": "First Round",
+    "quarterfinal": "Quarterfinal",
+    "semifinal": "Semifinal",
+    "finale": "Finale",
+}
+
+# Seeded opening-round pairings: 8-man quarterfinals, 16-man first round
+_QF_8 = ((1, 8), (4, 5), (3, 6), (2, 7))
+_R1_16 = ((1, 16), (8, 9), (4, 13), (5, 12), (3, 14), (6, 11), (2, 15), (7, 10))
+
+
 def _process_reality_show(
     session: Session, sim_date: date, player_org: Organization, rng: random.Random
 ) -> list[str]:
@@ -596,18 +646,25 @@ def _process_reality_show(
     ep_type = ep_types[ep_num - 1]
     is_fight_episode = ep_type != "intro"
 
-    # Get active contestants
+    # Get active contestants, with their fighters in one extra IN query
     contestants = (
         session.execute(
-            select(ShowContestant).where(
+            select(ShowContestant)
+            .options(selectinload(ShowContestant.fighter))
+            .where(
                 ShowContestant.show_id == show.id,
             )
         )
         .scalars()
         .all()
     )
-    active_contestants = [sc for sc in contestants if sc.status == "active"]
-    suspended_contestants = [sc for sc in contestants if sc.status == "suspended"]
+    active_contestants = []
+    suspended_contestants = []
+    for sc in contestants:
+        if sc.status == "active":
+            active_contestants.append(sc)
+        elif sc.status == "suspended":
+            suspended_contestants.append(sc)
 
     # Un-suspend fighters at start of new episode
     for sc in suspended_contestants:
@@ -645,22 +702,15 @@ def _process_reality_show(
         # Weight targets by traits
         target_weights = []
         for sc in eligible_targets:
-            fighter = session.get(Fighter, sc.fighter_id)
-            tags = []
-            try:
-                tags = (
-                    json.loads(fighter.narrative_tags)
-                    if fighter and fighter.narrative_tags
-                    else []
-                )
-            except (json.JSONDecodeError, TypeError):
-                pass
+            fighter = sc.fighter
+            # Quoted-name checks on the stored JSON, as in add_tag
+            tags = (fighter.narrative_tags or "") if fighter else ""
             w = 1.0
             if not is_positive:
-                if "hothead" in tags or "loose_cannon" in tags:
+                if '"hothead"' in tags or '"loose_cannon"' in tags:
                     w = 2.0
             else:
-                if "fan_favorite" in tags or "media_darling" in tags:
+                if '"fan_favorite"' in tags or '"media_darling"' in tags:
                     w = 1.5
             target_weights.append(w)
 
@@ -670,11 +720,12 @@ def _process_reality_show(
         )
 
         shenanigan = rng.choices(pool, weights=weights, k=1)[0]
-        fighter = session.get(Fighter, target_sc.fighter_id)
+        fighter = target_sc.fighter
+        shenanigan_type = shenanigan["type"]
 
         # Skip short_notice_step_up unless someone was recently eliminated
         eliminated_this_ep = [s for s in shenanigan_results if s.get("eliminated")]
-        if shenanigan["type"] == "short_notice_step_up" and not eliminated_this_ep:
+        if shenanigan_type == "short_notice_step_up" and not eliminated_this_ep:
             continue
 
         # Build description
@@ -687,18 +738,18 @@ def _process_reality_show(
                     if sc.fighter_id != target_sc.fighter_id
                 ]
             ).fighter_id
-            if shenanigan["type"] == "callout_favorite" and len(active_contestants) > 1
+            if shenanigan_type == "callout_favorite" and len(active_contestants) > 1
             else "",
         )
 
         # For callout_favorite, pick actual target name
-        if shenanigan["type"] == "callout_favorite" and len(active_contestants) > 1:
+        if shenanigan_type == "callout_favorite" and len(active_contestants) > 1:
             others = [
                 sc for sc in active_contestants if sc.fighter_id != target_sc.fighter_id
             ]
             if others:
                 other_sc = rng.choice(others)
-                other_fighter = session.get(Fighter, other_sc.fighter_id)
+                other_fighter = other_sc.fighter
                 desc = rng.choice(shenanigan["templates"]).format(
                     name=fighter.name,
                     target=other_fighter.name if other_fighter else "Unknown",
@@ -749,17 +800,7 @@ def _process_reality_show(
 
             # Apply tag
             if shenanigan["tag"]:
-                try:
-                    tags = (
-                        json.loads(fighter.narrative_tags)
-                        if fighter.narrative_tags
-                        else []
-                    )
-                except (json.JSONDecodeError, TypeError):
-                    tags = []
-                if shenanigan["tag"] not in tags:
-                    tags.append(shenanigan["tag"])
-                    fighter.narrative_tags = json.dumps(tags)
+                add_tag(fighter, shenanigan["tag"])
 
         # Special effects
         if effects.get("suspend"):
@@ -796,7 +837,7 @@ def _process_reality_show(
             ]
             targets = rng.sample(other_active, min(2, len(other_active)))
             for osc in targets:
-                of = session.get(Fighter, osc.fighter_id)
+                of = osc.fighter
                 if of:
                     of.confidence = max(
                         0.0, min(100.0, of.confidence + effects["others_confidence"])
@@ -810,7 +851,17 @@ def _process_reality_show(
     if is_fight_episode:
         # Build matchups from bracket
         contestants_by_seed = {sc.seed: sc for sc in contestants}
-        matchups = _get_round_matchups(show, ep_type, contestants_by_seed, session)
+        seed_by_fighter_id = {sc.fighter_id: sc.seed for sc in contestants}
+        # Earlier episodes of this show, fetched once for the bracket lookup
+        prior_episodes = {
+            ep.episode_type: ep
+            for ep in session.execute(
+                select(ShowEpisode).where(ShowEpisode.show_id == show.id)
+            ).scalars()
+        }
+        matchups = _get_round_matchups(
+            show, ep_type, seed_by_fighter_id, prior_episodes
+        )
 
         for seed_a, seed_b in matchups:
             sc_a = contestants_by_seed.get(seed_a)
@@ -819,8 +870,8 @@ def _process_reality_show(
             if not sc_a or not sc_b:
                 continue
 
-            fa = session.get(Fighter, sc_a.fighter_id) if sc_a else None
-            fb = session.get(Fighter, sc_b.fighter_id) if sc_b else None
+            fa = sc_a.fighter
+            fb = sc_b.fighter
 
             # Handle walkovers / bracket-preserving fallback
             a_can_fight = sc_a.status == "active" and fa and fa.injury_months == 0
@@ -958,7 +1009,7 @@ def _process_reality_show(
     # --- Training gains for all active contestants ---
     still_active = [sc for sc in contestants if sc.status == "active"]
     for sc in still_active:
-        fighter = session.get(Fighter, sc.fighter_id)
+        fighter = sc.fighter
         if fighter:
             attr = rng.choice(
                 ["striking", "grappling", "wrestling", "cardio", "chin", "speed"]
@@ -977,16 +1028,7 @@ def _process_reality_show(
     show.show_hype = min(100.0, show.show_hype + hype_generated)
 
     # --- Update round counter ---
-    if ep_type == "intro":
-        show.current_round = 0
-    elif ep_type == "first_round":
-        show.current_round = 1
-    elif ep_type == "quarterfinal":
-        show.current_round = 2 if show.format_size == 16 else 1
-    elif ep_type == "semifinal":
-        show.current_round = 3 if show.format_size == 16 else 2
-    elif ep_type == "finale":
-        show.current_round = 4 if show.format_size == 16 else 3
+    show.current_round = _SHOW_ROUND_NUMBERS[show.format_size][ep_type]
 
     # --- Create Event record for broadcast compliance ---
     broadcast_revenue = 0.0
@@ -1024,7 +1066,8 @@ def _process_reality_show(
         show.total_production_spend += show.production_cost_per_episode
 
     # --- Store episode ---
-    episode_narrative = f"Episode {ep_num}: {ep_type.replace('_', ' ').title()}"
+    ep_title = _EPISODE_TITLES[ep_type]
+    episode_narrative = f"Episode {ep_num}: {ep_title}"
     if shenanigan_results:
         episode_narrative += f" — {len(shenanigan_results)} shenanigan(s)"
     if fight_results:
@@ -1035,8 +1078,8 @@ def _process_reality_show(
         episode_number=ep_num,
         episode_type=ep_type,
         air_date=sim_date,
-        fight_results=json.dumps(fight_results) if fight_results else None,
-        shenanigans=json.dumps(shenanigan_results) if shenanigan_results else None,
+        fight_results=fight_results or None,
+        shenanigans=shenanigan_results or None,
         episode_narrative=episode_narrative,
         episode_rating=min(10.0, show.show_hype / 10),
         hype_generated=hype_generated,
@@ -1051,77 +1094,56 @@ def _process_reality_show(
         _conclude_show(session, show, contestants, sim_date, player_org)
         notifications.append(f"Reality show '{show.name}' has concluded!")
     else:
-        notifications.append(
-            f"'{show.name}' Episode {ep_num} aired — {ep_type.replace('_', ' ').title()}"
-        )
+        notifications.append(f"'{show.name}' Episode {ep_num} aired — {ep_title}")
 
     return notifications
 
 
-def _get_round_matchups(show, ep_type, contestants_by_seed, session):
+def _get_round_matchups(show, ep_type, seed_by_fighter_id, prior_episodes):
     """Return list of (seed_a, seed_b) matchups for the current round."""
     if show.format_size == 8:
         if ep_type == "quarterfinal":
-            return [(1, 8), (4, 5), (3, 6), (2, 7)]
+            return _QF_8
         elif ep_type == "semifinal":
             # Get QF winners from episode results
             return _get_next_round_matchups(
-                show, "quarterfinal", contestants_by_seed, session
+                "quarterfinal", seed_by_fighter_id, prior_episodes
             )
         elif ep_type == "finale":
             return _get_next_round_matchups(
-                show, "semifinal", contestants_by_seed, session
+                "semifinal", seed_by_fighter_id, prior_episodes
             )
     else:
         if ep_type == "first_round":
-            return [
-                (1, 16),
-                (8, 9),
-                (4, 13),
-                (5, 12),
-                (3, 14),
-                (6, 11),
-                (2, 15),
-                (7, 10),
-            ]
+            return _R1_16
         elif ep_type == "quarterfinal":
             return _get_next_round_matchups(
-                show, "first_round", contestants_by_seed, session
+                "first_round", seed_by_fighter_id, prior_episodes
             )
         elif ep_type == "semifinal":
             return _get_next_round_matchups(
-                show, "quarterfinal", contestants_by_seed, session
+                "quarterfinal", seed_by_fighter_id, prior_episodes
             )
         elif ep_type == "finale":
             return _get_next_round_matchups(
-                show, "semifinal", contestants_by_seed, session
+                "semifinal", seed_by_fighter_id, prior_episodes
             )
     return []
 
 
-def _get_next_round_matchups(show, prev_ep_type, contestants_by_seed, session):
+def _get_next_round_matchups(prev_ep_type, seed_by_fighter_id, prior_episodes):
     """Determine next round matchups from previous round results."""
-    # Find the previous round episode
-    prev_ep = session.execute(
-        select(ShowEpisode).where(
-            ShowEpisode.show_id == show.id,
-            ShowEpisode.episode_type == prev_ep_type,
-        )
-    ).scalar_one_or_none()
+    prev_ep = prior_episodes.get(prev_ep_type)
 
     if not prev_ep or not prev_ep.fight_results:
         return []
 
-    fight_data = json.loads(prev_ep.fight_results)
+    fight_data = prev_ep.fight_results
     winner_ids = [fr["winner_id"] for fr in fight_data if fr.get("winner_id")]
 
     # Map winner IDs back to seeds
-    id_to_seed = {}
-    for seed, sc in contestants_by_seed.items():
-        id_to_seed[sc.fighter_id] = seed
-
     winner_seeds = [
-        id_to_seed.get(wid) for wid in winner_ids if id_to_seed.get(wid) is not None
+        seed_by_fighter_id[wid] for wid in winner_ids if wid in seed_by_fighter_id
     ]
 
     # Pair winners sequentially: 1st vs 2nd, 3rd vs 4th, etc.
@@ -1164,7 +1186,7 @@ def _conclude_show(session, show, contestants, sim_date, player_org):
     ).scalar_one_or_none()
 
     if finale_ep and finale_ep.fight_results:
-        fight_data = json.loads(finale_ep.fight_results)
+        fight_data = finale_ep.fight_results
         if fight_data:
             finale_fight = fight_data[0]
             show.winner_id = finale_fight.get("winner_id")
@@ -1181,41 +1203,31 @@ def _conclude_show(session, show, contestants, sim_date, player_org):
     show.end_date = sim_date
 
     # Apply post-show effects
+    fighters_by_id = {sc.fighter_id: sc.fighter for sc in contestants}
     for sc in contestants:
-        fighter = session.get(Fighter, sc.fighter_id)
+        fighter = sc.fighter
         if not fighter:
             continue
 
-        try:
-            tags = json.loads(fighter.narrative_tags) if fighter.narrative_tags else []
-        except (json.JSONDecodeError, TypeError):
-            tags = []
-
         if fighter.id == show.winner_id:
-            if "show_winner" not in tags:
-                tags.append("show_winner")
+            add_tag(fighter, "show_winner")
             fighter.hype = min(100.0, fighter.hype + 30)
             fighter.popularity = min(100.0, fighter.popularity + 20)
         elif fighter.id == show.runner_up_id:
-            if "show_runner_up" not in tags:
-                tags.append("show_runner_up")
+            add_tag(fighter, "show_runner_up")
             fighter.hype = min(100.0, fighter.hype + 15)
             fighter.popularity = min(100.0, fighter.popularity + 10)
         elif sc.eliminated_round and sc.eliminated_round >= (
             3 if show.format_size == 16 else 2
         ):
-            if "show_veteran" not in tags:
-                tags.append("show_veteran")
+            add_tag(fighter, "show_veteran")
             fighter.hype = min(100.0, fighter.hype + 8)
             fighter.popularity = min(100.0, fighter.popularity + 5)
         else:
-            if "show_veteran" not in tags:
-                tags.append("show_veteran")
+            add_tag(fighter, "show_veteran")
             fighter.hype = min(100.0, fighter.hype + 3)
             fighter.popularity = min(100.0, fighter.popularity + 3)
 
-        fighter.narrative_tags = json.dumps(tags)
-
     # Org prestige gain
     prestige_gain = 3
     if show.show_hype > 70:
@@ -1231,7 +1243,7 @@ def _conclude_show(session, show, contestants, sim_date, player_org):
 
     # Winner contract auto-offer notification
     if show.winner_id:
-        winner = session.get(Fighter, show.winner_id)
+        winner = fighters_by_id.get(show.winner_id)
         if winner:
             session.add(
                 Notification(
@@ -1247,49 +1259,89 @@ def _conclude_show(session, show, contestants, sim_date, player_org):
 # ---------------------------------------------------------------------------
 
 
-def _ai_sign_free_agents(
-    session: Session, ai_orgs: list, sim_date: date, rng: random.Random, player_org
-) -> None:
-    """Each AI org evaluates free agents and signs 1-2 per month."""
-    # Build set of fighter IDs with active contracts
-    active_ids = set(
-        session.execute(
-            select(Contract.fighter_id).where(Contract.status == ContractStatus.ACTIVE)
+# Built once at import; SQLAlchemy caches its compiled form across calls
+_ACTIVE_ROSTER_STMT = select(Contract.organization_id, Contract.fighter_id).where(
+    Contract.status == ContractStatus.ACTIVE
+)
+
+
+def _active_roster_ids(session: Session) -> dict[int, list[int]]:
+    """Map each organization id to its actively contracted fighter ids."""
+    roster_ids: dict[int, list[int]] = {}
+    for org_id, fighter_id in session.execute(_ACTIVE_ROSTER_STMT):
+        roster_ids.setdefault(org_id, []).append(fighter_id)
+    return roster_ids
+
+
+def _show_locked_fighter_ids(sim_date: date):
+    """Subquery of fighters on an active show or one that just completed."""
+    return (
+        select(ShowContestant.fighter_id)
+        .join(RealityShow, ShowContestant.show_id == RealityShow.id)
+        .where(
+            db_or(
+                RealityShow.status == ShowStatus.IN_PROGRESS,
+                db_and(
+                    RealityShow.status == ShowStatus.COMPLETED,
+                    RealityShow.end_date == sim_date,
+                ),
+            )
         )
-        .scalars()
-        .all()
     )
 
-    # Also exclude fighters on active reality shows or shows that just completed this month
-    show_ids = set(
+
+def _ai_sign_free_agents(
+    session: Session,
+    ai_orgs: list,
+    sim_date: date,
+    rng: random.Random,
+    player_org,
+    fighters_by_id: dict[int, Fighter],
+) -> None:
+    """Each AI org evaluates free agents and signs 1-2 per month."""
+    # Free agents: no active contract, not retired, not tied to a reality show
+    free_agents = (
         session.execute(
-            select(ShowContestant.fighter_id)
-            .join(RealityShow, ShowContestant.show_id == RealityShow.id)
+            select(Fighter)
+            .outerjoin(
+                Contract,
+                db_and(
+                    Contract.fighter_id == Fighter.id,
+                    Contract.status == ContractStatus.ACTIVE,
+                ),
+            )
             .where(
-                db_or(
-                    RealityShow.status == ShowStatus.IN_PROGRESS,
-                    db_and(
-                        RealityShow.status == ShowStatus.COMPLETED,
-                        RealityShow.end_date == sim_date,
-                    ),
-                )
+                Contract.id.is_(None),
+                Fighter.is_retired == False,
+                Fighter.id.not_in(_show_locked_fighter_ids(sim_date)),
             )
+            .order_by(Fighter.id)
         )
         .scalars()
         .all()
     )
-    excluded_ids = active_ids | show_ids
-
-    all_fighters = session.execute(select(Fighter)).scalars().all()
-    free_agents = [
-        f for f in all_fighters if f.id not in excluded_ids and not f.is_retired
-    ]
+    # Keyed by id so signings can be dropped without rebuilding the pool
+    free_agents_by_id = {f.id: f for f in free_agents}
+    notif_rows: list[dict] = []
+    headline_rows: list[dict] = []
 
     if not free_agents:
         return
 
     player_prestige = player_org.prestige if player_org else 50.0
 
+    # Active rosters and per-division headcounts for every org, fetched once
+    roster_ids = _active_roster_ids(session)
+    wc_counts_by_org: dict[int, dict[str, int]] = {}
+    for org_id, weight_class, count in session.execute(
+        select(Contract.organization_id, Fighter.weight_class, func.count())
+        .join(Fighter, Fighter.id == Contract.fighter_id)
+        .where(Contract.status == ContractStatus.ACTIVE)
+        .group_by(Contract.organization_id, Fighter.weight_class)
+    ):
+        wc = weight_class.value if hasattr(weight_class, "value") else str(weight_class)
+        wc_counts_by_org.setdefault(org_id, {})[wc] = count
+
     for org in ai_orgs:
         # Max signings: 1 base, 2 if within 15 prestige of player (rival-tier)
         is_rival_tier = abs(org.prestige - player_prestige) <= 15
@@ -1299,30 +1351,16 @@ def _ai_sign_free_agents(
         # Min overall filter based on org prestige
         min_ovr = max(45, int(org.prestige * 0.55))
 
-        # Count roster by weight class for thin-class logic
-        org_contracts = (
-            session.execute(
-                select(Contract.fighter_id).where(
-                    Contract.organization_id == org.id,
-                    Contract.status == ContractStatus.ACTIVE,
-                )
-            )
-            .scalars()
-            .all()
-        )
-        org_fighter_ids = set(org_contracts)
-        org_fighters = [f for f in all_fighters if f.id in org_fighter_ids]
+        org_fighters = [
+            fighters_by_id[fid]
+            for fid in sorted(set(roster_ids.get(org.id, ())))
+            if fid in fighters_by_id
+        ]
         org_identity = derive_org_identity(org, org_fighters)
-        wc_counts: dict[str, int] = {}
-        for f in org_fighters:
-            wc = (
-                f.weight_class.value
-                if hasattr(f.weight_class, "value")
-                else str(f.weight_class)
-            )
-            wc_counts[wc] = wc_counts.get(wc, 0) + 1
+        # Roster by weight class for thin-class logic
+        wc_counts = wc_counts_by_org.get(org.id, {})
 
-        candidates = [f for f in free_agents if f.overall >= min_ovr]
+        candidates = [f for f in free_agents_by_id.values() if f.overall >= min_ovr]
         candidates.sort(
             key=lambda fighter: candidate_strategy_score(
                 fighter,
@@ -1388,55 +1426,109 @@ def _ai_sign_free_agents(
                     expiry_date=expiry,
                 )
                 session.add(contract)
-                active_ids.add(fighter.id)
+                free_agents_by_id.pop(fighter.id, None)
                 signed += 1
 
                 # Notify player for high-overall signings
                 if player_org and fighter.overall >= 65:
-                    session.add(
-                        Notification(
-                            message=f"{org.name} signed free agent {fighter.name} (OVR {fighter.overall})",
-                            type="rival_signed",
-                            created_date=sim_date,
-                        )
+                    notif_rows.append(
+                        {
+                            "message": f"{org.name} signed free agent {fighter.name} (OVR {fighter.overall})",
+                            "type": "rival_signed",
+                            "created_date": sim_date,
+                        }
                     )
 
                 # Generate signing headline for notable signings
                 signing_hl = generate_signing_headline(fighter, org)
                 if signing_hl:
-                    session.add(
-                        NewsHeadline(
-                            headline=signing_hl,
-                            category="signing",
-                            game_date=sim_date,
-                            fighter_id=fighter.id,
-                        )
+                    headline_rows.append(
+                        {
+                            "headline": signing_hl,
+                            "category": "signing",
+                            "game_date": sim_date,
+                            "fighter_id": fighter.id,
+                        }
                     )
 
-        # Remove signed fighters from free_agents list for next org
-        free_agents = [f for f in free_agents if f.id not in active_ids]
+    _insert_rows(session, Notification, notif_rows)
+    _insert_rows(session, NewsHeadline, headline_rows)
+
+
+def _pick_by_prestige(
+    ai_orgs: list, cum_weights: list[float], rng: random.Random
+) -> Organization:
+    """Prestige-weighted org pick, drawing exactly as ``rng.choices`` would."""
+    x = rng.random() * cum_weights[-1]
+    return ai_orgs[bisect_right(cum_weights, x, 0, len(ai_orgs) - 1)]
+
+
+def _load_contract_turnover(
+    session: Session, player_org, sim_date: date
+) -> tuple[list, list]:
+    """
+    Fetch the contracts the AI market reacts to this month in one query.
+
+    Returns ``(expiring, recently_expired)`` lists of ``(Contract, Fighter)``
+    rows: player contracts running out within 60 days (poach targets), and
+    contracts that expired in the last month whose fighter has no active
+    contract and is not on a show (claim targets).
+    """
+    active = aliased(Contract)
+    is_expired = Contract.status == ContractStatus.EXPIRED
+    branches = [
+        db_and(
+            is_expired,
+            Contract.expiry_date >= sim_date - timedelta(days=31),
+            Contract.expiry_date <= sim_date,
+            active.id.is_(None),
+            Contract.fighter_id.not_in(_show_locked_fighter_ids(sim_date)),
+        )
+    ]
+    if player_org:
+        branches.append(
+            db_and(
+                Contract.organization_id == player_org.id,
+                Contract.status == ContractStatus.ACTIVE,
+                Contract.expiry_date <= sim_date + timedelta(days=60),
+                Contract.expiry_date > sim_date,
+            )
+        )
+    rows = session.execute(
+        select(Contract, Fighter, is_expired.label("is_expired"))
+        .join(Fighter, Contract.fighter_id == Fighter.id)
+        .outerjoin(
+            active,
+            db_and(
+                active.fighter_id == Contract.fighter_id,
+                active.status == ContractStatus.ACTIVE,
+            ),
+        )
+        .where(db_or(*branches))
+        .order_by(Contract.id)
+    ).all()
+
+    expiring: list = []
+    recently_expired: list = []
+    for contract, fighter, expired in rows:
+        (recently_expired if expired else expiring).append((contract, fighter))
+    return expiring, recently_expired
 
 
 def _ai_poach_expiring(
-    session: Session, ai_orgs: list, player_org, sim_date: date, rng: random.Random
+    session: Session,
+    ai_orgs: list,
+    player_org,
+    sim_date: date,
+    rng: random.Random,
+    expiring: list,
 ) -> None:
     """AI orgs attempt to poach player fighters with expiring contracts."""
     if not player_org:
         return
 
-    cutoff = sim_date + timedelta(days=60)
-    expiring = session.execute(
-        select(Contract, Fighter)
-        .join(Fighter, Contract.fighter_id == Fighter.id)
-        .where(
-            Contract.organization_id == player_org.id,
-            Contract.status == ContractStatus.ACTIVE,
-            Contract.expiry_date <= cutoff,
-            Contract.expiry_date > sim_date,
-        )
-    ).all()
-
     player_prestige = player_org.prestige
+    cum_weights = list(accumulate(max(1.0, o.prestige) for o in ai_orgs))
 
     for contract, fighter in expiring:
         if fighter.overall < 62:
@@ -1445,8 +1537,7 @@ def _ai_poach_expiring(
         # Pick one AI org to attempt (weighted by prestige)
         if not ai_orgs:
             break
-        weights = [max(1.0, o.prestige) for o in ai_orgs]
-        ai_org = rng.choices(ai_orgs, weights=weights, k=1)[0]
+        ai_org = _pick_by_prestige(ai_orgs, cum_weights, rng)
 
         # Poach probability
         prob = 0.15
@@ -1468,55 +1559,24 @@ def _ai_poach_expiring(
 
 
 def _ai_claim_expired_fighters(
-    session: Session, ai_orgs: list, player_org, sim_date: date, rng: random.Random
+    session: Session,
+    ai_orgs: list,
+    player_org,
+    sim_date: date,
+    rng: random.Random,
+    recently_expired: list,
 ) -> None:
     """AI orgs pick up fighters whose contracts just expired."""
-    # Find fighters with no active contract and overall >= 62
-    active_ids = set(
-        session.execute(
-            select(Contract.fighter_id).where(Contract.status == ContractStatus.ACTIVE)
-        )
-        .scalars()
-        .all()
-    )
-
-    # Exclude show contestants (active or just-completed)
-    show_ids = set(
-        session.execute(
-            select(ShowContestant.fighter_id)
-            .join(RealityShow, ShowContestant.show_id == RealityShow.id)
-            .where(
-                db_or(
-                    RealityShow.status == ShowStatus.IN_PROGRESS,
-                    db_and(
-                        RealityShow.status == ShowStatus.COMPLETED,
-                        RealityShow.end_date == sim_date,
-                    ),
-                )
-            )
-        )
-        .scalars()
-        .all()
-    )
-    excluded_ids = active_ids | show_ids
-
-    # Find recently expired contracts (expired this cycle)
-    recently_expired = session.execute(
-        select(Contract, Fighter)
-        .join(Fighter, Contract.fighter_id == Fighter.id)
-        .where(
-            Contract.status == ContractStatus.EXPIRED,
-            Contract.expiry_date >= sim_date - timedelta(days=31),
-            Contract.expiry_date <= sim_date,
-        )
-    ).all()
-
     player_prestige = player_org.prestige if player_org else 50.0
+    cum_weights = list(accumulate(max(1.0, o.prestige) for o in ai_orgs))
+    notif_rows: list[dict] = []
+    headline_rows: list[dict] = []
+    # A fighter with several recently expired contracts appears once per
+    # contract; the first signing takes them off the market
+    signed_ids: set[int] = set()
 
     for contract, fighter in recently_expired:
-        if fighter.id in excluded_ids:
-            continue
-        if fighter.is_retired:
+        if fighter.is_retired or fighter.id in signed_ids:
             continue
         if fighter.overall < 62:
             continue
@@ -1524,8 +1584,7 @@ def _ai_claim_expired_fighters(
         # Org selection weighted by prestige
         if not ai_orgs:
             break
-        weights = [max(1.0, o.prestige) for o in ai_orgs]
-        ai_org = rng.choices(ai_orgs, weights=weights, k=1)[0]
+        ai_org = _pick_by_prestige(ai_orgs, cum_weights, rng)
 
         # Sign probability
         signals = compute_market_signals(fighter, session, ai_org.id)
@@ -1553,74 +1612,72 @@ def _ai_claim_expired_fighters(
                 expiry_date=expiry,
             )
             session.add(new_contract)
-            active_ids.add(fighter.id)
+            signed_ids.add(fighter.id)
 
             # Notify player
             if player_org:
                 was_player_fighter = contract.organization_id == player_org.id
                 if was_player_fighter or fighter.overall >= 65:
-                    session.add(
-                        Notification(
-                            message=f"{ai_org.name} claimed {fighter.name} (OVR {fighter.overall})",
-                            type="rival_signed",
-                            created_date=sim_date,
-                        )
+                    notif_rows.append(
+                        {
+                            "message": f"{ai_org.name} claimed {fighter.name} (OVR {fighter.overall})",
+                            "type": "rival_signed",
+                            "created_date": sim_date,
+                        }
                     )
 
             # Generate signing headline for notable signings
             signing_hl = generate_signing_headline(fighter, ai_org)
             if signing_hl:
-                session.add(
-                    NewsHeadline(
-                        headline=signing_hl,
-                        category="signing",
-                        game_date=sim_date,
-                        fighter_id=fighter.id,
-                    )
+                headline_rows.append(
+                    {
+                        "headline": signing_hl,
+                        "category": "signing",
+                        "game_date": sim_date,
+                        "fighter_id": fighter.id,
+                    }
                 )
 
+    _insert_rows(session, Notification, notif_rows)
+    _insert_rows(session, NewsHeadline, headline_rows)
+
 
 def _fluctuate_ai_prestige(
-    session: Session, ai_orgs: list, sim_date: date, rng: random.Random
+    session: Session,
+    ai_orgs: list,
+    sim_date: date,
+    rng: random.Random,
+    fighters_by_id: dict[int, Fighter],
 ) -> None:
     """Monthly prestige fluctuation for AI orgs."""
+    # Recent event counts and active rosters for every org, two queries total
+    recent_cutoff = sim_date - timedelta(days=90)
+    event_counts = dict(
+        session.execute(
+            select(Event.organization_id, func.count(Event.id))
+            .where(
+                Event.status == EventStatus.COMPLETED,
+                Event.event_date >= recent_cutoff,
+            )
+            .group_by(Event.organization_id)
+        ).all()
+    )
+    roster_ids = _active_roster_ids(session)
+
     for org in ai_orgs:
         # Base drift
         delta = rng.uniform(-0.5, 0.5)
 
         # Activity bonus: +0.3 per event in last 90 days, max +0.9
-        recent_cutoff = sim_date - timedelta(days=90)
-        recent_events = (
-            session.execute(
-                select(Event).where(
-                    Event.organization_id == org.id,
-                    Event.status == EventStatus.COMPLETED,
-                    Event.event_date >= recent_cutoff,
-                )
-            )
-            .scalars()
-            .all()
-        )
-        activity_bonus = min(0.9, len(recent_events) * 0.3)
+        activity_bonus = min(0.9, event_counts.get(org.id, 0) * 0.3)
         delta += activity_bonus
 
         # Roster quality bonus: avg overall of top 5 fighters
-        org_fighter_ids = (
-            session.execute(
-                select(Contract.fighter_id).where(
-                    Contract.organization_id == org.id,
-                    Contract.status == ContractStatus.ACTIVE,
-                )
-            )
-            .scalars()
-            .all()
-        )
-        if org_fighter_ids:
-            org_fighters = (
-                session.execute(select(Fighter).where(Fighter.id.in_(org_fighter_ids)))
-                .scalars()
-                .all()
-            )
+        org_fighter_ids = roster_ids.get(org.id, [])
+        org_fighters = [
+            fighters_by_id[fid] for fid in org_fighter_ids if fid in fighters_by_id
+        ]
+        if org_fighters:
             top5 = sorted(org_fighters, key=lambda f: f.overall, reverse=True)[:5]
             avg_ovr = sum(f.overall for f in top5) / len(top5)
             if avg_ovr >= 75:
@@ -1655,21 +1712,35 @@ _RETIREMENT_HEADLINES_LEGEND = [
 ]
 
 
-def _should_retire(fighter: Fighter, session: Session, rng: random.Random) -> bool:
-    """Determine if a fighter should retire this month."""
+def _should_retire(
+    fighter: Fighter,
+    session: Session,
+    rng: random.Random,
+    on_active_show: Optional[set[int]] = None,
+) -> bool:
+    """Determine if a fighter should retire this month.
+
+    ``on_active_show`` is the set of fighter ids currently on an in-progress
+    reality show; callers checking the whole roster pass it so the show
+    check is not queried per fighter.
+    """
     # Never retire if too young
     if fighter.age < 30:
         return False
 
     # Never retire if on active reality show
-    active_show = session.execute(
-        select(ShowContestant)
-        .join(RealityShow, ShowContestant.show_id == RealityShow.id)
-        .where(
-            ShowContestant.fighter_id == fighter.id,
-            RealityShow.status == ShowStatus.IN_PROGRESS,
-        )
-    ).scalar_one_or_none()
+    if on_active_show is not None:
+        active_show = fighter.id in on_active_show
+    else:
+        active_show = session.execute(
+            select(
+                exists().where(
+                    ShowContestant.show_id == RealityShow.id,
+                    ShowContestant.fighter_id == fighter.id,
+                    RealityShow.status == ShowStatus.IN_PROGRESS,
+                )
+            )
+        ).scalar()
     if active_show:
         return False
 
@@ -1679,14 +1750,9 @@ def _should_retire(fighter: Fighter, session: Session, rng: random.Random) -> bo
     if years_past_prime > 8:
         return True
 
-    # Forced: retirement_watch tag AND overall < 55
-    tags = []
-    try:
-        tags = json.loads(fighter.narrative_tags) if fighter.narrative_tags else []
-    except (json.JSONDecodeError, TypeError):
-        pass
-
-    if "retirement_watch" in tags and fighter.overall < 55:
+    # Forced: retirement_watch tag AND overall < 55. Runs for every active
+    # fighter each month, so the tag is spotted without parsing the JSON.
+    if '"retirement_watch"' in (fighter.narrative_tags or "") and fighter.overall < 55:
         return True
 
     # Probabilistic (only when past prime)
@@ -1702,16 +1768,14 @@ def _should_retire(fighter: Fighter, session: Session, rng: random.Random) -> bo
         prob += (60 - fighter.overall) * 0.01
 
     # Loss streak
-    from simulation.narrative import _loss_streak
-
-    ls = _loss_streak(fighter.id, session)
+    ls = _loss_streak(fighter.id, session, limit=3)
     if ls >= 3:
         prob += 0.10
     elif ls >= 2:
         prob += 0.05
 
     # retirement_watch tag
-    if "retirement_watch" in tags:
+    if '"retirement_watch"' in (fighter.narrative_tags or ""):
         prob += 0.15
 
     # High GOAT score — proved everything
@@ -1728,30 +1792,33 @@ def _compute_legacy_score(fighter: Fighter, session: Session) -> float:
     """Compute a frozen legacy score at retirement."""
     score = fighter.wins * 2.0 - fighter.losses * 0.5
 
-    # Quality of opposition: per-win opponent overall bonus
-
-    wins_a = session.execute(
-        select(Fight, Fighter)
-        .join(Fighter, Fight.fighter_b_id == Fighter.id)
-        .where(Fight.fighter_a_id == fighter.id, Fight.winner_id == fighter.id)
-    ).all()
-    wins_b = session.execute(
-        select(Fight, Fighter)
-        .join(Fighter, Fight.fighter_a_id == Fighter.id)
-        .where(Fight.fighter_b_id == fighter.id, Fight.winner_id == fighter.id)
+    # Quality of opposition: per-win opponent overall bonus. One query over
+    # both corners, reading only the attributes overall is built from.
+    opponent_id = case(
+        (Fight.fighter_a_id == fighter.id, Fight.fighter_b_id),
+        else_=Fight.fighter_a_id,
+    )
+    opponent_ratings = session.execute(
+        select(
+            Fighter.striking,
+            Fighter.grappling,
+            Fighter.wrestling,
+            Fighter.cardio,
+            Fighter.chin,
+            Fighter.speed,
+        )
+        .select_from(Fight)
+        .join(Fighter, Fighter.id == opponent_id)
+        .where(Fight.winner_id == fighter.id)
     ).all()
-    for _, opp in wins_a + wins_b:
-        score += (opp.overall / 100) * 3.0
+    for ratings in opponent_ratings:
+        score += (Fighter.overall_from(*ratings) / 100) * 3.0
 
     # Finishing bonus
     score += (fighter.ko_wins + fighter.sub_wins) * 1.5
 
     # Title reigns
-    tags = []
-    try:
-        tags = json.loads(fighter.narrative_tags) if fighter.narrative_tags else []
-    except (json.JSONDecodeError, TypeError):
-        pass
+    tags = get_tags(fighter)
     score += tags.count("champion") * 8.0
 
     # Longevity
@@ -1794,11 +1861,7 @@ def _retire_fighter(
     fighter.legacy_score = _compute_legacy_score(fighter, session)
 
     # Update tags
-    tags = []
-    try:
-        tags = json.loads(fighter.narrative_tags) if fighter.narrative_tags else []
-    except (json.JSONDecodeError, TypeError):
-        tags = []
+    tags = get_tags(fighter)
 
     # Add retired tag, remove active-career tags
     active_tags_to_remove = [
@@ -1912,9 +1975,17 @@ def _process_retirements(
         .all()
     )
 
+    on_active_show = set(
+        session.execute(
+            select(ShowContestant.fighter_id)
+            .join(RealityShow, ShowContestant.show_id == RealityShow.id)
+            .where(RealityShow.status == ShowStatus.IN_PROGRESS)
+        ).scalars()
+    )
+
     retired_count = 0
     for fighter in all_fighters:
-        if _should_retire(fighter, session, rng):
+        if _should_retire(fighter, session, rng, on_active_show):
             _retire_fighter(session, fighter, sim_date, player_org, rng)
             retired_count += 1
 
@@ -1963,39 +2034,37 @@ def sim_month(
         "injuries_healed": 0,
         "events_simulated": 0,
     }
+    # Player-facing notifications are collected and inserted in one batch
+    notif_rows: list[dict] = []
 
     # 0. Player org monthly payroll deduction
     player_org = session.execute(
         select(Organization).where(Organization.is_player == True)
     ).scalar_one_or_none()
     if player_org:
-        active_player_contracts = (
-            session.execute(
-                select(Contract).where(
-                    Contract.organization_id == player_org.id,
-                    Contract.status == ContractStatus.ACTIVE,
-                )
+        annual_payroll = session.execute(
+            select(func.coalesce(func.sum(Contract.salary), 0)).where(
+                Contract.organization_id == player_org.id,
+                Contract.status == ContractStatus.ACTIVE,
             )
-            .scalars()
-            .all()
-        )
-        monthly_payroll = sum(c.salary / 12 for c in active_player_contracts)
+        ).scalar()
+        monthly_payroll = annual_payroll / 12
         player_org.bank_balance -= monthly_payroll
         if player_org.bank_balance < 0:
-            session.add(
-                Notification(
-                    message="Your organization's finances are in the red. Consider releasing fighters.",
-                    type="finances_critical",
-                    created_date=sim_date,
-                )
+            notif_rows.append(
+                {
+                    "message": "Your organization's finances are in the red. Consider releasing fighters.",
+                    "type": "finances_critical",
+                    "created_date": sim_date,
+                }
             )
         if player_org.bank_balance < -500_000:
-            session.add(
-                Notification(
-                    message="Bankruptcy warning! Your debt exceeds $500,000. Take immediate action.",
-                    type="bankruptcy_warning",
-                    created_date=sim_date,
-                )
+            notif_rows.append(
+                {
+                    "message": "Bankruptcy warning! Your debt exceeds $500,000. Take immediate action.",
+                    "type": "bankruptcy_warning",
+                    "created_date": sim_date,
+                }
             )
 
         # Legend coach payroll
@@ -2010,23 +2079,38 @@ def sim_month(
         if legend_payroll > 0:
             player_org.bank_balance -= legend_payroll
 
-    # 1. Age all fighters (bulk update — fast regardless of roster size)
+    # 1. Confidence decays 2 points toward the 70 baseline in one UPDATE
+    conf = Fighter.confidence
+    session.execute(
+        update(Fighter)
+        .where(Fighter.is_retired == False)
+        .values(
+            confidence=case(
+                (conf > 72, conf - 2.0),
+                (conf > 70, 70.0),
+                (conf < 68, conf + 2.0),
+                (conf < 70, 70.0),
+                else_=conf,
+            )
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+    # 1a. Age all fighters. Loaded once (refreshing any stale confidence in
+    # the identity map) and shared with the AI roster steps below.
     all_fighters = (
-        session.execute(select(Fighter).where(Fighter.is_retired == False))
+        session.execute(select(Fighter).execution_options(populate_existing=True))
         .scalars()
         .all()
     )
+    fighters_by_id = {f.id: f for f in all_fighters}
     for fighter in all_fighters:
+        if fighter.is_retired:
+            continue
         _age_fighter(fighter, rng)
         # Track peak overall
         if fighter.overall > (fighter.peak_overall or 0):
             fighter.peak_overall = fighter.overall
-        # Confidence decay toward 70 (baseline)
-        conf = getattr(fighter, "confidence", 70.0) or 70.0
-        if conf > 70:
-            fighter.confidence = max(70.0, conf - 2.0)
-        elif conf < 70:
-            fighter.confidence = min(70.0, conf + 2.0)
         summary["fighters_aged"] += 1
 
     if progress_callback:
@@ -2039,52 +2123,36 @@ def sim_month(
         dev_notifications = process_fighter_development(
             session, player_org.id, sim_date
         )
-        for msg in dev_notifications:
-            session.add(
-                Notification(
-                    message=msg,
-                    type="development",
-                    created_date=sim_date,
-                )
-            )
+        notif_rows.extend(
+            {"message": msg, "type": "development", "created_date": sim_date}
+            for msg in dev_notifications
+        )
 
     # 1c. Process broadcast deals (player org only)
     if player_org:
         broadcast_notifications = _process_broadcast_deals(
             session, sim_date, player_org
         )
-        for msg in broadcast_notifications:
-            session.add(
-                Notification(
-                    message=msg,
-                    type="broadcast",
-                    created_date=sim_date,
-                )
-            )
+        notif_rows.extend(
+            {"message": msg, "type": "broadcast", "created_date": sim_date}
+            for msg in broadcast_notifications
+        )
 
     # 1d. Process sponsorships (player org only)
     if player_org:
         sponsorship_notifications = _process_sponsorships(session, sim_date, player_org)
-        for msg in sponsorship_notifications:
-            session.add(
-                Notification(
-                    message=msg,
-                    type="sponsorship",
-                    created_date=sim_date,
-                )
-            )
+        notif_rows.extend(
+            {"message": msg, "type": "sponsorship", "created_date": sim_date}
+            for msg in sponsorship_notifications
+        )
 
     # 1e. Process reality show episode (player org only)
     if player_org:
         show_notifications = _process_reality_show(session, sim_date, player_org, rng)
-        for msg in show_notifications:
-            session.add(
-                Notification(
-                    message=msg,
-                    type="show",
-                    created_date=sim_date,
-                )
-            )
+        notif_rows.extend(
+            {"message": msg, "type": "show", "created_date": sim_date}
+            for msg in show_notifications
+        )
 
     # 2. Recover injuries
     _recover_injuries(session)
@@ -2101,16 +2169,24 @@ def sim_month(
     )
 
     # 3a. AI poach expiring player fighters
-    _ai_poach_expiring(session, ai_orgs, player_org, sim_date, rng)
+    expiring, recently_expired = _load_contract_turnover(session, player_org, sim_date)
+    _ai_poach_expiring(session, ai_orgs, player_org, sim_date, rng, expiring)
 
     # 3b. AI claim expired fighters
-    _ai_claim_expired_fighters(session, ai_orgs, player_org, sim_date, rng)
+    _ai_claim_expired_fighters(
+        session,
+        ai_orgs,
+        player_org,
+        sim_date,
+        rng,
+        recently_expired,
+    )
 
     # 3c. Decay hype before events (fights will restore it via apply_fight_tags)
     decay_hype(session, rng)
 
     # 4. AI sign free agents
-    _ai_sign_free_agents(session, ai_orgs, sim_date, rng, player_org)
+    _ai_sign_free_agents(session, ai_orgs, sim_date, rng, player_org, fighters_by_id)
 
     # 4b. AI organizations generate events (roughly 1-in-3 chance per org per month)
     for org in ai_orgs:
@@ -2119,7 +2195,7 @@ def sim_month(
             summary["events_simulated"] += 1
 
     # 4c. AI prestige fluctuation
-    _fluctuate_ai_prestige(session, ai_orgs, sim_date, rng)
+    _fluctuate_ai_prestige(session, ai_orgs, sim_date, rng, fighters_by_id)
 
     # 5. Post-event narrative updates
     update_goat_scores(session)
@@ -2129,6 +2205,8 @@ def sim_month(
     retired_count = _process_retirements(session, sim_date, rng, player_org)
     summary["fighters_retired"] = retired_count
 
+    _insert_rows(session, Notification, notif_rows)
+
     # Advance game clock by one month
     if game_state:
         month = sim_date.month
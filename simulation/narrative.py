@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import heapq
 import json
+import math
 import random
+import re
+import string
+from collections.abc import Callable
 from typing import Optional
 
+import numpy as np
 from jinja2 import Environment
-from sqlalchemy import select, or_, and_, func
+from sqlalchemy import bindparam, select, update, or_, and_, case, exists, func
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
 from models.models import Fighter, Fight, Event, Ranking, WeightClass, Archetype, FighterDevelopment, Organization
 
@@ -138,21 +145,39 @@ NATIONALITY_TONE: dict[str, str] = {
 }
 
 
-def _nationality_flavor(fighter: Fighter) -> str:
+_LineParts = tuple[tuple[str, Optional[str]], ...]
+
+
+def _compile_line(template: str) -> _LineParts:
+    """Split a ``{field}`` template into (literal, field) pairs once at import,
+    so rendering is a join rather than a fresh str.format parse per bio."""
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if spec or conversion:
+            raise ValueError(f"unsupported format spec in bio line: {template!r}")
+        parts.append((literal, field))
+    return tuple(parts)
+
+
+def _render_line(parts: _LineParts, fields: dict[str, str]) -> str:
+    return "".join([literal + fields[field] if field else literal for literal, field in parts])
+
+
+# (nationality, matching style) -> compiled flavor lines; only pairs that have lines
+_NAT_MATCH: dict[tuple[str, str], list[_LineParts]] = {
+    (nat, style): [_compile_line(line) for line in _NATIONALITY_FLAVOR_LINES[nat]]
+    for nat, style in NATIONALITY_STYLE_MAP.items()
+    if _NATIONALITY_FLAVOR_LINES.get(nat)
+}
+
+
+def _nationality_flavor(fighter: Fighter, rng: random.Random) -> str:
     """Return a nationality-themed flavor sentence if the fighter's style matches
     their nationality's stereotype. Returns empty string for Americans or mismatches."""
-    nat = fighter.nationality if hasattr(fighter, "nationality") else ""
-    if not nat or nat == "American" or nat not in NATIONALITY_STYLE_MAP:
-        return ""
-    expected_style = NATIONALITY_STYLE_MAP[nat]
-    actual_style = fighter.style.value if hasattr(fighter.style, "value") else str(fighter.style)
-    if actual_style != expected_style:
-        return ""
-    lines = _NATIONALITY_FLAVOR_LINES.get(nat, [])
+    lines = _NAT_MATCH.get((fighter.nationality, fighter.style_value))
     if not lines:
         return ""
-    name = fighter.name
-    return random.choice(lines).format(name=name)
+    return _render_line(rng.choice(lines), {"name": fighter.name})
 
 
 # ---------------------------------------------------------------------------
@@ -213,45 +238,52 @@ TRAIT_NICKNAME_BOOSTS: dict[str, list[str]] = {
     "media_darling": ["The Star", "Camera Ready", "Showtime", "The Draw"],
 }
 
+# Base weights per archetype, built once; suggest_nicknames copies one and
+# overlays trait and nationality boosts
+_ARCHETYPE_NICK_WEIGHTS: dict[str, dict[str, float]] = {
+    arch: dict.fromkeys(pool, 1.0) for arch, pool in NICKNAME_POOLS.items()
+}
 
-def suggest_nicknames(fighter: Fighter, session: Optional[Session] = None) -> list[str]:
-    """Return 3 distinct nickname suggestions based on archetype, traits, and nationality."""
-    archetype_val = fighter.archetype.value if hasattr(fighter.archetype, "value") else (fighter.archetype or "Journeyman")
-    pool_items: list[tuple[str, float]] = []
 
-    # Archetype pool
-    archetype_pool = NICKNAME_POOLS.get(archetype_val, NICKNAME_POOLS["Journeyman"])
-    for nick in archetype_pool:
-        pool_items.append((nick, 1.0))
+def suggest_nicknames(
+    fighter: Fighter,
+    session: Optional[Session] = None,
+    used: Optional[set[str]] = None,
+) -> list[str]:
+    """Return 3 distinct nickname suggestions based on archetype, traits, and nationality.
+
+    Nicknames in ``used`` are skipped. Without it, a ``session`` is queried
+    for the nicknames already on the roster; callers naming many fighters
+    should fetch that set once and pass it in.
+    """
+    archetype_val = fighter.archetype_value or "Journeyman"
+
+    # Archetype pool; boosts below keep the highest weight per nickname
+    best_weight = dict(
+        _ARCHETYPE_NICK_WEIGHTS.get(archetype_val, _ARCHETYPE_NICK_WEIGHTS["Journeyman"])
+    )
 
     # Trait boosts
-    traits = get_traits(fighter)
-    for trait in traits:
-        boosts = TRAIT_NICKNAME_BOOSTS.get(trait, [])
-        for nick in boosts:
-            pool_items.append((nick, 2.5))
+    for trait in get_traits(fighter):
+        for nick in TRAIT_NICKNAME_BOOSTS.get(trait, ()):
+            if best_weight.get(nick, 0.0) < 2.5:
+                best_weight[nick] = 2.5
 
     # Nationality nicknames
-    nat = fighter.nationality if hasattr(fighter, "nationality") else ""
-    nat_nicks = NATIONALITY_NICKNAMES.get(nat, [])
-    for nick in nat_nicks:
-        pool_items.append((nick, 1.8))
+    nat = fighter.nationality
+    for nick in NATIONALITY_NICKNAMES.get(nat, ()):
+        if best_weight.get(nick, 0.0) < 1.8:
+            best_weight[nick] = 1.8
 
-    if not pool_items:
+    if not best_weight:
         return ["The Fighter", "Unknown", "Mystery"]
 
-    # Deduplicate — keep highest weight for each nickname
-    best_weight: dict[str, float] = {}
-    for nick, weight in pool_items:
-        if nick not in best_weight or weight > best_weight[nick]:
-            best_weight[nick] = weight
-
     # Filter out already-used nicknames
-    if session:
-        existing = session.execute(
+    if used is None and session:
+        used = set(session.execute(
             select(Fighter.nickname).where(Fighter.nickname.isnot(None))
-        ).scalars().all()
-        used = set(existing)
+        ).scalars())
+    if used:
         best_weight = {k: v for k, v in best_weight.items() if k not in used}
 
     if len(best_weight) < 3:
@@ -262,22 +294,13 @@ def suggest_nicknames(fighter: Fighter, session: Optional[Session] = None) -> li
             if len(best_weight) >= 3:
                 break
 
-    names = list(best_weight.keys())
-    weights = list(best_weight.values())
-
-    # Pick 3 distinct
-    chosen = []
-    for _ in range(3):
-        if not names:
-            break
-        picks = random.choices(names, weights=weights, k=1)
-        pick = picks[0]
-        chosen.append(pick)
-        idx = names.index(pick)
-        names.pop(idx)
-        weights.pop(idx)
-
-    return chosen
+    # Pick 3 distinct: weighted sampling without replacement via
+    # Efraimidis-Spirakis keys, keeping the largest log(u) / weight
+    keyed = (
+        (math.log(1.0 - random.random()) / weight, nick)
+        for nick, weight in best_weight.items()
+    )
+    return [nick for _, nick in heapq.nlargest(3, keyed)]
 
 
 # ---------------------------------------------------------------------------
@@ -285,101 +308,139 @@ def suggest_nicknames(fighter: Fighter, session: Optional[Session] = None) -> li
 # ---------------------------------------------------------------------------
 
 def get_tags(fighter: Fighter) -> list[str]:
-    if not fighter.narrative_tags:
+    raw = fighter.narrative_tags
+    if not raw:
         return []
+    # The parsed list is cached on the instance alongside the string it came
+    # from; any direct write to narrative_tags simply misses the cache
+    cached = getattr(fighter, "_tags_cache", None)
+    if cached is not None and cached[0] == raw:
+        return list(cached[1])
     try:
-        return json.loads(fighter.narrative_tags)
+        tags = json.loads(raw)
     except (json.JSONDecodeError, TypeError):
         return []
+    fighter._tags_cache = (raw, tags)
+    return list(tags)
+
+
+def _set_tags(fighter: Fighter, tags: list[str]) -> None:
+    raw = json.dumps(tags)
+    fighter.narrative_tags = raw
+    fighter._tags_cache = (raw, tags)
 
 
 def add_tag(fighter: Fighter, tag: str) -> None:
+    # Tags are plain identifiers, so the quoted name in the stored JSON
+    # answers "already tagged" without parsing or copying the list
+    if f'"{tag}"' in (fighter.narrative_tags or ""):
+        return
     tags = get_tags(fighter)
-    if tag not in tags:
-        tags.append(tag)
-    fighter.narrative_tags = json.dumps(tags)
+    tags.append(tag)
+    _set_tags(fighter, tags)
 
 
 def remove_tag(fighter: Fighter, tag: str) -> None:
+    if f'"{tag}"' not in (fighter.narrative_tags or ""):
+        return
     tags = get_tags(fighter)
     if tag in tags:
         tags.remove(tag)
-    fighter.narrative_tags = json.dumps(tags)
+        _set_tags(fighter, tags)
+
+
+def _append_tag(tags: list[str], tag: str) -> None:
+    if tag not in tags:
+        tags.append(tag)
+
+
+def _discard_tag(tags: list[str], tag: str) -> None:
+    if tag in tags:
+        tags.remove(tag)
 
 
 def get_traits(fighter: Fighter) -> list[str]:
-    if not hasattr(fighter, "traits") or not fighter.traits:
+    raw = fighter.traits
+    if not raw:
         return []
+    # Cached the same way as get_tags
+    cached = getattr(fighter, "_traits_cache", None)
+    if cached is not None and cached[0] == raw:
+        return list(cached[1])
     try:
-        return json.loads(fighter.traits)
+        traits = json.loads(raw)
     except (json.JSONDecodeError, TypeError):
         return []
+    fighter._traits_cache = (raw, traits)
+    return list(traits)
 
 
 # ---------------------------------------------------------------------------
 # Fight history helpers
 # ---------------------------------------------------------------------------
 
-def _win_streak(fighter_id: int, session: Session) -> int:
-    fights = session.execute(
-        select(Fight)
-        .where(
-            or_(Fight.fighter_a_id == fighter_id, Fight.fighter_b_id == fighter_id),
-            Fight.winner_id.isnot(None),
-        )
-        .order_by(Fight.id.desc())
-    ).scalars().all()
-    streak = 0
-    for f in fights:
-        if f.winner_id == fighter_id:
-            streak += 1
-        else:
-            break
-    return streak
+# Decided results for one fighter, newest first; served by the
+# ix_fight_fighter_{a,b}_recent indexes
+_STREAK_STMT = (
+    select(Fight.winner_id)
+    .where(
+        or_(Fight.fighter_a_id == bindparam("fighter_id"), Fight.fighter_b_id == bindparam("fighter_id")),
+        Fight.winner_id.isnot(None),
+    )
+    .order_by(Fight.id.desc())
+)
 
 
-def _loss_streak(fighter_id: int, session: Session) -> int:
-    fights = session.execute(
-        select(Fight)
-        .where(
-            or_(Fight.fighter_a_id == fighter_id, Fight.fighter_b_id == fighter_id),
-            Fight.winner_id.isnot(None),
-        )
-        .order_by(Fight.id.desc())
-    ).scalars().all()
+def _streaks(fighter_id: int, session: Session, limit: Optional[int] = None) -> tuple[int, int]:
+    """(win streak, loss streak) ending at the fighter's latest decided fight.
+
+    At most one of the two is non-zero, so both come from one ordered scan
+    that stops at the first result breaking the leading run. ``limit`` caps
+    how many fights back are read, for callers that only test a threshold.
+    """
+    stmt = _STREAK_STMT if limit is None else _STREAK_STMT.limit(limit)
+    winner_ids = session.execute(stmt, {"fighter_id": fighter_id}).scalars()
     streak = 0
-    for f in fights:
-        if f.winner_id != fighter_id:
-            streak += 1
-        else:
+    won = None
+    for winner_id in winner_ids:
+        if won is None:
+            won = winner_id == fighter_id
+        elif (winner_id == fighter_id) != won:
             break
-    return streak
+        streak += 1
+    return (streak, 0) if won else (0, streak)
+
+
+def _win_streak(fighter_id: int, session: Session, limit: Optional[int] = None) -> int:
+    return _streaks(fighter_id, session, limit)[0]
+
+
+def _loss_streak(fighter_id: int, session: Session, limit: Optional[int] = None) -> int:
+    return _streaks(fighter_id, session, limit)[1]
 
 
 def _previously_lost_to(winner_id: int, loser_id: int, current_fight_id: int, session: Session) -> bool:
-    prior = session.execute(
-        select(Fight).where(
+    return session.execute(
+        select(exists().where(
             or_(
                 and_(Fight.fighter_a_id == winner_id, Fight.fighter_b_id == loser_id),
                 and_(Fight.fighter_a_id == loser_id,  Fight.fighter_b_id == winner_id),
             ),
             Fight.winner_id == loser_id,
             Fight.id != current_fight_id,
-        )
-    ).scalars().first()
-    return prior is not None
+        ))
+    ).scalar()
 
 
 def _had_prior_loss(fighter_id: int, current_fight_id: int, session: Session) -> bool:
     """True if the fighter has ever lost before this fight."""
-    prior = session.execute(
-        select(Fight).where(
+    return session.execute(
+        select(exists().where(
             or_(Fight.fighter_a_id == fighter_id, Fight.fighter_b_id == fighter_id),
             Fight.winner_id != fighter_id,
             Fight.id != current_fight_id,
-        )
-    ).scalars().first()
-    return prior is not None
+        ))
+    ).scalar()
 
 
 def _ko_loss_count(fighter_id: int, session: Session) -> int:
@@ -393,28 +454,30 @@ def _ko_loss_count(fighter_id: int, session: Session) -> int:
 
 
 def _is_ranked_top_5(fighter_id: int, session: Session) -> bool:
-    r = session.execute(
-        select(Ranking).where(Ranking.fighter_id == fighter_id, Ranking.rank <= 5)
-    ).scalar_one_or_none()
-    return r is not None
+    return session.execute(
+        select(exists().where(Ranking.fighter_id == fighter_id, Ranking.rank <= 5))
+    ).scalar()
 
 
 def _is_ranked(fighter_id: int, session: Session) -> bool:
     return session.execute(
-        select(Ranking).where(Ranking.fighter_id == fighter_id)
-    ).scalar_one_or_none() is not None
+        select(exists().where(Ranking.fighter_id == fighter_id))
+    ).scalar()
+
+
+# Built once at import; the weight class binds through the column's Enum
+# type, which accepts the WeightClass member or its plain string value
+_NUMBER_ONE_STMT = select(exists().where(
+    Ranking.fighter_id == bindparam("fighter_id"),
+    Ranking.weight_class == bindparam("weight_class"),
+    Ranking.rank == 1,
+))
 
 
 def _is_ranked_number_one(fighter_id: int, weight_class, session: Session) -> bool:
-    wc_val = weight_class.value if hasattr(weight_class, "value") else weight_class
-    r = session.execute(
-        select(Ranking).where(
-            Ranking.fighter_id == fighter_id,
-            Ranking.weight_class == wc_val,
-            Ranking.rank == 1,
-        )
-    ).scalar_one_or_none()
-    return r is not None
+    return session.execute(
+        _NUMBER_ONE_STMT, {"fighter_id": fighter_id, "weight_class": weight_class}
+    ).scalar()
 
 
 def _first_round_finish_count(fighter_id: int, session: Session) -> int:
@@ -444,15 +507,14 @@ def _decision_win_count(fighter_id: int, session: Session) -> int:
 
 def _has_been_kod(fighter_id: int, session: Session) -> bool:
     """True if fighter has ever lost by KO/TKO."""
-    r = session.execute(
-        select(Fight).where(
+    return session.execute(
+        select(exists().where(
             or_(Fight.fighter_a_id == fighter_id, Fight.fighter_b_id == fighter_id),
             Fight.winner_id != fighter_id,
             Fight.winner_id.isnot(None),
             Fight.method == "KO/TKO",
-        )
-    ).scalars().first()
-    return r is not None
+        ))
+    ).scalar()
 
 
 def _total_completed_fights(fighter_id: int, session: Session) -> int:
@@ -465,100 +527,180 @@ def _total_completed_fights(fighter_id: int, session: Session) -> int:
     ).scalar() or 0
 
 
+_DECISION_METHODS = ("Unanimous Decision", "Split Decision", "Majority Decision")
+
+
+def _fight_context(winner: Fighter, loser: Fighter, fight: Fight, session: Session) -> dict:
+    """Career facts apply_fight_tags needs, from one fight and one ranking query.
+
+    Answers the same questions as the single-purpose helpers above
+    (_win_streak, _is_ranked, ...) for both fighters at once.
+    """
+    ids = (winner.id, loser.id)
+    history = session.execute(
+        select(
+            Fight.id, Fight.fighter_a_id, Fight.fighter_b_id,
+            Fight.winner_id, Fight.method, Fight.round_ended,
+        )
+        .where(
+            or_(Fight.fighter_a_id.in_(ids), Fight.fighter_b_id.in_(ids)),
+            Fight.winner_id.isnot(None),
+        )
+        .order_by(Fight.id.desc())
+    ).all()
+    rankings = session.execute(
+        select(Ranking.fighter_id, Ranking.weight_class, Ranking.rank)
+        .where(Ranking.fighter_id.in_(ids))
+    ).all()
+
+    def _streak(rows: list, fighter_id: int, won: bool) -> int:
+        streak = 0
+        for r in rows:
+            if (r.winner_id == fighter_id) != won:
+                break
+            streak += 1
+        return streak
+
+    w_fights = [r for r in history if winner.id in (r.fighter_a_id, r.fighter_b_id)]
+    l_fights = [r for r in history if loser.id in (r.fighter_a_id, r.fighter_b_id)]
+    w_wins = [r for r in w_fights if r.winner_id == winner.id]
+    w_losses = [r for r in w_fights if r.winner_id != winner.id]
+    w_ranks = [r for r in rankings if r.fighter_id == winner.id]
+    l_ranks = [r for r in rankings if r.fighter_id == loser.id]
+    wc_val = winner.weight_class_value
+
+    return {
+        "winner_streak": _streak(w_fights, winner.id, True),
+        "loser_streak": _streak(l_fights, loser.id, False),
+        "previously_lost_to": any(
+            r.winner_id == loser.id and r.id != fight.id for r in w_losses
+        ),
+        "had_prior_loss": any(r.id != fight.id for r in w_losses),
+        "loser_ko_losses": sum(
+            1 for r in l_fights if r.winner_id != loser.id and r.method == "KO/TKO"
+        ),
+        "first_round_finishes": sum(
+            1 for r in w_wins
+            if r.round_ended == 1 and r.method in ("KO/TKO", "Submission")
+        ),
+        "decision_wins": sum(1 for r in w_wins if r.method in _DECISION_METHODS),
+        "winner_been_kod": any(r.method == "KO/TKO" for r in w_losses),
+        "winner_total_fights": len(w_fights),
+        "winner_ranked": bool(w_ranks),
+        "loser_ranked": bool(l_ranks),
+        "winner_top_5": any(r.rank <= 5 for r in w_ranks),
+        "loser_top_5": any(r.rank <= 5 for r in l_ranks),
+        "winner_number_one": any(
+            r.rank == 1
+            and r.weight_class == wc_val
+            for r in w_ranks
+        ),
+    }
+
+
 # ---------------------------------------------------------------------------
 # apply_fight_tags
 # ---------------------------------------------------------------------------
 
-def apply_fight_tags(winner: Fighter, loser: Fighter, fight: Fight, session: Session) -> None:
-    """Evaluate fight context and append narrative tags to both fighters."""
+def apply_fight_tags(winner: Fighter, loser: Fighter, fight: Fight, session: Session) -> dict:
+    """Evaluate fight context and append narrative tags to both fighters.
+
+    Returns the _fight_context dict so generate_fight_headline can reuse
+    the streaks instead of querying them again.
+    """
 
     is_finish = fight.method in ("KO/TKO", "Submission")
     is_upset = is_finish and loser.overall > winner.overall
-    winner_traits = get_traits(winner)
-    loser_traits  = get_traits(loser)
+    winner_traits = frozenset(get_traits(winner))
+    loser_traits  = frozenset(get_traits(loser))
+    ctx = _fight_context(winner, loser, fight, session)
+    # Tags are edited as local lists and stored once per fighter at the end
+    w_tags = get_tags(winner)
+    l_tags = get_tags(loser)
+    w_before = list(w_tags)
+    l_before = list(l_tags)
 
     # ── Tag removal logic ────────────────────────────────────────────────────
     # Winner: answered doubters — remove retirement_watch
-    remove_tag(winner, "retirement_watch")
+    _discard_tag(w_tags, "retirement_watch")
     # Loser: no longer undefeated
-    remove_tag(loser, "undefeated")
+    _discard_tag(l_tags, "undefeated")
     # Loser: remove rising_prospect if loss_streak >= 2
-    ls_loser = _loss_streak(loser.id, session)
-    if ls_loser >= 2:
-        remove_tag(loser, "rising_prospect")
+    ls = ctx["loser_streak"]
+    if ls >= 2:
+        _discard_tag(l_tags, "rising_prospect")
 
     # ── Winner tags ──────────────────────────────────────────────────────────
 
     if winner.wins == 1:
-        add_tag(winner, "first_win")
+        _append_tag(w_tags, "first_win")
 
-    ws = _win_streak(winner.id, session)
+    ws = ctx["winner_streak"]
     if ws >= 5:
-        add_tag(winner, "unstoppable")
+        _append_tag(w_tags, "unstoppable")
     elif ws >= 3:
-        add_tag(winner, "on_a_tear")
+        _append_tag(w_tags, "on_a_tear")
 
     if is_upset:
-        add_tag(winner, "upset_finish")
+        _append_tag(w_tags, "upset_finish")
 
-    if _previously_lost_to(winner.id, loser.id, fight.id, session):
-        add_tag(winner, "redemption")
+    if ctx["previously_lost_to"]:
+        _append_tag(w_tags, "redemption")
 
-    if _is_ranked_top_5(loser.id, session) and not _is_ranked(winner.id, session):
-        add_tag(winner, "giant_killer")
+    if ctx["loser_top_5"] and not ctx["winner_ranked"]:
+        _append_tag(w_tags, "giant_killer")
 
     if winner.age > winner.prime_end:
-        add_tag(winner, "ageless_wonder")
+        _append_tag(w_tags, "ageless_wonder")
 
-    archetype_val = winner.archetype.value if hasattr(winner.archetype, "value") else winner.archetype
+    archetype_val = winner.archetype_value
     if archetype_val == "GOAT Candidate" and winner.wins >= 10:
-        add_tag(winner, "goat_watch")
+        _append_tag(w_tags, "goat_watch")
 
-    if _is_ranked_number_one(winner.id, winner.weight_class, session):
-        add_tag(winner, "champion")
+    if ctx["winner_number_one"]:
+        _append_tag(w_tags, "champion")
 
     # comeback_king: won after having at least one prior loss
-    if "comeback_king" in winner_traits and _had_prior_loss(winner.id, fight.id, session):
-        add_tag(winner, "answered_doubters")
+    if "comeback_king" in winner_traits and ctx["had_prior_loss"]:
+        _append_tag(w_tags, "answered_doubters")
 
     # ── Loser tags ───────────────────────────────────────────────────────────
 
     if loser.losses == 1:
-        add_tag(loser, "first_setback")
+        _append_tag(l_tags, "first_setback")
 
-    ls = _loss_streak(loser.id, session)
     if ls >= 3:
         if "journeyman_heart" not in loser_traits:
-            add_tag(loser, "fading")
+            _append_tag(l_tags, "fading")
         else:
-            remove_tag(loser, "fading")
+            _discard_tag(l_tags, "fading")
     elif ls >= 2:
-        add_tag(loser, "at_the_crossroads")
+        _append_tag(l_tags, "at_the_crossroads")
 
-    if fight.method == "KO/TKO" and _ko_loss_count(loser.id, session) >= 2:
+    if fight.method == "KO/TKO" and ctx["loser_ko_losses"] >= 2:
         if "journeyman_heart" not in loser_traits:
-            add_tag(loser, "chin_concerns")
+            _append_tag(l_tags, "chin_concerns")
 
     # ── Cornerstone fall from grace ───────────────────────────────────────────
     if getattr(loser, "is_cornerstone", False) and ls >= 3:
         loser.is_cornerstone = False
-        add_tag(loser, "fall_from_grace")
+        _append_tag(l_tags, "fall_from_grace")
 
     # ── NEW: Method-specific winner tags ─────────────────────────────────────
 
     if winner.ko_wins >= 5:
-        add_tag(winner, "ko_specialist")
+        _append_tag(w_tags, "ko_specialist")
 
     if winner.sub_wins >= 5:
-        add_tag(winner, "submission_ace")
+        _append_tag(w_tags, "submission_ace")
 
-    if fight.round_ended == 1 and is_finish and _first_round_finish_count(winner.id, session) >= 3:
-        add_tag(winner, "first_round_finisher")
+    if fight.round_ended == 1 and is_finish and ctx["first_round_finishes"] >= 3:
+        _append_tag(w_tags, "first_round_finisher")
 
     method_str_raw = fight.method.value if hasattr(fight.method, "value") else str(fight.method)
-    is_decision = method_str_raw in ("Unanimous Decision", "Split Decision", "Majority Decision")
-    if is_decision and _decision_win_count(winner.id, session) >= 5:
-        add_tag(winner, "decision_machine")
+    is_decision = method_str_raw in _DECISION_METHODS
+    if is_decision and ctx["decision_wins"] >= 5:
+        _append_tag(w_tags, "decision_machine")
 
     if method_str_raw == "KO/TKO" and fight.round_ended == 1:
         # time_ended format is "M:SS" — check if under 2:00
@@ -566,70 +708,69 @@ def apply_fight_tags(winner: Fighter, loser: Fighter, fight: Fight, session: Ses
             parts = fight.time_ended.split(":")
             mins = int(parts[0])
             if mins < 2:
-                add_tag(winner, "highlight_reel")
+                _append_tag(w_tags, "highlight_reel")
         except (AttributeError, ValueError, IndexError):
             pass
 
     if is_finish and fight.round_ended and fight.round_ended >= 3:
-        add_tag(winner, "comeback_victory")
+        _append_tag(w_tags, "comeback_victory")
 
     # ── NEW: Career pattern winner tags ──────────────────────────────────────
 
-    total_fights = _total_completed_fights(winner.id, session)
-    if total_fights >= 10 and not _has_been_kod(winner.id, session):
-        add_tag(winner, "iron_chin_proven")
+    total_fights = ctx["winner_total_fights"]
+    if total_fights >= 10 and not ctx["winner_been_kod"]:
+        _append_tag(w_tags, "iron_chin_proven")
 
-    winner_archetype = winner.archetype.value if hasattr(winner.archetype, "value") else (winner.archetype or "")
-    if winner_archetype == "Gatekeeper" and _is_ranked(loser.id, session):
-        add_tag(winner, "gatekeeper_confirmed")
+    winner_archetype = winner.archetype_value or ""
+    if winner_archetype == "Gatekeeper" and ctx["loser_ranked"]:
+        _append_tag(w_tags, "gatekeeper_confirmed")
 
     if winner.age > winner.prime_end + 2:
-        add_tag(winner, "veteran_presence")
+        _append_tag(w_tags, "veteran_presence")
 
     if fight.is_title_fight:
-        add_tag(winner, "clutch_performer")
+        _append_tag(w_tags, "clutch_performer")
 
     if winner.age < 24 and winner.wins >= 5 and ws >= 3:
-        add_tag(winner, "rising_prospect")
+        _append_tag(w_tags, "rising_prospect")
 
     if winner.losses == 0 and winner.wins >= 5:
-        add_tag(winner, "undefeated")
+        _append_tag(w_tags, "undefeated")
 
     if total_fights >= 15:
-        add_tag(winner, "road_warrior")
+        _append_tag(w_tags, "road_warrior")
 
-    if _is_ranked_top_5(winner.id, session) and ws >= 3:
-        add_tag(winner, "title_contender")
+    if ctx["winner_top_5"] and ws >= 3:
+        _append_tag(w_tags, "title_contender")
 
-    if not _is_ranked(winner.id, session) and _is_ranked(loser.id, session):
-        add_tag(winner, "dark_horse")
+    if not ctx["winner_ranked"] and ctx["loser_ranked"]:
+        _append_tag(w_tags, "dark_horse")
 
     # ── NEW: Loser career pattern tags ───────────────────────────────────────
 
     if loser.age > loser.prime_end + 3 and ls >= 2 and loser.overall < 65:
-        add_tag(loser, "retirement_watch")
+        _append_tag(l_tags, "retirement_watch")
 
-    loser_tags = get_tags(loser)
-    if "chin_concerns" in loser_tags and "ko_specialist" in loser_tags:
-        add_tag(loser, "glass_cannon")
+    if "chin_concerns" in l_tags and "ko_specialist" in l_tags:
+        _append_tag(l_tags, "glass_cannon")
 
     if ls >= 3:
         has_dev = session.execute(
-            select(FighterDevelopment).where(
+            select(exists().where(
                 FighterDevelopment.fighter_id == loser.id,
                 FighterDevelopment.camp_id.isnot(None),
-            )
-        ).scalar_one_or_none()
+            ))
+        ).scalar()
         if not has_dev:
-            add_tag(loser, "needs_new_camp")
+            _append_tag(l_tags, "needs_new_camp")
 
     # ── NEW: Fight quality tags (winner only) ────────────────────────────────
 
     if is_decision and winner.hype > 40 and loser.hype > 40:
-        add_tag(winner, "fight_of_the_night")
+        _append_tag(w_tags, "fight_of_the_night")
 
     if is_decision and fight.round_ended and fight.round_ended >= 3 and winner.hype >= 30:
-        add_tag(winner, "war_survivor")
+        _append_tag(w_tags, "war_survivor")
 
     # ── Confidence shifts ────────────────────────────────────────────────────
 
@@ -648,19 +789,23 @@ def apply_fight_tags(winner: Fighter, loser: Fighter, fight: Fight, session: Ses
         loser.confidence  = max(0.0,   getattr(loser, "confidence", 70.0)  - 5.0)
 
     # Confidence-based narrative tags
-    w_streak = _win_streak(winner.id, session)
-    if w_streak >= 3 and getattr(winner, "confidence", 70.0) >= 85:
-        add_tag(winner, "sky_high_confidence")
+    if ws >= 3 and getattr(winner, "confidence", 70.0) >= 85:
+        _append_tag(w_tags, "sky_high_confidence")
     else:
-        remove_tag(winner, "sky_high_confidence")
+        _discard_tag(w_tags, "sky_high_confidence")
 
     if method_str == "KO/TKO" and getattr(loser, "confidence", 70.0) <= 40:
-        add_tag(loser, "shell_shocked")
+        _append_tag(l_tags, "shell_shocked")
     # Remove shell_shocked if confidence recovers
     if getattr(loser, "confidence", 70.0) > 55:
-        remove_tag(loser, "shell_shocked")
+        _discard_tag(l_tags, "shell_shocked")
     if getattr(winner, "confidence", 70.0) > 55:
-        remove_tag(winner, "shell_shocked")
+        _discard_tag(w_tags, "shell_shocked")
+
+    if w_tags != w_before:
+        _set_tags(winner, w_tags)
+    if l_tags != l_before:
+        _set_tags(loser, l_tags)
 
     # ── Hype updates ─────────────────────────────────────────────────────────
 
@@ -673,6 +818,8 @@ def apply_fight_tags(winner: Fighter, loser: Fighter, fight: Fight, session: Ses
     winner.popularity = min(100.0, winner.popularity + (winner.hype - winner.popularity) * 0.1 * pop_mult)
     loser.popularity  = max(0.0,   loser.popularity  + (loser.hype  - loser.popularity)  * 0.1)
 
+    return ctx
+
 
 # ---------------------------------------------------------------------------
 # decay_hype
@@ -680,17 +827,54 @@ def apply_fight_tags(winner: Fighter, loser: Fighter, fight: Fight, session: Ses
 
 def decay_hype(session: Session, rng: random.Random) -> None:
     """Monthly hype decay for all fighters. Fight results will add hype back."""
-    fighters = session.execute(
-        select(Fighter).where(Fighter.is_retired == False)
-    ).scalars().all()
-    for f in fighters:
-        traits = get_traits(f)
-        # media_darling: hype decays at 40% of the normal rate
-        decay_mult = 0.40 if "media_darling" in traits else 1.0
-        decay = rng.uniform(5, 10) * decay_mult
-        f.hype = max(0.0, f.hype - decay)
-        f.popularity = max(0.0, min(100.0, f.popularity + (f.hype - f.popularity) * 0.05))
-    session.flush()
+    rows = session.execute(
+        select(Fighter.id, Fighter.traits).where(Fighter.is_retired == False)
+    ).all()
+    if not rows:
+        return
+
+    # One vectorized draw for the whole roster, seeded from the caller's rng
+    # so a seeded month stays reproducible
+    np_rng = np.random.default_rng(rng.randint(0, 2**63 - 1))
+    base_decays = np_rng.uniform(5, 10, size=len(rows)).tolist()
+    decays = []
+    for (fighter_id, raw_traits), base_decay in zip(rows, base_decays):
+        # media_darling: hype decays at 40% of the normal rate. Traits are
+        # plain identifiers, so the quoted name is matched without parsing.
+        decay_mult = 0.40 if raw_traits and '"media_darling"' in raw_traits else 1.0
+        decays.append({"b_id": fighter_id, "b_decay": base_decay * decay_mult})
+
+    # One executemany UPDATE; popularity drifts toward the already-decayed hype
+    table = Fighter.__table__
+    decayed = table.c.hype - bindparam("b_decay")
+    new_hype = case((decayed > 0.0, decayed), else_=0.0)
+    drifted = table.c.popularity + (new_hype - table.c.popularity) * 0.05
+    session.execute(
+        update(table)
+        .where(table.c.id == bindparam("b_id"))
+        .values(
+            hype=new_hype,
+            popularity=case((drifted < 0.0, 0.0), (drifted > 100.0, 100.0), else_=drifted),
+        ),
+        decays,
+    )
+
+    _refresh_loaded_fighters(session, Fighter.hype, Fighter.popularity)
+
+
+def _refresh_loaded_fighters(session: Session, *columns) -> None:
+    """Copy the given columns back onto fighters the session already holds
+    after a Core UPDATE on the table, without rehydrating whole rows."""
+    loaded = {obj.id: obj for obj in session.identity_map.values() if isinstance(obj, Fighter)}
+    if not loaded:
+        return
+    keys = [col.key for col in columns]
+    for fighter_id, *values in session.execute(
+        select(Fighter.id, *columns).where(Fighter.id.in_(loaded))
+    ):
+        fighter = loaded[fighter_id]
+        for key, value in zip(keys, values):
+            set_committed_value(fighter, key, value)
 
 
 # ---------------------------------------------------------------------------
@@ -803,7 +987,7 @@ def _build_fighter_tone(fighter: Fighter) -> str:
     if conf <= 40:
         return "measured"
 
-    archetype_val = fighter.archetype.value if hasattr(fighter.archetype, "value") else (fighter.archetype or "Journeyman")
+    archetype_val = fighter.archetype_value or "Journeyman"
     base = TONE_PROFILES.get(archetype_val, "measured")
 
     traits = get_traits(fighter)
@@ -811,7 +995,7 @@ def _build_fighter_tone(fighter: Fighter) -> str:
         if trait in TRAIT_TONE_MODS:
             return TRAIT_TONE_MODS[trait]
 
-    nat = fighter.nationality if hasattr(fighter, "nationality") else ""
+    nat = fighter.nationality
     nat_tone = NATIONALITY_TONE.get(nat, "")
     if nat_tone and nat_tone in _PRESS_QUOTES:
         return nat_tone
@@ -874,38 +1058,68 @@ def generate_press_conference(fighter_a: Fighter, fighter_b: Fighter,
 
 def update_goat_scores(session: Session) -> None:
     """Recalculate and cache goat_score for every fighter."""
-    fighters = session.execute(select(Fighter)).scalars().all()
-
-    for f in fighters:
-        score = f.wins * 2.0
+    # Only the columns the score reads; no Fighter instances are built.
+    # Tags are stored as a JSON list of plain identifiers, so the quoted
+    # "champion" occurrences are counted in SQL rather than parsed.
+    tags = func.coalesce(Fighter.narrative_tags, "")
+    champion_count = (
+        func.length(tags) - func.length(func.replace(tags, '"champion"', ""))
+    ) // len('"champion"')
+    rows = session.execute(
+        select(
+            Fighter.id, Fighter.wins, Fighter.losses, Fighter.ko_wins, Fighter.sub_wins,
+            Fighter.age, Fighter.prime_end, champion_count,
+            Fighter.striking, Fighter.grappling, Fighter.wrestling,
+            Fighter.cardio, Fighter.chin, Fighter.speed,
+        )
+    ).all()
+    if not rows:
+        return
+    overall_by_id = {row[0]: Fighter.overall_from(*row[8:]) for row in rows}
+
+    # Summed overall of beaten opponents per winner. SQL groups the wins by
+    # (winner, opponent); overall is computed in Python (its round() is not
+    # SQLite's), so the per-pair counts are weighted here
+    beaten_id = case(
+        (Fight.winner_id == Fight.fighter_a_id, Fight.fighter_b_id),
+        (Fight.winner_id == Fight.fighter_b_id, Fight.fighter_a_id),
+    )
+    beaten_overall: dict[int, int] = {}
+    for winner_id, opp_id, wins in session.execute(
+        select(Fight.winner_id, beaten_id, func.count())
+        .where(Fight.winner_id.isnot(None))
+        .group_by(Fight.winner_id, beaten_id)
+    ):
+        opp_overall = overall_by_id.get(opp_id)
+        if opp_overall is not None:
+            beaten_overall[winner_id] = beaten_overall.get(winner_id, 0) + opp_overall * wins
+
+    scores = []
+    for fighter_id, wins, losses, ko_wins, sub_wins, age, prime_end, champions, *_ in rows:
+        score = wins * 2.0
 
         # Quality bonus — opponent overall for each win
-        wins_a = session.execute(
-            select(Fight, Fighter)
-            .join(Fighter, Fight.fighter_b_id == Fighter.id)
-            .where(Fight.fighter_a_id == f.id, Fight.winner_id == f.id)
-        ).all()
-        wins_b = session.execute(
-            select(Fight, Fighter)
-            .join(Fighter, Fight.fighter_a_id == Fighter.id)
-            .where(Fight.fighter_b_id == f.id, Fight.winner_id == f.id)
-        ).all()
-        for _, opp in wins_a + wins_b:
-            score += (opp.overall / 100) * 3
-
-        score += (f.ko_wins + f.sub_wins) * 1.5
-
-        tags = get_tags(f)
-        score += tags.count("champion") * 5
-
-        if f.age > f.prime_end and f.wins > 15:
+        score += beaten_overall.get(fighter_id, 0) * 0.03
+
+        score += (ko_wins + sub_wins) * 1.5
+
+        score += champions * 5
+
+        if age > prime_end and wins > 15:
             score += 10.0
 
-        score -= f.losses * 0.5
+        score -= losses * 0.5
 
-        f.goat_score = max(0.0, round(score, 2))
+        scores.append({"b_id": fighter_id, "b_score": max(0.0, round(score, 2))})
 
-    session.flush()
+    table = Fighter.__table__
+    session.execute(
+        update(table)
+        .where(table.c.id == bindparam("b_id"))
+        .values(goat_score=bindparam("b_score")),
+        scores,
+    )
+    _refresh_loaded_fighters(session, Fighter.goat_score)
 
 
 # ---------------------------------------------------------------------------
@@ -913,23 +1127,34 @@ def update_goat_scores(session: Session) -> None:
 # ---------------------------------------------------------------------------
 
 def update_rivalries(session: Session) -> list[dict]:
-    """Set rivalry_with for fighter pairs who have fought 2+ times."""
-    fights = session.execute(
-        select(Fight).where(Fight.winner_id.isnot(None))
-    ).scalars().all()
+    """Set rivalry_with for fighter pairs who have fought 2+ times.
+
+    Changes stay pending in the session for the caller's commit.
+    """
+    low_id = case((Fight.fighter_a_id < Fight.fighter_b_id, Fight.fighter_a_id), else_=Fight.fighter_b_id)
+    high_id = case((Fight.fighter_a_id < Fight.fighter_b_id, Fight.fighter_b_id), else_=Fight.fighter_a_id)
+    # Pairs in order of their first meeting, so later pairs win rivalry_with
+    # for fighters with more than one rival
+    pair_counts = session.execute(
+        select(low_id, high_id, func.count())
+        .where(Fight.winner_id.isnot(None))
+        .group_by(low_id, high_id)
+        .having(func.count() >= 2)
+        .order_by(func.min(Fight.id))
+    ).all()
 
-    pair_counts: dict[tuple[int, int], int] = {}
-    for fight in fights:
-        pair = (min(fight.fighter_a_id, fight.fighter_b_id),
-                max(fight.fighter_a_id, fight.fighter_b_id))
-        pair_counts[pair] = pair_counts.get(pair, 0) + 1
+    pair_ids = {fid for id_a, id_b, _ in pair_counts for fid in (id_a, id_b)}
+    fighters_by_id = {
+        f.id: f
+        for f in session.execute(
+            select(Fighter).where(Fighter.id.in_(pair_ids))
+        ).scalars()
+    } if pair_ids else {}
 
     rivalries = []
-    for (id_a, id_b), count in pair_counts.items():
-        if count < 2:
-            continue
-        fa = session.get(Fighter, id_a)
-        fb = session.get(Fighter, id_b)
+    for id_a, id_b, count in pair_counts:
+        fa = fighters_by_id.get(id_a)
+        fb = fighters_by_id.get(id_b)
         if not fa or not fb:
             continue
         fa.rivalry_with = id_b
@@ -943,7 +1168,6 @@ def update_rivalries(session: Session) -> list[dict]:
             "fight_count": count,
         })
 
-    session.flush()
     return rivalries
 
 
@@ -965,8 +1189,15 @@ def display_archetype(fighter: Fighter) -> str:
     """
     if fighter.age > fighter.prime_end + 4:
         return "Veteran"
-    ctx = _get_career_context(fighter)
-    return ctx["displayed_archetype"]
+    # Only the archetype rules matter here; roster listings call this for
+    # every fighter, so skip the stage, trajectory and tag work
+    return _displayed_archetype(
+        fighter.archetype_value or "Journeyman",
+        fighter.age,
+        fighter.wins,
+        fighter.losses,
+        fighter.age > fighter.prime_end,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -1022,29 +1253,35 @@ _TRAIT_BIO_LINES: dict[str, list[str]] = {
         "He delivers, and he knows it. The cameras follow for a reason — what happens when he enters the cage tends to be worth watching.",
     ],
 }
+_TRAIT_BIO_PARTS: dict[str, list[_LineParts]] = {
+    trait: [_compile_line(line) for line in lines] for trait, lines in _TRAIT_BIO_LINES.items()
+}
 
 # Trait priority for bio selection (most narratively interesting first)
-_TRAIT_BIO_PRIORITY = [
+_TRAIT_BIO_PRIORITY = (
     "iron_chin", "comeback_king", "knockout_artist", "gas_tank",
     "fast_hands", "ground_and_pound_specialist", "pressure_fighter",
     "slow_starter", "veteran_iq", "journeyman_heart", "submission_magnet", "media_darling",
-]
+)
+_TRAIT_BIO_RANK = {t: i for i, t in enumerate(_TRAIT_BIO_PRIORITY)}
 
 
-def _build_bio_from_traits(fighter: Fighter, division: str) -> str:
+def _build_bio_from_traits(fighter: Fighter, division: str, rng: random.Random) -> str:
     """Return 0-2 trait description sentences, picking the most narratively interesting traits."""
     traits = get_traits(fighter)
     if not traits:
         return ""
 
     # Pick up to 2 traits in priority order
-    selected = [t for t in _TRAIT_BIO_PRIORITY if t in traits][:2]
+    selected = heapq.nsmallest(
+        2, _TRAIT_BIO_RANK.keys() & traits, key=_TRAIT_BIO_RANK.__getitem__
+    )
+    fields = {"name": fighter.name, "division": division}
     sentences = []
     for trait in selected:
-        lines = _TRAIT_BIO_LINES.get(trait, [])
+        lines = _TRAIT_BIO_PARTS.get(trait)
         if lines:
-            line = random.choice(lines)
-            sentences.append(line.format(name=fighter.name, division=division))
+            sentences.append(_render_line(rng.choice(lines), fields))
 
     return " ".join(sentences)
 
@@ -1053,25 +1290,59 @@ def _build_bio_from_traits(fighter: Fighter, division: str) -> str:
 # Career context calculator
 # ---------------------------------------------------------------------------
 
+# Most narratively important first; the rank map lets a bio pick its key tag
+# in one pass over the fighter's own tags
+_SIGNIFICANT_TAG_PRIORITY = (
+    "goat_watch", "champion", "legendary_rivalry", "giant_killer",
+    "ageless_wonder", "redemption", "comeback_king_tag", "unstoppable",
+    "chin_concerns", "fading", "at_the_crossroads",
+)
+_SIGNIFICANT_TAG_RANK = {t: i for i, t in enumerate(_SIGNIFICANT_TAG_PRIORITY)}
+
+
+# Lower-cased division names as used in narrative text, built once per member
+_DIVISION_NAMES: dict[WeightClass, str] = {wc: wc.value.lower() for wc in WeightClass}
+
+
+def _division_name(fighter: Fighter) -> str:
+    division = _DIVISION_NAMES.get(fighter.weight_class)
+    return division if division is not None else fighter.weight_class_value.lower()
+
+
+def _displayed_archetype(archetype: str, age: int, wins: int, losses: int, past_prime: bool) -> str:
+    """Archetype display — override if age has passed the archetype's window."""
+    if archetype == "Phenom" and past_prime:
+        return "Former Phenom"
+    if archetype == "Shooting Star" and past_prime:
+        return "Fading Star"
+    if archetype == "Gatekeeper" and age < 27:
+        return "Developing"
+    if archetype == "Journeyman" and wins > losses and age < 28:
+        return "Developing"
+    return archetype
+
+
 def _get_career_context(fighter) -> dict:
     """Calculate career stage, trajectory, archetype display, and key narrative tag."""
-    career_fights = fighter.wins + fighter.losses + fighter.draws
+    # Bound once; every stage/trajectory/archetype rule below reads them
+    age, wins, losses = fighter.age, fighter.wins, fighter.losses
+    past_prime = age > fighter.prime_end
+    career_fights = wins + losses + fighter.draws
 
     # Career stage based on age AND fight count
-    if career_fights < 6 or fighter.age < 22:
+    if career_fights < 6 or age < 22:
         career_stage = "prospect"
-    elif career_fights < 15 or fighter.age < 26:
+    elif career_fights < 15 or age < 26:
         career_stage = "developing"
-    elif career_fights < 25 or fighter.age < 30:
+    elif career_fights < 25 or age < 30:
         career_stage = "established"
-    elif fighter.age < 35:
+    elif age < 35:
         career_stage = "veteran"
     else:
         career_stage = "elder"
 
     # Career trajectory based on record and age vs prime
-    past_prime = fighter.age > fighter.prime_end
-    win_rate = fighter.wins / career_fights if career_fights > 0 else 0.5
+    win_rate = wins / career_fights if career_fights > 0 else 0.5
 
     if career_fights < 6:
         trajectory = "rising"
@@ -1086,30 +1357,17 @@ def _get_career_context(fighter) -> dict:
     else:
         trajectory = "struggling"
 
-    # Archetype display — override if age has passed the archetype's window
-    archetype_val = (
-        fighter.archetype.value
-        if hasattr(fighter.archetype, "value")
-        else (fighter.archetype or "Journeyman")
+    archetype_val = fighter.archetype_value or "Journeyman"
+    displayed_archetype = _displayed_archetype(archetype_val, age, wins, losses, past_prime)
+
+    # Significant tags — most narratively important ones take priority.
+    # Kept as a set in ctx so every later membership check is a hash probe.
+    tags = frozenset(get_tags(fighter))
+    significant_tag = min(
+        tags & _SIGNIFICANT_TAG_RANK.keys(),
+        key=_SIGNIFICANT_TAG_RANK.__getitem__,
+        default=None,
     )
-    displayed_archetype = archetype_val
-    if archetype_val == "Phenom" and fighter.age > fighter.prime_end:
-        displayed_archetype = "Former Phenom"
-    if archetype_val == "Shooting Star" and fighter.age > fighter.prime_end:
-        displayed_archetype = "Fading Star"
-    if archetype_val == "Gatekeeper" and fighter.age < 27:
-        displayed_archetype = "Developing"
-    if archetype_val == "Journeyman" and fighter.wins > fighter.losses and fighter.age < 28:
-        displayed_archetype = "Developing"
-
-    # Significant tags — most narratively important ones take priority
-    priority_tags = [
-        "goat_watch", "champion", "legendary_rivalry", "giant_killer",
-        "ageless_wonder", "redemption", "comeback_king_tag", "unstoppable",
-        "chin_concerns", "fading", "at_the_crossroads",
-    ]
-    tags = get_tags(fighter) if hasattr(fighter, "narrative_tags") else []
-    significant_tag = next((t for t in priority_tags if t in tags), None)
 
     # Win streak from tags
     streak = 0
@@ -1140,249 +1398,371 @@ def _plural(count, singular, plural):
     """Return count with correct singular/plural form."""
     return f"{count} {singular if count == 1 else plural}"
 
-
 # ---------------------------------------------------------------------------
 # Context-gated bio templates
 # ---------------------------------------------------------------------------
-# Each category is a tuple of (category_name, condition_fn, templates).
-# The first matching category wins. Templates use {name}, {age}, {division},
-# {record}, {wins}, {losses}, {career_fights}, {streak}, {ko_wins},
-# {wins_word}, {losses_word}.
+# Templates use {name}, {age}, {division}, {record}, {wins}, {losses},
+# {career_fights}, {streak}, {ko_wins}, {wins_word}, {losses_word}.
 # RULE: never include archetype names in template text.
 
-def _select_templates(fighter, ctx: dict) -> list[str]:
-    """Return the best-matching template list based on career context."""
+# ── Prospect (career_fights < 6) — all archetypes get prospect language
+_BIO_PROSPECT_TEMPLATES: tuple[str, ...] = (
+    "The early signs are encouraging. {name} is {age} years old and {record} as a professional — too soon to draw conclusions, but the foundation looks solid.",
+    "{name} is finding his footing in {division}. {career_fights_word} in, there's potential here that hasn't fully shown itself yet.",
+    "Every fighter starts somewhere. At {age}, {name} is still writing the opening chapter of his story in {division}.",
+)
+
+# ── Chin concerns tag (any archetype)
+_BIO_CHIN_CONCERNS_TEMPLATES: tuple[str, ...] = (
+    "The chin questions started after the second stoppage. {name}'s {record} record still has value — but opponents are targeting the same spot, and it's working.",
+    "Durability has become the headline for {name} in {division}. The {record} record tells part of the story. The stoppages tell the rest.",
+    "At {age}, {name} has the skills to compete with anyone in {division}. Whether the chin will let him is the question that keeps getting louder.",
+)
+
+# ── At the crossroads tag (any archetype)
+_BIO_CROSSROADS_TEMPLATES: tuple[str, ...] = (
+    "Three fights. Three losses. At {age} and {record}, {name} is at the point every fighter dreads — where the next loss might be the last one that matters.",
+    "{name} has been here before — competitive fights, close decisions, brutal finishes. The {record} record is what it is. What happens next defines the career.",
+    "Every career has a crossroads. {name}'s is here — {record} in {division}, with the next fight carrying more weight than any that came before it.",
+)
+
+# ── GOAT Candidate with goat_watch tag
+_BIO_GOAT_WATCH_TEMPLATES: tuple[str, ...] = (
+    "The debate has started. {name}'s combination of finishing ability, opposition quality, and consistency is drawing comparisons to the all-time greats in {division}. At {age}, he may not be done building the case.",
+    "Nobody wanted to say it first. Then everyone said it at once. {name} is in the conversation — the real one, about where he ranks when it's all over.",
+    "The numbers forced the discussion. {name}'s {record} record in {division}, the quality of names on it, and the way the {wins_word} came — it all adds up to something the sport can't ignore.",
+)
+
+# ── GOAT Candidate — established (wins 10-19)
+_BIO_GOAT_ESTABLISHED_TEMPLATES: tuple[str, ...] = (
+    "The conversation is starting whether people want to have it or not. {name}'s {record} record, the names on it, and the way the {wins_word} have come are forcing comparisons nobody expected this soon.",
+    "{name} doesn't talk about legacy. The {wins_word} do it for him — {ko_wins} finishes, top opposition, zero controversial decisions in the wins column.",
+    "At {age} with a {record} record, {name} has moved past the point where {division} can ignore him. The question isn't whether he belongs — it's how high.",
+)
+
+# ── GOAT Candidate — early (wins < 10)
+_BIO_GOAT_EARLY_TEMPLATES: tuple[str, ...] = (
+    "{name} has the tools. At {age} and {record}, it's too early for the bigger conversation — but the foundation is being laid correctly.",
+    "The potential is obvious. {name}'s {record} record is built on quality opposition and clean finishes. The next few years will determine how seriously to take the ceiling.",
+    "Still early days for {name} in {division}. The {record} record is promising, but the sample size needs to grow before the real comparisons start.",
+)
+
+# ── GOAT Candidate — 20+ wins
+_BIO_GOAT_ACCOMPLISHED_TEMPLATES: tuple[str, ...] = (
+    "The case is built. {name}'s {record} record in {division} speaks for itself — {wins_word}, elite opposition, and a finish rate that leaves no room for debate.",
+    "At {age}, {name} has done everything that can be asked of a {division} fighter. The {record} record is the evidence. The legacy conversation is already underway.",
+    "{name} in {division} is no longer a question mark. The {wins_word} against top competition have settled that. What remains is the conversation about where he fits historically.",
+)
+
+# ── Developing Phenom (age 22-26, fights 6-15, trajectory rising)
+_BIO_PHENOM_DEVELOPING_TEMPLATES: tuple[str, ...] = (
+    "{name} arrived in {division} without much noise. The {wins_word} since have started making some. At {age}, the ceiling is still unclear — but it's high.",
+    "The {division} division started paying attention to {name} around win number {wins}. At {age} with a {record} record, the attention is justified.",
+    "Some fighters take time to develop. {name} isn't one of them. {wins_word} at {age}, and the performances are getting better each time out.",
+)
+
+# ── Peak Phenom (age 23-29, trajectory rising, win_rate > 0.7)
+_BIO_PHENOM_PEAK_TEMPLATES: tuple[str, ...] = (
+    "If {name} isn't the best {division} fighter in the world right now, he's close. The {record} record doesn't fully capture how dominant some of these performances have been.",
+    "There's a version of {name} that hasn't shown up yet — and the current version is already beating everyone in front of him. That's a problem for the {division} division.",
+    "At {age} and {record}, {name} is operating at a level that the rest of {division} hasn't been able to match. The gap is real and it's growing.",
+)
+
+# ── Former Phenom (age 30+, was Phenom archetype)
+_BIO_PHENOM_FORMER_TEMPLATES: tuple[str, ...] = (
+    "There was a time when {name} was the most talked-about fighter in {division}. At {age} and {record}, the hype has quieted — but the results haven't completely abandoned him.",
+    "The prospect label faded years ago. What {name} is building now is something more durable — a career record that holds up on its own without the hype.",
+    "At {age}, {name} is no longer the future of {division}. Whether he's still the present is the question he's answering one fight at a time.",
+)
+
+# ── Phenom (young, doesn't match developing or peak — fallback)
+_BIO_PHENOM_TEMPLATES: tuple[str, ...] = (
+    "At {age}, {name} has already developed the kind of technical package that most {division} fighters spend years building. The results are following the tools.",
+    "Youth and skill are a dangerous combination in {division}. {name}, at {age}, has both — and the composure to not waste either.",
+    "The trajectory is obvious if you've watched {name} fight. The only question left for the {division} weight class is: how far does it go?",
+)
+
+# ── Gatekeeper with ageless_wonder tag
+_BIO_GATEKEEPER_AGELESS_TEMPLATES: tuple[str, ...] = (
+    "At {age}, {name} should be winding down. Instead he's making the {division} division uncomfortable. Some fighters don't read the script.",
+    "At {age}, {name} has outlasted most of the {division} fighters he came up with. There's something to be said for durability — and for fighters who refuse to accept what they're supposed to do next.",
+    "The {division} division has changed around {name}, but he's still here. At {age}, he remains exactly what he's always been: a problem that needs solving.",
+)
+
+# ── Gatekeeper (age 28+, established/veteran stage)
+_BIO_GATEKEEPER_VETERAN_TEMPLATES: tuple[str, ...] = (
+    "The {division} division needs fighters like {name}. His {record} record is a wall that contenders run into on their way up, and not all of them make it through.",
+    "{name} has been in the {division} trenches long enough to have a PhD in the division. At {age} and {record}, he's still here. That's the credential.",
+    "Every division needs a {name}. Someone who's seen everything, beaten half the ranked fighters at some point, and still shows up. He's that fighter in {division}.",
+)
+
+# ── Gatekeeper fallback
+_BIO_GATEKEEPER_TEMPLATES: tuple[str, ...] = (
+    "Some fighters test champions on the way up. {name} has been that test in {division} more than once — and made them work for every second of it.",
+    "The {record} record understates what {name} brings into a {division} cage. He's been in there with the best in the world. That experience isn't nothing.",
+    "The {division} division is full of hungry contenders. {name} is the fighter who tells you which ones are real — a walking litmus test at the top of the division.",
+)
+
+# ── Journeyman with giant_killer tag
+_BIO_JOURNEYMAN_GIANT_KILLER_TEMPLATES: tuple[str, ...] = (
+    "Nobody put {name} on a poster. Nobody picked him to win. That makes the upset even louder. The {division} division's top fighters have been warned.",
+    "The {record} record doesn't prepare you for what {name} did to {division}'s top competition. Upsets aren't supposed to happen that cleanly.",
+    "Don't let the {losses_word} fool you. {name} is capable of beating anyone in {division} on a given night — and has done exactly that when the moment arrived.",
+)
+
+# ── Journeyman (age 28+, OR losses > wins)
+_BIO_JOURNEYMAN_GRINDER_TEMPLATES: tuple[str, ...] = (
+    "{name} has never been anyone's pick to win. The {record} record reflects a career spent competing at a level most fighters never reach, against opponents who were supposed to be too good.",
+    "The {division} division is full of {name}'s {wins_word}. It's also full of his {losses_word}. At {age} and {career_fights_word} in, he's still competing — which is its own kind of statement.",
+    "Comfortable in the role of underdog, {name} has made a career of being underestimated. The {record} record has more footnotes than headlines, but the footnotes are interesting.",
+)
+
+# ── Journeyman fallback
+_BIO_JOURNEYMAN_TEMPLATES: tuple[str, ...] = (
+    "Not every fight career is a title chase. {name}'s {record} record in {division} is an honest account of a fighter who showed up and competed against serious opposition.",
+    "Some fighters exist to test the contenders. {name} has served that role in {division} and done it with more ability than the record suggests.",
+    "Nobody put {name} on a poster. He kept fighting anyway. The {division} division is better for it.",
+)
+
+# ── Late Bloomer (in prime, age 29-33)
+_BIO_LATE_BLOOMER_PRIME_TEMPLATES: tuple[str, ...] = (
+    "{name} spent his twenties being overlooked. At {age}, he's running out of patience for that. The recent fights suggest the division was wrong about him.",
+    "Late development doesn't announce itself. {name}'s {record} record in {division} has been building slowly, and then quickly. At {age} he's arrived — just not where anyone expected.",
+    "The {division} weight class didn't see {name} coming. At {age} and {record}, the conversation has shifted from whether he belongs to how far he can go.",
+)
+
+# ── Late Bloomer (before prime, age < 29)
+_BIO_LATE_BLOOMER_EARLY_TEMPLATES: tuple[str, ...] = (
+    "{name} isn't there yet — and at {age} with a {record} record, that's fine. The attributes are developing on a slower curve. The fighters who peak late often peak highest.",
+    "Quiet fighter. {record} record. {age} years old. The {division} division hasn't noticed {name} yet. That window is closing.",
+    "Development is non-linear. {name}'s {division} career has taken the long route — and is arriving exactly where it was always going, just on a different timeline.",
+)
+
+# ── Late Bloomer fallback (past 33)
+_BIO_LATE_BLOOMER_TEMPLATES: tuple[str, ...] = (
+    "The best fighters sometimes need time. {name} has spent a career in {division} building something. The {record} record is starting to show what it is.",
+    "At {age}, {name} is in the middle of the career that scouts thought was years away. The {division} weight class is adjusting its expectations accordingly.",
+    "Second acts are underrated. {name} in {division} is on one — and the current version of this fighter is more dangerous than the early record suggested.",
+)
+
+# ── Shooting Star (before prime_end)
+_BIO_SHOOTING_STAR_RISING_TEMPLATES: tuple[str, ...] = (
+    "Everything about {name}'s game is built for highlight reels. The {record} record at {age} is the start of something — the question is how long the rocket burns.",
+    "{name} at {age} is the most exciting fighter in {division} on his best nights. The challenge is making best nights the standard.",
+    "Brilliant, athletic, and capable of finishing anyone in {division} on a given night. The ceiling is visible. The consistency question will define the career.",
+)
+
+# ── Shooting Star (past prime_end, fading)
+_BIO_SHOOTING_STAR_FADING_TEMPLATES: tuple[str, ...] = (
+    "High peak, steep decline — that's the {name} story so far. At {age}, the tools are still there. The consistency that turns tools into titles has been harder to find.",
+    "The burst that announced {name} in {division} may not be sustainable — recent results have raised questions about whether the peak was the starting line or the finish line.",
+    "Every fighter runs at a different pace. {name} ran fast and made {division} pay attention. Whether there's fuel for another run is genuinely unclear.",
+)
+
+# ── Resilient veteran (past prime, winning record, age 33+)
+_BIO_RESILIENT_VETERAN_TEMPLATES: tuple[str, ...] = (
+    "At {age}, {name} has outlasted the fighters who were supposed to replace him. The {record} record at this stage of a career is either stubbornness or greatness — possibly both.",
+    "{name} is still winning fights in {division} at {age}. The division keeps sending new challengers. He keeps sending them back.",
+    "Most fighters slow down by {age}. {name} in {division} hasn't received that message. The {record} record at this point speaks louder than any scouting report.",
+)
+
+# ── Safe generic fallback
+_BIO_GENERIC_TEMPLATES: tuple[str, ...] = (
+    "{name} is a {division} fighter with a {record} record at {age} years old.",
+    "At {age}, {name} competes in the {division} division with a professional record of {record}.",
+    "{name} carries a {record} record into every {division} fight. At {age}, the story is still being written.",
+)
+
+
+# Archetype -> ordered (category_name, condition_fn, templates) rules; the
+# first matching category wins. Conditions take (fighter, ctx).
+_ARCHETYPE_TEMPLATE_RULES: dict[str, tuple[tuple[str, Callable[[Fighter, dict], bool], tuple[str, ...]], ...]] = {
+    "GOAT Candidate": (
+        ("goat_watch", lambda f, c: c["significant_tag"] == "goat_watch", _BIO_GOAT_WATCH_TEMPLATES),
+        ("established", lambda f, c: 10 <= f.wins <= 19, _BIO_GOAT_ESTABLISHED_TEMPLATES),
+        ("early", lambda f, c: f.wins < 10, _BIO_GOAT_EARLY_TEMPLATES),
+        ("accomplished", lambda f, c: f.wins >= 20, _BIO_GOAT_ACCOMPLISHED_TEMPLATES),
+    ),
+    "Phenom": (
+        ("developing", lambda f, c: 22 <= f.age <= 26 and c["career_stage"] == "developing" and c["trajectory"] == "rising", _BIO_PHENOM_DEVELOPING_TEMPLATES),
+        ("peak", lambda f, c: 23 <= f.age <= 29 and c["trajectory"] == "rising" and c["win_rate"] > 0.7, _BIO_PHENOM_PEAK_TEMPLATES),
+        ("former", lambda f, c: f.age >= 30, _BIO_PHENOM_FORMER_TEMPLATES),
+    ),
+    "Gatekeeper": (
+        ("ageless_wonder", lambda f, c: c["significant_tag"] == "ageless_wonder", _BIO_GATEKEEPER_AGELESS_TEMPLATES),
+        ("veteran", lambda f, c: f.age >= 28 and c["career_stage"] in ("established", "veteran", "elder"), _BIO_GATEKEEPER_VETERAN_TEMPLATES),
+    ),
+    "Journeyman": (
+        ("giant_killer", lambda f, c: c["significant_tag"] == "giant_killer", _BIO_JOURNEYMAN_GIANT_KILLER_TEMPLATES),
+        ("grinder", lambda f, c: f.age >= 28 or f.losses > f.wins, _BIO_JOURNEYMAN_GRINDER_TEMPLATES),
+    ),
+    "Late Bloomer": (
+        ("prime", lambda f, c: 29 <= f.age <= 33, _BIO_LATE_BLOOMER_PRIME_TEMPLATES),
+        ("early", lambda f, c: f.age < 29, _BIO_LATE_BLOOMER_EARLY_TEMPLATES),
+    ),
+    "Shooting Star": (
+        ("rising", lambda f, c: not c["past_prime"], _BIO_SHOOTING_STAR_RISING_TEMPLATES),
+        ("fading", lambda f, c: c["past_prime"], _BIO_SHOOTING_STAR_FADING_TEMPLATES),
+    ),
+}
+
+# What an archetype gets when none of its rules match
+_BIO_ARCHETYPE_FALLBACK: dict[str, tuple[str, ...]] = {
+    "Phenom": _BIO_PHENOM_TEMPLATES,
+    "Gatekeeper": _BIO_GATEKEEPER_TEMPLATES,
+    "Journeyman": _BIO_JOURNEYMAN_TEMPLATES,
+    "Late Bloomer": _BIO_LATE_BLOOMER_TEMPLATES,
+}
+
+# Tag overrides checked for every archetype, after the prospect check
+_BIO_TAG_TEMPLATES: dict[str, tuple[str, ...]] = {
+    "chin_concerns": _BIO_CHIN_CONCERNS_TEMPLATES,
+    "at_the_crossroads": _BIO_CROSSROADS_TEMPLATES,
+}
+
+
+def _select_templates(fighter, ctx: dict) -> tuple[str, ...]:
+    """Return the best-matching templates based on career context."""
+    if ctx["career_stage"] == "prospect":
+        return _BIO_PROSPECT_TEMPLATES
+    tag_templates = _BIO_TAG_TEMPLATES.get(ctx["significant_tag"])
+    if tag_templates is not None:
+        return tag_templates
+
+    # One probe picks the archetype's rules instead of testing every branch
     archetype = ctx["archetype"]
-    stage = ctx["career_stage"]
-    traj = ctx["trajectory"]
-    tag = ctx["significant_tag"]
-    tags = ctx["tags"]
-    past_prime = ctx["past_prime"]
-    win_rate = ctx["win_rate"]
-    fights = ctx["career_fights"]
-
-    # ── Prospect (career_fights < 6) — all archetypes get prospect language
-    if stage == "prospect":
-        return [
-            "The early signs are encouraging. {name} is {age} years old and {record} as a professional — too soon to draw conclusions, but the foundation looks solid.",
-            "{name} is finding his footing in {division}. {career_fights_word} in, there's potential here that hasn't fully shown itself yet.",
-            "Every fighter starts somewhere. At {age}, {name} is still writing the opening chapter of his story in {division}.",
-        ]
-
-    # ── Chin concerns tag (any archetype)
-    if tag == "chin_concerns":
-        return [
-            "The chin questions started after the second stoppage. {name}'s {record} record still has value — but opponents are targeting the same spot, and it's working.",
-            "Durability has become the headline for {name} in {division}. The {record} record tells part of the story. The stoppages tell the rest.",
-            "At {age}, {name} has the skills to compete with anyone in {division}. Whether the chin will let him is the question that keeps getting louder.",
-        ]
-
-    # ── At the crossroads tag (any archetype)
-    if tag == "at_the_crossroads":
-        return [
-            "Three fights. Three losses. At {age} and {record}, {name} is at the point every fighter dreads — where the next loss might be the last one that matters.",
-            "{name} has been here before — competitive fights, close decisions, brutal finishes. The {record} record is what it is. What happens next defines the career.",
-            "Every career has a crossroads. {name}'s is here — {record} in {division}, with the next fight carrying more weight than any that came before it.",
-        ]
-
-    # ── GOAT Candidate with goat_watch tag
-    if archetype == "GOAT Candidate" and tag == "goat_watch":
-        return [
-            "The debate has started. {name}'s combination of finishing ability, opposition quality, and consistency is drawing comparisons to the all-time greats in {division}. At {age}, he may not be done building the case.",
-            "Nobody wanted to say it first. Then everyone said it at once. {name} is in the conversation — the real one, about where he ranks when it's all over.",
-            "The numbers forced the discussion. {name}'s {record} record in {division}, the quality of names on it, and the way the {wins_word} came — it all adds up to something the sport can't ignore.",
-        ]
-
-    # ── GOAT Candidate — established (wins 10-19)
-    if archetype == "GOAT Candidate" and 10 <= fighter.wins <= 19:
-        return [
-            "The conversation is starting whether people want to have it or not. {name}'s {record} record, the names on it, and the way the {wins_word} have come are forcing comparisons nobody expected this soon.",
-            "{name} doesn't talk about legacy. The {wins_word} do it for him — {ko_wins} finishes, top opposition, zero controversial decisions in the wins column.",
-            "At {age} with a {record} record, {name} has moved past the point where {division} can ignore him. The question isn't whether he belongs — it's how high.",
-        ]
-
-    # ── GOAT Candidate — early (wins < 10)
-    if archetype == "GOAT Candidate" and fighter.wins < 10:
-        return [
-            "{name} has the tools. At {age} and {record}, it's too early for the bigger conversation — but the foundation is being laid correctly.",
-            "The potential is obvious. {name}'s {record} record is built on quality opposition and clean finishes. The next few years will determine how seriously to take the ceiling.",
-            "Still early days for {name} in {division}. The {record} record is promising, but the sample size needs to grow before the real comparisons start.",
-        ]
-
-    # ── GOAT Candidate — 20+ wins
-    if archetype == "GOAT Candidate" and fighter.wins >= 20:
-        return [
-            "The case is built. {name}'s {record} record in {division} speaks for itself — {wins_word}, elite opposition, and a finish rate that leaves no room for debate.",
-            "At {age}, {name} has done everything that can be asked of a {division} fighter. The {record} record is the evidence. The legacy conversation is already underway.",
-            "{name} in {division} is no longer a question mark. The {wins_word} against top competition have settled that. What remains is the conversation about where he fits historically.",
-        ]
-
-    # ── Developing Phenom (age 22-26, fights 6-15, trajectory rising)
-    if archetype == "Phenom" and 22 <= fighter.age <= 26 and stage == "developing" and traj == "rising":
-        return [
-            "{name} arrived in {division} without much noise. The {wins_word} since have started making some. At {age}, the ceiling is still unclear — but it's high.",
-            "The {division} division started paying attention to {name} around win number {wins}. At {age} with a {record} record, the attention is justified.",
-            "Some fighters take time to develop. {name} isn't one of them. {wins_word} at {age}, and the performances are getting better each time out.",
-        ]
-
-    # ── Peak Phenom (age 23-29, trajectory rising, win_rate > 0.7)
-    if archetype == "Phenom" and 23 <= fighter.age <= 29 and traj == "rising" and win_rate > 0.7:
-        return [
-            "If {name} isn't the best {division} fighter in the world right now, he's close. The {record} record doesn't fully capture how dominant some of these performances have been.",
-            "There's a version of {name} that hasn't shown up yet — and the current version is already beating everyone in front of him. That's a problem for the {division} division.",
-            "At {age} and {record}, {name} is operating at a level that the rest of {division} hasn't been able to match. The gap is real and it's growing.",
-        ]
-
-    # ── Former Phenom (age 30+, was Phenom archetype)
-    if archetype == "Phenom" and fighter.age >= 30:
-        return [
-            "There was a time when {name} was the most talked-about fighter in {division}. At {age} and {record}, the hype has quieted — but the results haven't completely abandoned him.",
-            "The prospect label faded years ago. What {name} is building now is something more durable — a career record that holds up on its own without the hype.",
-            "At {age}, {name} is no longer the future of {division}. Whether he's still the present is the question he's answering one fight at a time.",
-        ]
-
-    # ── Phenom (young, doesn't match developing or peak — fallback)
-    if archetype == "Phenom":
-        return [
-            "At {age}, {name} has already developed the kind of technical package that most {division} fighters spend years building. The results are following the tools.",
-            "Youth and skill are a dangerous combination in {division}. {name}, at {age}, has both — and the composure to not waste either.",
-            "The trajectory is obvious if you've watched {name} fight. The only question left for the {division} weight class is: how far does it go?",
-        ]
-
-    # ── Gatekeeper with ageless_wonder tag
-    if archetype == "Gatekeeper" and tag == "ageless_wonder":
-        return [
-            "At {age}, {name} should be winding down. Instead he's making the {division} division uncomfortable. Some fighters don't read the script.",
-            "At {age}, {name} has outlasted most of the {division} fighters he came up with. There's something to be said for durability — and for fighters who refuse to accept what they're supposed to do next.",
-            "The {division} division has changed around {name}, but he's still here. At {age}, he remains exactly what he's always been: a problem that needs solving.",
-        ]
-
-    # ── Gatekeeper (age 28+, established/veteran stage)
-    if archetype == "Gatekeeper" and fighter.age >= 28 and stage in ("established", "veteran", "elder"):
-        return [
-            "The {division} division needs fighters like {name}. His {record} record is a wall that contenders run into on their way up, and not all of them make it through.",
-            "{name} has been in the {division} trenches long enough to have a PhD in the division. At {age} and {record}, he's still here. That's the credential.",
-            "Every division needs a {name}. Someone who's seen everything, beaten half the ranked fighters at some point, and still shows up. He's that fighter in {division}.",
-        ]
-
-    # ── Gatekeeper fallback
-    if archetype == "Gatekeeper":
-        return [
-            "Some fighters test champions on the way up. {name} has been that test in {division} more than once — and made them work for every second of it.",
-            "The {record} record understates what {name} brings into a {division} cage. He's been in there with the best in the world. That experience isn't nothing.",
-            "The {division} division is full of hungry contenders. {name} is the fighter who tells you which ones are real — a walking litmus test at the top of the division.",
-        ]
-
-    # ── Journeyman with giant_killer tag
-    if archetype == "Journeyman" and tag == "giant_killer":
-        return [
-            "Nobody put {name} on a poster. Nobody picked him to win. That makes the upset even louder. The {division} division's top fighters have been warned.",
-            "The {record} record doesn't prepare you for what {name} did to {division}'s top competition. Upsets aren't supposed to happen that cleanly.",
-            "Don't let the {losses_word} fool you. {name} is capable of beating anyone in {division} on a given night — and has done exactly that when the moment arrived.",
-        ]
-
-    # ── Journeyman (age 28+, OR losses > wins)
-    if archetype == "Journeyman" and (fighter.age >= 28 or fighter.losses > fighter.wins):
-        return [
-            "{name} has never been anyone's pick to win. The {record} record reflects a career spent competing at a level most fighters never reach, against opponents who were supposed to be too good.",
-            "The {division} division is full of {name}'s {wins_word}. It's also full of his {losses_word}. At {age} and {career_fights_word} in, he's still competing — which is its own kind of statement.",
-            "Comfortable in the role of underdog, {name} has made a career of being underestimated. The {record} record has more footnotes than headlines, but the footnotes are interesting.",
-        ]
-
-    # ── Journeyman fallback
-    if archetype == "Journeyman":
-        return [
-            "Not every fight career is a title chase. {name}'s {record} record in {division} is an honest account of a fighter who showed up and competed against serious opposition.",
-            "Some fighters exist to test the contenders. {name} has served that role in {division} and done it with more ability than the record suggests.",
-            "Nobody put {name} on a poster. He kept fighting anyway. The {division} division is better for it.",
-        ]
-
-    # ── Late Bloomer (in prime, age 29-33)
-    if archetype == "Late Bloomer" and 29 <= fighter.age <= 33:
-        return [
-            "{name} spent his twenties being overlooked. At {age}, he's running out of patience for that. The recent fights suggest the division was wrong about him.",
-            "Late development doesn't announce itself. {name}'s {record} record in {division} has been building slowly, and then quickly. At {age} he's arrived — just not where anyone expected.",
-            "The {division} weight class didn't see {name} coming. At {age} and {record}, the conversation has shifted from whether he belongs to how far he can go.",
-        ]
-
-    # ── Late Bloomer (before prime, age < 29)
-    if archetype == "Late Bloomer" and fighter.age < 29:
-        return [
-            "{name} isn't there yet — and at {age} with a {record} record, that's fine. The attributes are developing on a slower curve. The fighters who peak late often peak highest.",
-            "Quiet fighter. {record} record. {age} years old. The {division} division hasn't noticed {name} yet. That window is closing.",
-            "Development is non-linear. {name}'s {division} career has taken the long route — and is arriving exactly where it was always going, just on a different timeline.",
-        ]
-
-    # ── Late Bloomer fallback (past 33)
-    if archetype == "Late Bloomer":
-        return [
-            "The best fighters sometimes need time. {name} has spent a career in {division} building something. The {record} record is starting to show what it is.",
-            "At {age}, {name} is in the middle of the career that scouts thought was years away. The {division} weight class is adjusting its expectations accordingly.",
-            "Second acts are underrated. {name} in {division} is on one — and the current version of this fighter is more dangerous than the early record suggested.",
-        ]
-
-    # ── Shooting Star (before prime_end)
-    if archetype == "Shooting Star" and not past_prime:
-        return [
-            "Everything about {name}'s game is built for highlight reels. The {record} record at {age} is the start of something — the question is how long the rocket burns.",
-            "{name} at {age} is the most exciting fighter in {division} on his best nights. The challenge is making best nights the standard.",
-            "Brilliant, athletic, and capable of finishing anyone in {division} on a given night. The ceiling is visible. The consistency question will define the career.",
-        ]
-
-    # ── Shooting Star (past prime_end, fading)
-    if archetype == "Shooting Star" and past_prime:
-        return [
-            "High peak, steep decline — that's the {name} story so far. At {age}, the tools are still there. The consistency that turns tools into titles has been harder to find.",
-            "The burst that announced {name} in {division} may not be sustainable — recent results have raised questions about whether the peak was the starting line or the finish line.",
-            "Every fighter runs at a different pace. {name} ran fast and made {division} pay attention. Whether there's fuel for another run is genuinely unclear.",
-        ]
-
-    # ── Resilient veteran (past prime, winning record, age 33+)
-    if past_prime and win_rate >= 0.5 and fighter.age >= 33:
-        return [
-            "At {age}, {name} has outlasted the fighters who were supposed to replace him. The {record} record at this stage of a career is either stubbornness or greatness — possibly both.",
-            "{name} is still winning fights in {division} at {age}. The division keeps sending new challengers. He keeps sending them back.",
-            "Most fighters slow down by {age}. {name} in {division} hasn't received that message. The {record} record at this point speaks louder than any scouting report.",
-        ]
-
-    # ── Safe generic fallback
-    return [
-        "{name} is a {division} fighter with a {record} record at {age} years old.",
-        "At {age}, {name} competes in the {division} division with a professional record of {record}.",
-        "{name} carries a {record} record into every {division} fight. At {age}, the story is still being written.",
-    ]
+    for _category, matches, templates in _ARCHETYPE_TEMPLATE_RULES.get(archetype, ()):
+        if matches(fighter, ctx):
+            return templates
+    fallback = _BIO_ARCHETYPE_FALLBACK.get(archetype)
+    if fallback is not None:
+        return fallback
+
+    if ctx["past_prime"] and ctx["win_rate"] >= 0.5 and fighter.age >= 33:
+        return _BIO_RESILIENT_VETERAN_TEMPLATES
+    return _BIO_GENERIC_TEMPLATES
+
+
+# Every bio template, compiled once; keyed by the template string that
+# _select_templates hands back
+_BIO_LINE_PARTS: dict[str, _LineParts] = {
+    template: _compile_line(template)
+    for templates in (
+        _BIO_PROSPECT_TEMPLATES,
+        *_BIO_TAG_TEMPLATES.values(),
+        *(rule[2] for rules in _ARCHETYPE_TEMPLATE_RULES.values() for rule in rules),
+        *_BIO_ARCHETYPE_FALLBACK.values(),
+        _BIO_RESILIENT_VETERAN_TEMPLATES,
+        _BIO_GENERIC_TEMPLATES,
+    )
+    for template in templates
+}
+
+# Placeholder -> getter over (fighter, ctx, division); a bio only evaluates
+# the fields its chosen template actually uses
+_BIO_FIELDS: dict[str, Callable[[Fighter, dict, str], object]] = {
+    "name": lambda f, c, d: f.name,
+    "age": lambda f, c, d: f.age,
+    "division": lambda f, c, d: d,
+    "record": lambda f, c, d: f.record,
+    "wins": lambda f, c, d: f.wins,
+    "losses": lambda f, c, d: f.losses,
+    "ko_wins": lambda f, c, d: f.ko_wins,
+    "career_fights": lambda f, c, d: c["career_fights"],
+    "streak": lambda f, c, d: c["streak"],
+    "wins_word": lambda f, c, d: _plural(f.wins, "win", "wins"),
+    "losses_word": lambda f, c, d: _plural(f.losses, "loss", "losses"),
+    "career_fights_word": lambda f, c, d: _plural(c["career_fights"], "fight", "fights"),
+}
+
+
+def _render_bio_line(parts: _LineParts, fighter: Fighter, ctx: dict, division: str) -> str:
+    return "".join([
+        literal + str(_BIO_FIELDS[field](fighter, ctx, division)) if field else literal
+        for literal, field in parts
+    ])
 
 
 # ---------------------------------------------------------------------------
 # Bio validation
 # ---------------------------------------------------------------------------
 
+# Every red-flag phrase in one alternation, so a bio is scanned once.
+# "decades" is tried first and counts as both elder and veteran language,
+# since the veteran check matches "decade" anywhere.
+_BIO_RED_FLAG_RE = re.compile(
+    r"(?P<decades>decades)"
+    r"|(?P<elder>seen it all|been around)"
+    r"|(?P<veteran>decade|years of competition|long career|veteran)"
+    r"|(?P<established>arrived|proven|established)"
+    r"|(?P<plural>\b1 (?:wins|losses|draws)\b)"
+)
+
+
 def _validate_bio(bio: str, fighter, ctx: dict) -> tuple[bool, list[str]]:
     """Check bio for age/career-inappropriate language. Returns (passed, red_flags)."""
-    import re
-    red_flags = []
+    found = {m.lastgroup for m in _BIO_RED_FLAG_RE.finditer(bio)}
+    if "decades" in found:
+        found.update(("elder", "veteran"))
 
-    if ctx["career_fights"] < 10 and any(w in bio for w in ["decade", "years of competition", "long career", "veteran"]):
+    red_flags = []
+    if ctx["career_fights"] < 10 and "veteran" in found:
         red_flags.append("veteran language for low fight count")
 
-    if fighter.age < 28 and any(w in bio for w in ["decades", "seen it all", "been around"]):
+    if fighter.age < 28 and "elder" in found:
         red_flags.append("elder language for young fighter")
 
-    if ctx["career_stage"] == "prospect" and any(w in bio for w in ["arrived", "proven", "established"]):
+    if ctx["career_stage"] == "prospect" and "established" in found:
         red_flags.append("established language for prospect")
 
     # Check pluralization
-    if re.search(r'\b1 (wins|losses|draws)\b', bio):
+    if "plural" in found:
         red_flags.append("pluralization error")
 
     return len(red_flags) == 0, red_flags
 
 
+def _bio_passes(bio: str, fighter, ctx: dict) -> bool:
+    """Boolean form of _validate_bio for generation: only the categories this
+    fighter's context forbids are looked for, and the scan stops at the first."""
+    forbidden = {"plural"}
+    if ctx["career_fights"] < 10:
+        forbidden.update(("veteran", "decades"))
+    if fighter.age < 28:
+        forbidden.update(("elder", "decades"))
+    if ctx["career_stage"] == "prospect":
+        forbidden.add("established")
+    return not any(m.lastgroup in forbidden for m in _BIO_RED_FLAG_RE.finditer(bio))
+
+
 # ---------------------------------------------------------------------------
 # Main bio generation entry point
 # ---------------------------------------------------------------------------
 
-def generate_fighter_bio(fighter: Fighter) -> str:
+def _bio_suffix(fighter: Fighter, division: str, rng: random.Random, cache: bool) -> str:
+    """Nationality flavor plus trait sentences, each with a leading space.
+
+    With ``cache`` set the result is kept on the instance alongside the
+    inputs it came from, the same way get_tags caches its parse.
+    """
+    key = (fighter.id, division, fighter.nationality, fighter.style_value, fighter.traits, fighter.name)
+    if cache:
+        cached = getattr(fighter, "_bio_suffix_cache", None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+    suffix = "".join(
+        " " + part
+        for part in (_nationality_flavor(fighter, rng), _build_bio_from_traits(fighter, division, rng))
+        if part
+    )
+    if cache:
+        fighter._bio_suffix_cache = (key, suffix)
+    return suffix
+
+
+def generate_fighter_bio(
+    fighter: Fighter, rng: Optional[random.Random] = None, ctx: Optional[dict] = None,
+) -> str:
     """Return a context-appropriate bio paragraph.
 
     Uses career context (age, fight count, trajectory, archetype, tags) to
@@ -1390,51 +1770,33 @@ def generate_fighter_bio(fighter: Fighter) -> str:
     to prevent age/career-inappropriate language.
 
     NEVER references archetype names in output text.
+
+    Without an explicit ``rng`` the template picks are seeded from the
+    fighter id, so a fighter's bio only changes when their career does.
+    ``ctx`` is a _get_career_context result the caller already holds.
     """
-    ctx = _get_career_context(fighter)
+    # The default rng is seeded per fighter, so its nationality and trait
+    # picks are a pure function of the fighter and can be reused
+    cache_suffix = rng is None and fighter.id is not None
+    if rng is None:
+        rng = random.Random(fighter.id)
+    if ctx is None:
+        ctx = _get_career_context(fighter)
 
-    division = (
-        fighter.weight_class.value
-        if hasattr(fighter.weight_class, "value")
-        else str(fighter.weight_class)
-    ).lower()
+    division = _division_name(fighter)
 
     # Select templates based on context
     templates = _select_templates(fighter, ctx)
-    template = random.choice(templates)
-
-    # Build format values with proper pluralization
-    fmt = {
-        "name": fighter.name,
-        "age": fighter.age,
-        "division": division,
-        "record": fighter.record,
-        "wins": fighter.wins,
-        "losses": fighter.losses,
-        "ko_wins": fighter.ko_wins,
-        "career_fights": ctx["career_fights"],
-        "streak": ctx["streak"],
-        "wins_word": _plural(fighter.wins, "win", "wins"),
-        "losses_word": _plural(fighter.losses, "loss", "losses"),
-        "career_fights_word": _plural(ctx["career_fights"], "fight", "fights"),
-    }
+    template = rng.choice(templates)
 
-    bio = template.format(**fmt)
+    bio = _render_bio_line(_BIO_LINE_PARTS[template], fighter, ctx, division)
 
     # Validate — fall back to safe generic if checks fail
-    passed, red_flags = _validate_bio(bio, fighter, ctx)
-    if not passed:
+    if not _bio_passes(bio, fighter, ctx):
         bio = f"{fighter.name} is a {division} fighter with a {fighter.record} record at {fighter.age} years old."
 
-    # Append nationality flavor if applicable
-    nat_flavor = _nationality_flavor(fighter)
-    if nat_flavor:
-        bio = bio + " " + nat_flavor
-
-    # Append trait-based sentences
-    trait_bio = _build_bio_from_traits(fighter, division)
-    if trait_bio:
-        bio = bio + " " + trait_bio
+    # Append nationality flavor and trait-based sentences
+    bio += _bio_suffix(fighter, division, rng, cache_suffix)
 
     # Confidence-based flavor
     conf = getattr(fighter, "confidence", 70.0) or 70.0
@@ -1491,49 +1853,58 @@ HEADLINE_TEMPLATES: dict[str, list[str]] = {
 }
 
 
+# Headline templates compiled once, like the bio lines; picked per fight
+_HEADLINE_PARTS: dict[str, list[_LineParts]] = {
+    kind: [_compile_line(template) for template in templates]
+    for kind, templates in HEADLINE_TEMPLATES.items()
+}
+
+
+def _headline(kind: str, **fields) -> str:
+    return _render_line(random.choice(_HEADLINE_PARTS[kind]), fields)
+
+
 def generate_fight_headline(
-    winner: Fighter, loser: Fighter, fight: Fight, session: Session
+    winner: Fighter, loser: Fighter, fight: Fight, session: Session,
+    ctx: Optional[dict] = None,
 ) -> Optional[str]:
-    """Generate a news headline for a completed fight. Returns None for mundane fights."""
+    """Generate a news headline for a completed fight. Returns None for mundane fights.
+
+    ``ctx`` is apply_fight_tags' return value for the same fight; when given,
+    its streaks are used instead of querying the fight history.
+    """
     method = fight.method.value if hasattr(fight.method, "value") else str(fight.method) if fight.method else ""
-    division = winner.weight_class.value if hasattr(winner.weight_class, "value") else str(winner.weight_class)
+    division = winner.weight_class_value
 
     # 1. Title fight — always generate
     if fight.is_title_fight:
-        template = random.choice(HEADLINE_TEMPLATES["title_fight"])
-        return template.format(winner=winner.name, loser=loser.name, division=division)
+        return _headline("title_fight", winner=winner.name, loser=loser.name, division=division)
 
     # 2. KO/Sub in R1-2
     if method == "KO/TKO" and fight.round_ended and fight.round_ended <= 2:
-        template = random.choice(HEADLINE_TEMPLATES["ko_finish"])
-        return template.format(winner=winner.name, loser=loser.name, round=fight.round_ended)
+        return _headline("ko_finish", winner=winner.name, loser=loser.name, round=str(fight.round_ended))
 
     if method == "Submission" and fight.round_ended and fight.round_ended <= 2:
-        template = random.choice(HEADLINE_TEMPLATES["sub_finish"])
-        return template.format(winner=winner.name, loser=loser.name, round=fight.round_ended)
+        return _headline("sub_finish", winner=winner.name, loser=loser.name, round=str(fight.round_ended))
 
     # 3. Upset — lower OVR beats higher by 10+
     if loser.overall - winner.overall >= 10:
-        template = random.choice(HEADLINE_TEMPLATES["upset"])
-        return template.format(winner=winner.name, loser=loser.name)
+        return _headline("upset", winner=winner.name, loser=loser.name)
 
     # 4. Win streak >= 5
-    ws = _win_streak(winner.id, session)
+    ws = ctx["winner_streak"] if ctx else _win_streak(winner.id, session)
     if ws >= 5:
-        template = random.choice(HEADLINE_TEMPLATES["streak"])
-        return template.format(name=winner.name, streak=ws)
+        return _headline("streak", name=winner.name, streak=str(ws))
 
     # 5. Loss streak >= 3, age > prime_end
-    ls = _loss_streak(loser.id, session)
+    ls = ctx["loser_streak"] if ctx else _loss_streak(loser.id, session)
     if ls >= 3 and loser.age > loser.prime_end:
-        template = random.choice(HEADLINE_TEMPLATES["retirement_concern"])
-        return template.format(name=loser.name, streak=ls)
+        return _headline("retirement_concern", name=loser.name, streak=str(ls))
 
     # 6. Decision — 50% chance
     if method in ("Unanimous Decision", "Split Decision", "Majority Decision"):
         if random.random() < 0.50:
-            template = random.choice(HEADLINE_TEMPLATES["decision"])
-            return template.format(winner=winner.name, loser=loser.name)
+            return _headline("decision", winner=winner.name, loser=loser.name)
 
     return None
 
@@ -1542,8 +1913,7 @@ def generate_signing_headline(fighter: Fighter, org: Organization) -> Optional[s
     """Generate headline for significant AI signings (OVR >= 70)."""
     if fighter.overall < 70:
         return None
-    template = random.choice(HEADLINE_TEMPLATES["signing"])
-    return template.format(name=fighter.name, org=org.name)
+    return _headline("signing", name=fighter.name, org=org.name)
 
 
 # ============================================================================
@@ -1591,8 +1961,13 @@ def _query_fighter_fights(fighter_id: int, session, rivalry_with_id: int = None)
         round_ended, round_text, event_name, event_date, is_title_fight,
         card_position, is_rivalry, running_win_streak, running_loss_streak
     """
+    # Only the columns the summaries read; no Fight or Event entities
     rows = session.execute(
-        select(Fight, Event)
+        select(
+            Fight.id, Fight.fighter_a_id, Fight.fighter_b_id, Fight.winner_id,
+            Fight.method, Fight.round_ended, Fight.is_title_fight, Fight.card_position,
+            Event.name.label("event_name"), Event.event_date,
+        )
         .join(Event, Fight.event_id == Event.id)
         .where(
             or_(Fight.fighter_a_id == fighter_id, Fight.fighter_b_id == fighter_id),
@@ -1606,24 +1981,30 @@ def _query_fighter_fights(fighter_id: int, session, rivalry_with_id: int = None)
 
     # Collect opponent IDs for batch fetch
     opponent_ids = set()
-    for fight, event in rows:
+    for fight in rows:
         opp_id = fight.fighter_b_id if fight.fighter_a_id == fighter_id else fight.fighter_a_id
         opponent_ids.add(opp_id)
 
     # Batch fetch opponent names and compute overall from actual columns
     name_map = {}
     if opponent_ids:
-        opp_fighters = session.execute(
-            select(Fighter)
-            .where(Fighter.id.in_(list(opponent_ids)))
-        ).scalars().all()
-        name_map = {f.id: (f.name, f.overall) for f in opp_fighters}
+        name_map = {
+            opp_id: (name, Fighter.overall_from(*ratings))
+            for opp_id, name, *ratings in session.execute(
+                select(
+                    Fighter.id, Fighter.name,
+                    Fighter.striking, Fighter.grappling, Fighter.wrestling,
+                    Fighter.cardio, Fighter.chin, Fighter.speed,
+                )
+                .where(Fighter.id.in_(opponent_ids))
+            )
+        }
 
     # Build structured fight list
     fights = []
     win_streak = 0
     loss_streak = 0
-    for fight, event in rows:
+    for fight in rows:
         opp_id = fight.fighter_b_id if fight.fighter_a_id == fighter_id else fight.fighter_a_id
         won = fight.winner_id == fighter_id
         method_val = fight.method.value if hasattr(fight.method, "value") else str(fight.method) if fight.method else ""
@@ -1648,8 +2029,8 @@ def _query_fighter_fights(fighter_id: int, session, rivalry_with_id: int = None)
             "method_text": _humanize_method(method_val),
             "round_ended": round_num,
             "round_text": _ordinal_round(round_num),
-            "event_name": event.name,
-            "event_date": str(event.event_date) if event.event_date else "",
+            "event_name": fight.event_name,
+            "event_date": str(fight.event_date) if fight.event_date else "",
             "is_title_fight": bool(fight.is_title_fight),
             "card_position": fight.card_position or 0,
             "is_rivalry": opp_id == rivalry_with_id if rivalry_with_id else False,
@@ -1669,29 +2050,26 @@ def _detect_champion_status(fighter, session) -> str:
 
     Returns 'current_champion', 'former_champion', or 'none'.
     """
-    wc = fighter.weight_class
-    ranking = session.execute(
-        select(Ranking)
-        .where(Ranking.weight_class == wc, Ranking.fighter_id == fighter.id)
-    ).scalar_one_or_none()
-
-    if ranking and ranking.rank == 1:
-        return "current_champion"
-
-    # Check if fighter has any title fight wins (former champion)
-    title_wins = session.execute(
-        select(func.count())
-        .select_from(Fight)
-        .where(
-            or_(Fight.fighter_a_id == fighter.id, Fight.fighter_b_id == fighter.id),
-            Fight.is_title_fight == True,
-            Fight.winner_id == fighter.id,
+    # Both checks in one round trip; a title-fight win already implies the
+    # fighter was in the bout
+    is_champion, has_title_win = session.execute(
+        select(
+            exists().where(
+                Ranking.weight_class == fighter.weight_class,
+                Ranking.fighter_id == fighter.id,
+                Ranking.rank == 1,
+            ),
+            exists().where(
+                Fight.winner_id == fighter.id,
+                Fight.is_title_fight == True,
+            ),
         )
-    ).scalar()
+    ).one()
 
-    if title_wins and title_wins > 0:
+    if is_champion:
+        return "current_champion"
+    if has_title_win:
         return "former_champion"
-
     return "none"
 
 
@@ -2293,10 +2671,11 @@ def _select_key_fights(fights: list[dict], fighter_overall: int, max_refs: int)
 # Main public function: generate_fight_history_paragraph
 # ---------------------------------------------------------------------------
 
-def generate_fight_history_paragraph(fighter, session) -> str:
+def generate_fight_history_paragraph(fighter, session, ctx: Optional[dict] = None) -> str:
     """Generate a fight-history paragraph referencing actual Fight rows.
 
     Returns a string paragraph. Returns "" for fighters with no completed fights.
+    ``ctx`` is a _get_career_context result the caller already holds.
 
     CRITICAL: NO Flask dependencies. Takes a SQLAlchemy session parameter.
     """
@@ -2307,14 +2686,11 @@ def generate_fight_history_paragraph(fighter, session) -> str:
         return ""
 
     # Get career context for stage/archetype routing
-    ctx = _get_career_context(fighter)
+    if ctx is None:
+        ctx = _get_career_context(fighter)
     career_stage = ctx["career_stage"]
     archetype = ctx["archetype"]
-    division = (
-        fighter.weight_class.value
-        if hasattr(fighter.weight_class, "value")
-        else str(fighter.weight_class)
-    ).lower()
+    division = _division_name(fighter)
 
     # Determine reference count by career stage
     if career_stage == "prospect":
@@ -2418,11 +2794,7 @@ def extract_career_highlights(fighter, session) -> list[dict]:
         return []
 
     fighter_overall = fighter.overall
-    division = (
-        fighter.weight_class.value
-        if hasattr(fighter.weight_class, "value")
-        else str(fighter.weight_class)
-    ).lower()
+    division = _division_name(fighter)
 
     # Score each fight
     scored = []
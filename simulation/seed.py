@@ -722,6 +722,13 @@ def seed_fighters(
     styles = list(FighterStyle)
     fighters: list[Fighter] = []
     used_names: set[str] = set()
+    # Nicknames already taken, kept current as fighters are named below so
+    # suggest_nicknames doesn't re-query the roster for every fighter
+    used_nicknames: set[str] = set(
+        session.execute(
+            select(Fighter.nickname).where(Fighter.nickname.isnot(None))
+        ).scalars()
+    )
 
     # Game start date for contract expiry
     game_state = session.get(GameState, 1)
@@ -821,8 +828,9 @@ def seed_fighters(
             f.traits = json.dumps(_assign_traits(archetype_enum, f, py_rng))
 
             # Assign nickname
-            nicknames = suggest_nicknames(f, session)
+            nicknames = suggest_nicknames(f, used=used_nicknames)
             f.nickname = nicknames[0] if nicknames else "The Fighter"
+            used_nicknames.add(f.nickname)
             f.portrait_key = assign_portrait_key(f)
 
             # 5. Org distribution
@@ -398,7 +398,7 @@ with SessionFactory() as session:
         if f.nationality == "American" and not american_fighter:
             american_fighter = f
     if brazilian_grappler:
-        flavor = _nationality_flavor(brazilian_grappler)
+        flavor = _nationality_flavor(brazilian_grappler, random.Random(0))
         if flavor:
             print(f"    ✓ Brazilian Grappler gets flavor: '{flavor[:60]}...'")
         else:
@@ -407,7 +407,7 @@ with SessionFactory() as session:
     else:
         print("    - No Brazilian Grappler found in seed (skipped)")
     if american_fighter:
-        flavor = _nationality_flavor(american_fighter)
+        flavor = _nationality_flavor(american_fighter, random.Random(0))
         if not flavor:
             print("    ✓ American fighter gets no flavor (correct)")
         else:
@@ -164,8 +164,8 @@ for i in range(4):
         check(f"Episode {i+1} exists", ep is not None)
 
         if ep:
-            shenanigans = json.loads(ep.shenanigans) if ep.shenanigans else []
-            fights = json.loads(ep.fight_results) if ep.fight_results else []
+            shenanigans = ep.shenanigans or []
+            fights = ep.fight_results or []
             print(f"    Episode type: {ep.episode_type}")
             print(f"    Shenanigans: {len(shenanigans)}, Fights: {len(fights)}")
             print(f"    Hype generated: {ep.hype_generated:.1f}")
@@ -1,10 +1,11 @@
 from datetime import date
 from pathlib import Path
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, select
 from sqlalchemy.orm import Session
 
 from api import services
+from simulation.portraits import assign_portrait_key
 from models.database import Base
 from models.models import Fighter, FighterStyle, GameState, Organization, WeightClass
 
@@ -68,6 +69,28 @@ def test_get_fighter_exposes_portrait_url(tmp_path):
     )
 
 
+def test_init_db_backfills_missing_portrait_keys(tmp_path):
+    db_url = f"sqlite:///{tmp_path / 'portrait_backfill.db'}"
+    engine = create_engine(db_url)
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        missing = [_make_fighter(f"Unkeyed {i}") for i in range(3)]
+        for fighter in missing:
+            fighter.portrait_key = None
+        kept = _make_fighter("Keyed")
+        session.add_all([*missing, kept])
+        session.commit()
+        expected = {f.id: assign_portrait_key(f) for f in missing}
+        expected[kept.id] = "prime/striker/global_01.svg"
+
+    services.init_db(db_url)
+
+    with Session(engine) as session:
+        stored = dict(session.execute(select(Fighter.id, Fighter.portrait_key)).all())
+    assert stored == expected
+
+
 def test_fighter_panel_template_hides_placeholder_portrait_slot_from_ui():
     html = Path("frontend/templates/index.html").read_text(encoding="utf-8")
     assert 'id="panel-portrait"' not in html
@@ -15,6 +15,7 @@ from models.models import (
 )
 from simulation.market import compute_market_signals
 from simulation.matchmaking import assess_matchup
+from simulation.media import build_media_storylines
 
 
 def _make_fighter(
@@ -53,6 +54,29 @@ def _make_fighter(
     )
 
 
+def test_rivalry_storyline_picks_the_best_drawing_pair():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        quiet_a = _make_fighter("Quiet A", hype=20.0, popularity=20.0)
+        loud_a = _make_fighter("Loud A", hype=70.0, popularity=60.0)
+        loud_b = _make_fighter("Loud B", hype=65.0, popularity=60.0)
+        quiet_b = _make_fighter("Quiet B", hype=20.0, popularity=20.0)
+        session.add_all([quiet_a, loud_a, loud_b, quiet_b])
+        session.flush()
+        quiet_a.rivalry_with = quiet_b.id
+        loud_a.rivalry_with = loud_b.id
+        loud_b.rivalry_with = loud_a.id
+        session.flush()
+
+        rivalry = build_media_storylines(session)[0]
+
+        assert rivalry["type"] == "rivalry"
+        assert rivalry["fighter_ids"] == [loud_a.id, loud_b.id]
+        assert rivalry["headline"].startswith("Loud A vs Loud B")
+
+
 def test_rivalry_storyline_can_upgrade_matchup_value():
     engine = create_engine("sqlite:///:memory:")
     Base.metadata.create_all(engine)
@@ -0,0 +1,690 @@
+import json
+import random
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from models.database import Base
+from models.models import (
+    BroadcastDeal,
+    BroadcastDealStatus,
+    Contract,
+    ContractStatus,
+    Event,
+    EventStatus,
+    Fight,
+    FightMethod,
+    Fighter,
+    FighterStyle,
+    Notification,
+    Organization,
+    RealityShow,
+    ShowContestant,
+    ShowStatus,
+    Sponsorship,
+    SponsorshipStatus,
+    WeightClass,
+)
+from simulation.monthly_sim import (
+    _ai_claim_expired_fighters,
+    _pick_by_prestige,
+    _ai_sign_free_agents,
+    _compute_legacy_score,
+    _fluctuate_ai_prestige,
+    _get_cut_severity,
+    _load_contract_turnover,
+    _process_broadcast_deals,
+    _process_sponsorships,
+    _recover_injuries,
+    _should_retire,
+    sim_month,
+)
+
+
+SIM_DATE = date(2026, 6, 1)
+
+
+def _make_fighter(name: str, *, hype: float = 50.0) -> Fighter:
+    return Fighter(
+        name=name,
+        age=28,
+        nationality="American",
+        weight_class=WeightClass.LIGHTWEIGHT,
+        style=FighterStyle.STRIKER,
+        striking=70,
+        grappling=70,
+        wrestling=70,
+        cardio=70,
+        chin=70,
+        speed=70,
+        wins=10,
+        losses=3,
+        draws=0,
+        ko_wins=5,
+        sub_wins=1,
+        prime_start=25,
+        prime_end=31,
+        confidence=70.0,
+        hype=hype,
+        popularity=50.0,
+    )
+
+
+def _make_sponsorship(
+    fighter: Fighter,
+    org: Organization,
+    brand: str,
+    *,
+    expiry: date = date(2026, 12, 1),
+    min_hype: float = 40.0,
+    stipend: float = 2_000.0,
+) -> Sponsorship:
+    return Sponsorship(
+        fighter_id=fighter.id,
+        organization_id=org.id,
+        tier="Regional",
+        brand_name=brand,
+        status=SponsorshipStatus.ACTIVE,
+        monthly_stipend=stipend,
+        duration_months=12,
+        start_date=date(2026, 1, 1),
+        expiry_date=expiry,
+        min_hype=min_hype,
+        min_popularity=0.0,
+        total_paid=0.0,
+    )
+
+
+def test_sponsorships_expire_cancel_and_pay_out():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        org = Organization(
+            name="Player Org", prestige=60.0, bank_balance=100_000, is_player=True
+        )
+        rival = Organization(
+            name="Rival Org", prestige=60.0, bank_balance=100_000, is_player=False
+        )
+        expired = _make_fighter("Expired Deal")
+        released = _make_fighter("Released Fighter")
+        cold = _make_fighter("Cold Fighter", hype=10.0)
+        paid = _make_fighter("Paid Fighter")
+        session.add_all([org, rival, expired, released, cold, paid])
+        session.flush()
+
+        for fighter in (expired, cold, paid):
+            session.add(
+                Contract(
+                    fighter_id=fighter.id,
+                    organization_id=org.id,
+                    status=ContractStatus.ACTIVE,
+                    salary=50_000,
+                    fight_count_total=4,
+                    fights_remaining=4,
+                    expiry_date=date(2027, 1, 1),
+                )
+            )
+        # Released fighter is now under contract elsewhere
+        session.add(
+            Contract(
+                fighter_id=released.id,
+                organization_id=rival.id,
+                status=ContractStatus.ACTIVE,
+                salary=50_000,
+                fight_count_total=4,
+                fights_remaining=4,
+                expiry_date=date(2027, 1, 1),
+            )
+        )
+
+        sp_expired = _make_sponsorship(expired, org, "Old Brand", expiry=SIM_DATE)
+        sp_released = _make_sponsorship(released, org, "Loyal Brand")
+        sp_cold = _make_sponsorship(cold, org, "Hype Brand", min_hype=40.0)
+        sp_paid = _make_sponsorship(paid, org, "Steady Brand", stipend=2_500.0)
+        session.add_all([sp_expired, sp_released, sp_cold, sp_paid])
+        session.flush()
+
+        notes = _process_sponsorships(session, SIM_DATE, org)
+
+        assert sp_expired.status == SponsorshipStatus.EXPIRED
+        assert sp_released.status == SponsorshipStatus.CANCELLED
+        assert sp_cold.status == SponsorshipStatus.CANCELLED
+        assert sp_paid.status == SponsorshipStatus.ACTIVE
+        assert sp_paid.total_paid == 2_500.0
+        assert org.bank_balance == 102_500
+        assert any("Old Brand sponsorship" in msg for msg in notes)
+        assert any("no longer on roster" in msg for msg in notes)
+        assert any("hype fell too low" in msg for msg in notes)
+        assert notes[-1] == "Sponsorship income this month: $2,500"
+
+
+def test_broadcast_deals_expire_and_grant_prestige():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        org = Organization(
+            name="Player Org", prestige=60.0, bank_balance=100_000, is_player=True
+        )
+        session.add(org)
+        session.flush()
+
+        def _deal(network: str, expiry: date) -> BroadcastDeal:
+            return BroadcastDeal(
+                organization_id=org.id,
+                tier="Regional Cable",
+                network_name=network,
+                status=BroadcastDealStatus.ACTIVE,
+                fee_per_event=50_000,
+                duration_months=12,
+                start_date=date(2026, 5, 1),
+                expiry_date=expiry,
+                min_prestige=30.0,
+                min_events_per_year=4,
+                events_delivered=0,
+                compliance_warnings=0,
+                prestige_per_month=1.5,
+            )
+
+        old = _deal("Old Network", SIM_DATE)
+        current = _deal("Current Network", date(2027, 5, 1))
+        session.add_all([old, current])
+        session.flush()
+
+        notes = _process_broadcast_deals(session, SIM_DATE, org)
+
+        assert old.status == BroadcastDealStatus.EXPIRED
+        assert current.status == BroadcastDealStatus.ACTIVE
+        assert org.prestige == 61.5
+        assert notes == ["Your Regional Cable deal with Old Network has expired."]
+
+
+@pytest.mark.parametrize(
+    ("natural", "fighting", "expected"),
+    [
+        (None, 155, "easy"),
+        (170, None, "easy"),
+        (150, 155, "easy"),
+        (160, 155, "easy"),
+        (200, 190, "moderate"),
+        (175, 155, "severe"),
+        (200, 180, "severe"),
+        (200, 170, "extreme"),
+        (185, 155, "extreme"),
+    ],
+)
+def test_cut_severity_thresholds(natural, fighting, expected):
+    fighter = _make_fighter("Cutter")
+    fighter.natural_weight = natural
+    fighter.fighting_weight = fighting
+
+    assert _get_cut_severity(fighter) == expected
+
+
+class _NoDriftRng:
+    def uniform(self, a, b):
+        return 0.0
+
+
+def test_ai_prestige_uses_recent_events_and_top_roster():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        busy = Organization(name="Busy", prestige=60.0, bank_balance=0, is_player=False)
+        idle = Organization(name="Idle", prestige=60.0, bank_balance=0, is_player=False)
+        stars = [_make_fighter(f"Star {idx}") for idx in range(6)]
+        for fighter in stars:
+            for attr in (
+                "striking",
+                "grappling",
+                "wrestling",
+                "cardio",
+                "chin",
+                "speed",
+            ):
+                setattr(fighter, attr, 80)
+        session.add_all([busy, idle, *stars])
+        session.flush()
+
+        for fighter in stars:
+            session.add(
+                Contract(
+                    fighter_id=fighter.id,
+                    organization_id=busy.id,
+                    status=ContractStatus.ACTIVE,
+                    salary=50_000,
+                    fight_count_total=4,
+                    fights_remaining=4,
+                    expiry_date=date(2027, 1, 1),
+                )
+            )
+        # Four recent events (bonus caps at three) plus one outside the window
+        for event_date in [date(2026, 5, 1)] * 4 + [date(2025, 1, 1)]:
+            session.add(
+                Event(
+                    name="Card",
+                    event_date=event_date,
+                    venue="Arena",
+                    organization_id=busy.id,
+                    status=EventStatus.COMPLETED,
+                )
+            )
+        session.flush()
+
+        _fluctuate_ai_prestige(
+            session,
+            [busy, idle],
+            SIM_DATE,
+            _NoDriftRng(),
+            {f.id: f for f in stars},
+        )
+
+        assert busy.prestige == pytest.approx(61.2)
+        assert idle.prestige == pytest.approx(60.0)
+
+
+def test_sim_month_decays_confidence_toward_baseline():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        start = [90.0, 71.0, 70.0, 69.0, 50.0]
+        fighters = [_make_fighter(f"Fighter {conf}") for conf in start]
+        for fighter, conf in zip(fighters, start):
+            fighter.age = 24
+            fighter.confidence = conf
+        retired = _make_fighter("Retired")
+        retired.is_retired = True
+        retired.confidence = 90.0
+        session.add_all([*fighters, retired])
+        session.commit()
+
+        sim_month(session, sim_date=SIM_DATE, seed=1)
+
+        assert [f.confidence for f in fighters] == [88.0, 70.0, 70.0, 70.0, 52.0]
+        assert retired.confidence == 90.0
+
+
+def test_recover_injuries_heals_loaded_fighters():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        healing = _make_fighter("Healing")
+        healing.injury_months, healing.condition = 1, 80.0
+        hurt = _make_fighter("Hurt")
+        hurt.injury_months, hurt.condition = 3, 40.0
+        fit = _make_fighter("Fit")
+        fit.injury_months, fit.condition = 0, 60.0
+        session.add_all([healing, hurt, fit])
+        session.flush()
+
+        _recover_injuries(session)
+
+        assert (healing.injury_months, healing.condition) == (0, 100.0)
+        assert (hurt.injury_months, hurt.condition) == (2, 40.0)
+        assert (fit.injury_months, fit.condition) == (0, 60.0)
+
+
+def test_retirement_watch_forces_a_fading_veteran_out():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        veteran = _make_fighter("Veteran")
+        veteran.age = 33
+        veteran.narrative_tags = json.dumps(["fading", "retirement_watch"])
+        for attr in ("striking", "grappling", "wrestling", "cardio", "chin", "speed"):
+            setattr(veteran, attr, 50)
+        session.add(veteran)
+        session.flush()
+
+        assert _should_retire(veteran, session, random.Random(0))
+        assert _should_retire(veteran, session, random.Random(0), on_active_show=set())
+        assert not _should_retire(
+            veteran, session, random.Random(0), on_active_show={veteran.id}
+        )
+
+
+def test_retirement_watch_raises_the_odds_for_a_solid_veteran():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        veteran = _make_fighter("Veteran")
+        veteran.age = veteran.prime_end + 1
+        for attr in ("striking", "grappling", "wrestling", "cardio", "chin", "speed"):
+            setattr(veteran, attr, 70)
+        session.add(veteran)
+        session.flush()
+        assert veteran.overall >= 55
+
+        # Random(1) draws ~0.134: above the 2% base odds one year past
+        # prime, below them once the tag adds its 15%
+        assert not _should_retire(veteran, session, random.Random(1))
+        veteran.narrative_tags = json.dumps(["retirement_watch"])
+        assert _should_retire(veteran, session, random.Random(1))
+
+
+def test_legacy_score_credits_wins_from_both_corners():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        org = Organization(name="Org", prestige=60.0, bank_balance=0, is_player=False)
+        legend = _make_fighter("Legend")
+        legend.wins, legend.losses, legend.draws = 2, 1, 1
+        legend.ko_wins, legend.sub_wins = 1, 0
+        legend.peak_overall = 80
+        legend.narrative_tags = '["champion", "ko_specialist"]'
+        first = _make_fighter("First")
+        second = _make_fighter("Second")
+        second.striking = 95
+        session.add_all([org, legend, first, second])
+        session.flush()
+        event = Event(
+            name="Card",
+            event_date=date(2026, 1, 1),
+            venue="Arena",
+            organization_id=org.id,
+            status=EventStatus.COMPLETED,
+        )
+        session.add(event)
+        session.flush()
+        for a, b, winner in [
+            (legend, first, legend),
+            (second, legend, legend),
+            (legend, first, first),
+            (second, legend, None),
+        ]:
+            session.add(
+                Fight(
+                    event_id=event.id,
+                    fighter_a_id=a.id,
+                    fighter_b_id=b.id,
+                    weight_class=WeightClass.LIGHTWEIGHT,
+                    winner_id=winner.id if winner else None,
+                    method=FightMethod.KO_TKO if winner else None,
+                    round_ended=1,
+                    time_ended="1:00",
+                )
+            )
+        session.flush()
+
+        expected = (
+            2 * 2.0
+            - 0.5
+            + (first.overall / 100) * 3.0
+            + (second.overall / 100) * 3.0
+            + 1 * 1.5
+            + 8.0
+            + 4 * 0.3
+            + 80 * 0.2
+            + 2
+        )
+        assert _compute_legacy_score(legend, session) == round(expected, 1)
+
+
+def test_sim_month_deducts_monthly_payroll():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        org = Organization(
+            name="Player Org", prestige=60.0, bank_balance=100_000, is_player=True
+        )
+        signed = _make_fighter("Signed")
+        expired = _make_fighter("Expired")
+        session.add_all([org, signed, expired])
+        session.flush()
+        for fighter, status in (
+            (signed, ContractStatus.ACTIVE),
+            (expired, ContractStatus.EXPIRED),
+        ):
+            session.add(
+                Contract(
+                    fighter_id=fighter.id,
+                    organization_id=org.id,
+                    status=status,
+                    salary=60_000,
+                    fight_count_total=4,
+                    fights_remaining=4,
+                    expiry_date=date(2027, 1, 1),
+                )
+            )
+        session.commit()
+
+        sim_month(session, sim_date=SIM_DATE, seed=1)
+
+        assert org.bank_balance == pytest.approx(95_000)
+
+
+def test_sim_month_batches_player_notifications():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        org = Organization(
+            name="Player Org", prestige=60.0, bank_balance=-600_000, is_player=True
+        )
+        session.add(org)
+        session.commit()
+
+        sim_month(session, sim_date=SIM_DATE, seed=1)
+
+        types = session.execute(select(Notification.type)).scalars().all()
+        assert sorted(types) == ["bankruptcy_warning", "finances_critical"]
+
+
+class _EagerRng:
+    """Always accepts, always picks the first option, no salary jitter."""
+
+    def random(self):
+        return 0.0
+
+    def uniform(self, a, b):
+        return (a + b) / 2
+
+
+def test_pick_by_prestige_matches_rng_choices():
+    orgs = [
+        Organization(name=f"Org {p}", prestige=p, bank_balance=0, is_player=False)
+        for p in (0.0, 35.0, 80.0, 55.5)
+    ]
+    cum_weights = [1.0, 36.0, 116.0, 171.5]
+    ours, theirs = random.Random(7), random.Random(7)
+
+    for _ in range(200):
+        expected = theirs.choices(orgs, weights=[1.0, 35.0, 80.0, 55.5], k=1)[0]
+        assert _pick_by_prestige(orgs, cum_weights, ours) is expected
+
+
+def _off_market_setup(session, *, contract_status):
+    """AI org plus one fighter per availability case, all 80 OVR."""
+    ai_org = Organization(
+        name="AI Org", prestige=70.0, bank_balance=50_000_000, is_player=False
+    )
+    other = Organization(
+        name="Other Org", prestige=70.0, bank_balance=50_000_000, is_player=False
+    )
+    names = ("Free", "Signed Elsewhere", "On Show", "Retired")
+    fighters = {name: _make_fighter(name) for name in names}
+    for fighter in fighters.values():
+        for attr in ("striking", "grappling", "wrestling", "cardio", "chin", "speed"):
+            setattr(fighter, attr, 80)
+    fighters["Retired"].is_retired = True
+    session.add_all([ai_org, other, *fighters.values()])
+    session.flush()
+
+    def _contract(fighter, org, status, expiry):
+        return Contract(
+            fighter_id=fighter.id,
+            organization_id=org.id,
+            status=status,
+            salary=50_000,
+            fight_count_total=4,
+            fights_remaining=4,
+            expiry_date=expiry,
+        )
+
+    if contract_status == ContractStatus.EXPIRED:
+        for fighter in fighters.values():
+            session.add(_contract(fighter, other, ContractStatus.EXPIRED, SIM_DATE))
+    session.add(
+        _contract(
+            fighters["Signed Elsewhere"],
+            other,
+            ContractStatus.ACTIVE,
+            date(2027, 1, 1),
+        )
+    )
+    show = RealityShow(
+        name="Show",
+        organization_id=other.id,
+        weight_class=WeightClass.LIGHTWEIGHT,
+        status=ShowStatus.IN_PROGRESS,
+        format_size=8,
+    )
+    session.add(show)
+    session.flush()
+    session.add(
+        ShowContestant(show_id=show.id, fighter_id=fighters["On Show"].id, seed=1)
+    )
+    session.flush()
+    return ai_org, fighters
+
+
+def _signed_by(session, org):
+    return set(
+        session.execute(
+            select(Contract.fighter_id).where(
+                Contract.organization_id == org.id,
+                Contract.status == ContractStatus.ACTIVE,
+            )
+        ).scalars()
+    )
+
+
+def test_ai_signing_skips_contracted_show_and_retired_fighters():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        ai_org, fighters = _off_market_setup(
+            session, contract_status=ContractStatus.ACTIVE
+        )
+        by_id = {f.id: f for f in fighters.values()}
+
+        _ai_sign_free_agents(session, [ai_org], SIM_DATE, _EagerRng(), None, by_id)
+
+        assert _signed_by(session, ai_org) == {fighters["Free"].id}
+
+
+def test_contract_turnover_splits_expiring_and_expired():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        player = Organization(
+            name="Player Org", prestige=60.0, bank_balance=0, is_player=True
+        )
+        rival = Organization(name="Rival", prestige=60.0, bank_balance=0)
+        names = ("Expiring", "Long Deal", "Rival Expiring", "Lapsed", "Re-signed")
+        fighters = {name: _make_fighter(name) for name in names}
+        session.add_all([player, rival, *fighters.values()])
+        session.flush()
+
+        def _contract(name, org, status, expiry):
+            session.add(
+                Contract(
+                    fighter_id=fighters[name].id,
+                    organization_id=org.id,
+                    status=status,
+                    salary=50_000,
+                    fight_count_total=4,
+                    fights_remaining=4,
+                    expiry_date=expiry,
+                )
+            )
+
+        _contract("Expiring", player, ContractStatus.ACTIVE, date(2026, 7, 1))
+        _contract("Long Deal", player, ContractStatus.ACTIVE, date(2027, 6, 1))
+        _contract("Rival Expiring", rival, ContractStatus.ACTIVE, date(2026, 7, 1))
+        _contract("Lapsed", player, ContractStatus.EXPIRED, date(2026, 5, 15))
+        _contract("Re-signed", rival, ContractStatus.EXPIRED, date(2026, 5, 15))
+        _contract("Re-signed", player, ContractStatus.ACTIVE, date(2027, 6, 1))
+        session.flush()
+
+        expiring, recently_expired = _load_contract_turnover(session, player, SIM_DATE)
+
+        assert [f.name for _, f in expiring] == ["Expiring"]
+        assert [f.name for _, f in recently_expired] == ["Lapsed"]
+
+
+def test_ai_claims_only_available_expired_fighters():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        ai_org, fighters = _off_market_setup(
+            session, contract_status=ContractStatus.EXPIRED
+        )
+        _, recently_expired = _load_contract_turnover(session, None, SIM_DATE)
+
+        _ai_claim_expired_fighters(
+            session, [ai_org], None, SIM_DATE, _EagerRng(), recently_expired
+        )
+
+        assert _signed_by(session, ai_org) == {fighters["Free"].id}
+
+
+def test_ai_claims_a_fighter_with_two_expired_contracts_once():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        ai_org = Organization(
+            name="AI Org", prestige=70.0, bank_balance=50_000_000, is_player=False
+        )
+        other = Organization(
+            name="Other Org", prestige=70.0, bank_balance=50_000_000, is_player=False
+        )
+        fighter = _make_fighter("Twice Lapsed")
+        for attr in ("striking", "grappling", "wrestling", "cardio", "chin", "speed"):
+            setattr(fighter, attr, 80)
+        session.add_all([ai_org, other, fighter])
+        session.flush()
+        for org, expiry in ((other, date(2026, 5, 10)), (ai_org, SIM_DATE)):
+            session.add(
+                Contract(
+                    fighter_id=fighter.id,
+                    organization_id=org.id,
+                    status=ContractStatus.EXPIRED,
+                    salary=50_000,
+                    fight_count_total=4,
+                    fights_remaining=0,
+                    expiry_date=expiry,
+                )
+            )
+        session.flush()
+
+        _, recently_expired = _load_contract_turnover(session, None, SIM_DATE)
+        assert len(recently_expired) == 2
+
+        _ai_claim_expired_fighters(
+            session, [ai_org], None, SIM_DATE, _EagerRng(), recently_expired
+        )
+
+        active = session.execute(
+            select(func.count())
+            .select_from(Contract)
+            .where(
+                Contract.fighter_id == fighter.id,
+                Contract.status == ContractStatus.ACTIVE,
+            )
+        ).scalar()
+        assert active == 1
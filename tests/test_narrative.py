@@ -0,0 +1,635 @@
+import json
+import random
+from datetime import date
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from models.database import Base
+from models.models import (
+    Archetype,
+    Event,
+    EventStatus,
+    Fight,
+    Fighter,
+    FighterStyle,
+    FightMethod,
+    Organization,
+    Ranking,
+    WeightClass,
+)
+from simulation.narrative import (
+    _BIO_FIELDS,
+    _BIO_LINE_PARTS,
+    _STREAK_STMT,
+    _bio_passes,
+    _decision_win_count,
+    _detect_champion_status,
+    _division_name,
+    _fight_context,
+    _first_round_finish_count,
+    _get_career_context,
+    _had_prior_loss,
+    _has_been_kod,
+    _is_ranked,
+    _is_ranked_number_one,
+    _is_ranked_top_5,
+    _ko_loss_count,
+    _loss_streak,
+    _nationality_flavor,
+    _previously_lost_to,
+    _select_templates,
+    _streaks,
+    _total_completed_fights,
+    _validate_bio,
+    _win_streak,
+    add_tag,
+    apply_fight_tags,
+    decay_hype,
+    display_archetype,
+    generate_fight_headline,
+    generate_fighter_bio,
+    get_tags,
+    get_traits,
+    remove_tag,
+    suggest_nicknames,
+    update_goat_scores,
+    update_rivalries,
+)
+
+
+def _make_fighter(name: str, **overrides) -> Fighter:
+    fields = {
+        "name": name,
+        "age": 28,
+        "nationality": "American",
+        "weight_class": WeightClass.LIGHTWEIGHT,
+        "style": FighterStyle.STRIKER,
+        "striking": 70,
+        "grappling": 70,
+        "wrestling": 70,
+        "cardio": 70,
+        "chin": 70,
+        "speed": 70,
+        "wins": 0,
+        "losses": 0,
+        "draws": 0,
+        "ko_wins": 0,
+        "sub_wins": 0,
+        "prime_start": 25,
+        "prime_end": 31,
+        "confidence": 70.0,
+        "hype": 50.0,
+        "popularity": 50.0,
+    }
+    fields.update(overrides)
+    return Fighter(**fields)
+
+
+def _setup(session):
+    org = Organization(name="Org", prestige=60.0, bank_balance=0, is_player=False)
+    session.add(org)
+    session.flush()
+    event = Event(
+        name="Card",
+        event_date=date(2026, 1, 1),
+        venue="Arena",
+        organization_id=org.id,
+        status=EventStatus.COMPLETED,
+    )
+    winner = _make_fighter("Winner")
+    loser = _make_fighter("Loser")
+    other = _make_fighter("Other")
+    session.add_all([event, winner, loser, other])
+    session.flush()
+    return event, winner, loser, other
+
+
+def _fight(session, event, a, b, winner, method, round_ended=3):
+    fight = Fight(
+        event_id=event.id,
+        fighter_a_id=a.id,
+        fighter_b_id=b.id,
+        weight_class=WeightClass.LIGHTWEIGHT,
+        winner_id=winner.id if winner else None,
+        method=method,
+        round_ended=round_ended,
+        time_ended="1:30",
+    )
+    session.add(fight)
+    session.flush()
+    return fight
+
+
+def test_fight_context_matches_single_query_helpers():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        event, winner, loser, other = _setup(session)
+        ko, sub, dec = (
+            FightMethod.KO_TKO,
+            FightMethod.SUBMISSION,
+            FightMethod.UNANIMOUS_DECISION,
+        )
+        _fight(session, event, winner, loser, loser, ko, 2)
+        _fight(session, event, other, winner, other, ko, 1)
+        _fight(session, event, winner, other, winner, sub, 1)
+        _fight(session, event, loser, other, other, ko, 1)
+        _fight(session, event, winner, other, None, None)
+        _fight(session, event, other, loser, other, dec)
+        _fight(session, event, winner, other, winner, dec)
+        current = _fight(session, event, winner, loser, winner, ko, 1)
+        session.add_all(
+            [
+                Ranking(
+                    weight_class=WeightClass.LIGHTWEIGHT,
+                    fighter_id=winner.id,
+                    rank=1,
+                    score=90.0,
+                ),
+                Ranking(
+                    weight_class=WeightClass.WELTERWEIGHT,
+                    fighter_id=loser.id,
+                    rank=7,
+                    score=70.0,
+                ),
+            ]
+        )
+        session.flush()
+
+        ctx = _fight_context(winner, loser, current, session)
+
+        w, lo = winner.id, loser.id
+        assert ctx == {
+            "winner_streak": _win_streak(w, session),
+            "loser_streak": _loss_streak(lo, session),
+            "previously_lost_to": _previously_lost_to(w, lo, current.id, session),
+            "had_prior_loss": _had_prior_loss(w, current.id, session),
+            "loser_ko_losses": _ko_loss_count(lo, session),
+            "first_round_finishes": _first_round_finish_count(w, session),
+            "decision_wins": _decision_win_count(w, session),
+            "winner_been_kod": _has_been_kod(w, session),
+            "winner_total_fights": _total_completed_fights(w, session),
+            "winner_ranked": _is_ranked(w, session),
+            "loser_ranked": _is_ranked(lo, session),
+            "winner_top_5": _is_ranked_top_5(w, session),
+            "loser_top_5": _is_ranked_top_5(lo, session),
+            "winner_number_one": _is_ranked_number_one(w, winner.weight_class, session),
+        }
+        assert ctx["winner_streak"] == 3
+        assert ctx["loser_streak"] == 3
+        assert ctx["previously_lost_to"] is True
+        assert ctx["winner_number_one"] is True
+
+
+def test_streaks_reports_the_leading_run():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        event, winner, loser, other = _setup(session)
+        ko = FightMethod.KO_TKO
+        _fight(session, event, winner, loser, loser, ko)
+        _fight(session, event, winner, other, winner, ko)
+        _fight(session, event, other, winner, None, None)
+        _fight(session, event, loser, winner, winner, ko)
+
+        assert _streaks(winner.id, session) == (2, 0)
+        assert _streaks(winner.id, session, limit=1) == (1, 0)
+        assert _streaks(loser.id, session) == (0, 1)
+        assert _streaks(other.id, session) == (0, 1)
+        debut = _make_fighter("Debut")
+        session.add(debut)
+        session.flush()
+        assert _streaks(debut.id, session) == (0, 0)
+
+
+def test_streak_query_searches_both_corner_indexes():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    sql = _STREAK_STMT.compile(engine)
+    params = tuple(1 for _ in sql.positiontup)
+    with engine.connect() as conn:
+        plan = " ".join(
+            row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", params)
+        )
+
+    assert "ix_fight_fighter_a_recent" in plan
+    assert "ix_fight_fighter_b_recent" in plan
+
+
+@pytest.mark.parametrize(
+    ("weight_class", "expected"),
+    [
+        (WeightClass.LIGHTWEIGHT, True),
+        ("Lightweight", True),
+        (WeightClass.WELTERWEIGHT, False),
+    ],
+)
+def test_is_ranked_number_one_accepts_enum_or_value(weight_class, expected):
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        _, winner, _, _ = _setup(session)
+        session.add(
+            Ranking(
+                weight_class=WeightClass.LIGHTWEIGHT,
+                fighter_id=winner.id,
+                rank=1,
+                score=90.0,
+            )
+        )
+        session.flush()
+
+        assert _is_ranked_number_one(winner.id, weight_class, session) is expected
+
+
+def test_apply_fight_tags_marks_redemption_and_champion():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        event, winner, loser, _ = _setup(session)
+        _fight(session, event, winner, loser, loser, FightMethod.KO_TKO, 2)
+        current = _fight(session, event, winner, loser, winner, FightMethod.KO_TKO)
+        winner.wins, winner.losses = 1, 1
+        loser.wins, loser.losses = 1, 1
+        session.add(
+            Ranking(
+                weight_class=WeightClass.LIGHTWEIGHT,
+                fighter_id=winner.id,
+                rank=1,
+                score=90.0,
+            )
+        )
+        session.flush()
+
+        apply_fight_tags(winner, loser, current, session)
+
+        assert {"first_win", "redemption", "champion"} <= set(get_tags(winner))
+        assert "first_setback" in get_tags(loser)
+
+
+def test_fight_headline_reuses_apply_fight_tags_streaks():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        event, winner, loser, _ = _setup(session)
+        fight = _fight(session, event, winner, loser, winner, FightMethod.SUBMISSION)
+        winner.wins, loser.losses = 1, 1
+
+        ctx = apply_fight_tags(winner, loser, fight, session)
+        ctx["winner_streak"] = 6
+
+        headline = generate_fight_headline(winner, loser, fight, session, ctx)
+
+        assert "Winner" in headline and "6" in headline
+
+
+def test_update_goat_scores_credits_each_beaten_opponent():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        event, winner, loser, other = _setup(session)
+        other.striking = 90
+        _fight(session, event, winner, loser, winner, FightMethod.KO_TKO)
+        _fight(session, event, other, winner, winner, FightMethod.SUBMISSION)
+        _fight(session, event, winner, other, None, None)
+        _fight(session, event, loser, winner, winner, FightMethod.UNANIMOUS_DECISION)
+        winner.wins, winner.losses, winner.ko_wins, winner.sub_wins = 3, 1, 1, 1
+        winner.narrative_tags = '["champion"]'
+        loser.narrative_tags = '["not_a_champion"]'
+        session.flush()
+
+        update_goat_scores(session)
+
+        expected = (
+            3 * 2.0
+            + ((2 * loser.overall + other.overall) / 100) * 3
+            + 2 * 1.5
+            + 5
+            - 0.5
+        )
+        assert winner.goat_score == round(expected, 2)
+        assert loser.goat_score == 0.0
+
+
+def test_update_rivalries_pairs_repeat_opponents():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        event, winner, loser, other = _setup(session)
+        ko = FightMethod.KO_TKO
+        _fight(session, event, winner, loser, winner, ko)
+        _fight(session, event, loser, winner, loser, ko)
+        _fight(session, event, winner, loser, winner, ko)
+        _fight(session, event, other, winner, other, ko)
+        _fight(session, event, winner, other, None, None)
+
+        rivalries = update_rivalries(session)
+
+        assert rivalries == [
+            {"fighter_a": "Winner", "fighter_b": "Loser", "fight_count": 3}
+        ]
+        assert winner.rivalry_with == loser.id
+        assert loser.rivalry_with == winner.id
+        assert other.rivalry_with is None
+        assert "legendary_rivalry" in get_tags(winner)
+
+
+def test_get_tags_cache_follows_direct_writes():
+    fighter = _make_fighter("Tagged")
+    fighter.narrative_tags = '["fading"]'
+
+    tags = get_tags(fighter)
+    tags.append("scratch")
+    assert get_tags(fighter) == ["fading"]
+
+    add_tag(fighter, "on_a_tear")
+    assert get_tags(fighter) == ["fading", "on_a_tear"]
+
+    # Present/absent tags leave the stored string untouched
+    raw = fighter.narrative_tags
+    add_tag(fighter, "fading")
+    remove_tag(fighter, "champion")
+    assert fighter.narrative_tags is raw
+    remove_tag(fighter, "fading")
+    assert get_tags(fighter) == ["on_a_tear"]
+
+    fighter.narrative_tags = '["retired"]'
+    assert get_tags(fighter) == ["retired"]
+
+
+@pytest.mark.parametrize(
+    ("stored", "expected"),
+    [
+        (None, ["show_winner"]),
+        ('["fading"]', ["fading", "show_winner"]),
+        ('["show_winner", "fading"]', ["show_winner", "fading"]),
+        ('["show_winner_x"]', ["show_winner_x", "show_winner"]),
+        ("not json", ["show_winner"]),
+    ],
+)
+def test_add_tag_appends_missing_tags_once(stored, expected):
+    fighter = _make_fighter("Tagged")
+    fighter.narrative_tags = stored
+    get_tags(fighter)
+
+    add_tag(fighter, "show_winner")
+
+    assert json.loads(fighter.narrative_tags) == expected
+    assert get_tags(fighter) == expected
+
+
+def test_get_traits_cache_follows_direct_writes():
+    fighter = _make_fighter("Traited", traits='["iron_chin"]')
+
+    traits = get_traits(fighter)
+    traits.append("scratch")
+    assert get_traits(fighter) == ["iron_chin"]
+
+    fighter.traits = '["gas_tank", "media_darling"]'
+    assert get_traits(fighter) == ["gas_tank", "media_darling"]
+
+    fighter.traits = None
+    assert get_traits(fighter) == []
+
+
+def test_decay_hype_updates_loaded_fighters_in_place():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        plain = _make_fighter("Plain", hype=60.0, popularity=40.0)
+        darling = _make_fighter(
+            "Darling", hype=60.0, popularity=40.0, traits='["media_darling"]'
+        )
+        faded = _make_fighter("Faded", hype=3.0, popularity=2.0)
+        retired = _make_fighter("Retired", hype=60.0, is_retired=True)
+        session.add_all([plain, darling, faded, retired])
+        session.flush()
+
+        decay_hype(session, random.Random(11))
+
+        ref = random.Random(11)
+        base_decays = np.random.default_rng(ref.randint(0, 2**63 - 1)).uniform(
+            5, 10, size=3
+        )
+        for fighter, mult, base_decay in zip(
+            (plain, darling, faded), (1.0, 0.4, 1.0), base_decays
+        ):
+            start_hype = 3.0 if fighter is faded else 60.0
+            start_pop = 2.0 if fighter is faded else 40.0
+            hype = max(0.0, start_hype - base_decay * mult)
+            assert fighter.hype == pytest.approx(hype)
+            assert fighter.popularity == pytest.approx(
+                start_pop + (hype - start_pop) * 0.05
+            )
+        assert faded.hype == 0.0
+        assert retired.hype == 60.0
+        # Written back as committed state, so nothing is re-flushed
+        assert not session.dirty
+
+
+@pytest.mark.parametrize(
+    ("tags", "expected"),
+    [
+        ('["fading", "champion", "first_win"]', "champion"),
+        ('["at_the_crossroads", "goat_watch"]', "goat_watch"),
+        ('["first_win"]', None),
+        (None, None),
+    ],
+)
+def test_career_context_picks_highest_priority_tag(tags, expected):
+    fighter = _make_fighter("Tagged", wins=8, losses=2, narrative_tags=tags)
+
+    ctx = _get_career_context(fighter)
+
+    assert ctx["significant_tag"] == expected
+    assert ctx["tags"] == frozenset(get_tags(fighter))
+
+
+@pytest.mark.parametrize(
+    "nationality,style,has_flavor",
+    [
+        ("Brazilian", FighterStyle.GRAPPLER, True),
+        ("Brazilian", "Grappler", True),
+        ("Brazilian", FighterStyle.STRIKER, False),
+        ("British", FighterStyle.STRIKER, False),
+        ("American", FighterStyle.STRIKER, False),
+    ],
+)
+def test_nationality_flavor_needs_matching_style_and_lines(
+    nationality, style, has_flavor
+):
+    fighter = _make_fighter("Flavored", nationality=nationality, style=style)
+
+    flavor = _nationality_flavor(fighter, random.Random(0))
+
+    assert bool(flavor) is has_flavor
+    if has_flavor:
+        assert "Flavored" in flavor
+
+
+def test_select_templates_checks_overrides_before_archetype_rules():
+    fighter = _make_fighter("Picked", age=24, wins=12, losses=1)
+    ctx = {
+        "archetype": "GOAT Candidate",
+        "career_stage": "developing",
+        "trajectory": "rising",
+        "significant_tag": None,
+        "past_prime": False,
+        "win_rate": 0.9,
+    }
+
+    established = _select_templates(fighter, ctx)
+    assert established == _select_templates(_make_fighter("Same", wins=19), ctx)
+    assert (
+        _select_templates(fighter, {**ctx, "significant_tag": "goat_watch"})
+        != established
+    )
+
+    prospect = _select_templates(fighter, {**ctx, "career_stage": "prospect"})
+    assert all(isinstance(t, str) and "{name}" in t for t in prospect)
+    crossroads = _select_templates(
+        fighter, {**ctx, "significant_tag": "at_the_crossroads"}
+    )
+    assert crossroads != established
+    assert _select_templates(fighter, {**ctx, "archetype": None}) not in (
+        established,
+        prospect,
+    )
+
+
+def test_compiled_bio_lines_only_use_known_fields():
+    fields = {
+        field for parts in _BIO_LINE_PARTS.values() for _, field in parts if field
+    }
+
+    assert fields <= _BIO_FIELDS.keys()
+
+
+@pytest.mark.parametrize(
+    ("bio", "expected"),
+    [
+        ("A clean bio with 2 wins.", []),
+        (
+            "Two decades in, he has proven it.",
+            [
+                "veteran language for low fight count",
+                "elder language for young fighter",
+                "established language for prospect",
+            ],
+        ),
+        (
+            "A veteran with 1 wins.",
+            ["veteran language for low fight count", "pluralization error"],
+        ),
+        ("He has been around with 11 wins.", ["elder language for young fighter"]),
+    ],
+)
+def test_validate_bio_flags_each_category(bio, expected):
+    fighter = _make_fighter("Checked", age=24)
+    ctx = {"career_fights": 4, "career_stage": "prospect"}
+
+    assert _validate_bio(bio, fighter, ctx) == (not expected, expected)
+    assert _bio_passes(bio, fighter, ctx) is (not expected)
+
+
+@pytest.mark.parametrize(
+    ("archetype", "age", "wins", "losses", "expected"),
+    [
+        (Archetype.PHENOM, 24, 8, 1, "Phenom"),
+        (Archetype.PHENOM, 33, 8, 1, "Former Phenom"),
+        (Archetype.GATEKEEPER, 25, 8, 1, "Developing"),
+        (Archetype.JOURNEYMAN, 26, 8, 1, "Developing"),
+        (Archetype.JOURNEYMAN, 26, 4, 6, "Journeyman"),
+        (None, 30, 4, 6, "Journeyman"),
+        (Archetype.GATEKEEPER, 36, 8, 1, "Veteran"),
+    ],
+)
+def test_display_archetype_matches_career_context(
+    archetype, age, wins, losses, expected
+):
+    fighter = _make_fighter(
+        "Shown", archetype=archetype, age=age, wins=wins, losses=losses
+    )
+
+    assert display_archetype(fighter) == expected
+    if expected != "Veteran":
+        assert _get_career_context(fighter)["displayed_archetype"] == expected
+
+
+@pytest.mark.parametrize("weight_class", [WeightClass.MIDDLEWEIGHT, "Middleweight"])
+def test_division_name_accepts_enum_or_value(weight_class):
+    fighter = _make_fighter("Sized", weight_class=weight_class)
+
+    assert _division_name(fighter) == "middleweight"
+
+
+def test_fighter_bio_is_stable_per_fighter():
+    fighter = _make_fighter(
+        "Stable",
+        id=7,
+        wins=8,
+        losses=2,
+        nationality="Brazilian",
+        style=FighterStyle.GRAPPLER,
+        traits='["iron_chin", "media_darling"]',
+    )
+
+    bio = generate_fighter_bio(fighter)
+
+    assert generate_fighter_bio(fighter) == bio
+    assert generate_fighter_bio(fighter, random.Random(7)) == bio
+    assert generate_fighter_bio(fighter, ctx=_get_career_context(fighter)) == bio
+
+    # The cached nationality/trait sentences follow a trait change
+    fighter.traits = '["gas_tank"]'
+    assert generate_fighter_bio(fighter) == generate_fighter_bio(
+        fighter, random.Random(7)
+    )
+    assert generate_fighter_bio(fighter) != bio
+
+
+def test_suggest_nicknames_picks_distinct_unused_names():
+    fighter = _make_fighter("Named", traits='["iron_chin"]')
+    taken = {"Iron Chin", "Granite", "The Tank", "Unbreakable"}
+
+    random.seed(3)
+    for _ in range(50):
+        picks = suggest_nicknames(fighter, used=taken)
+        assert len(picks) == 3
+        assert len(set(picks)) == 3
+        assert not taken & set(picks)
+
+
+def test_detect_champion_status():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        event, winner, loser, other = _setup(session)
+        title = _fight(session, event, winner, loser, winner, FightMethod.KO_TKO)
+        title.is_title_fight = True
+        session.add(
+            Ranking(
+                weight_class=WeightClass.LIGHTWEIGHT,
+                fighter_id=other.id,
+                rank=1,
+                score=90.0,
+            )
+        )
+        session.flush()
+
+        assert _detect_champion_status(other, session) == "current_champion"
+        assert _detect_champion_status(winner, session) == "former_champion"
+        assert _detect_champion_status(loser, session) == "none"
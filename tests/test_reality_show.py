@@ -1,5 +1,5 @@
+import random
 from datetime import date
-import json
 
 from sqlalchemy import create_engine, select
 from sqlalchemy.orm import Session
@@ -147,7 +147,7 @@ def test_finale_still_resolves_when_both_finalists_are_unavailable():
                 episode_number=3,
                 episode_type="semifinal",
                 air_date=date(2026, 3, 1),
-                fight_results=json.dumps(semifinal_results),
+                fight_results=semifinal_results,
                 shenanigans=None,
                 episode_narrative="Semifinals",
                 episode_rating=7.5,
@@ -166,7 +166,7 @@ def test_finale_still_resolves_when_both_finalists_are_unavailable():
                 ShowEpisode.episode_type == "finale",
             )
         ).scalar_one()
-        finale_results = json.loads(finale.fight_results)
+        finale_results = finale.fight_results
 
         assert notifications
         assert "concluded" in notifications[-1].lower()
@@ -177,3 +177,93 @@ def test_finale_still_resolves_when_both_finalists_are_unavailable():
         assert show.winner_id is not None
         assert show.runner_up_id is not None
         assert show.status == ShowStatus.COMPLETED
+
+
+def _start_intro_episode(session):
+    org = Organization(
+        name="Player Org",
+        prestige=60.0,
+        bank_balance=5_000_000,
+        is_player=True,
+    )
+    fighters = [_make_fighter(f"Fighter {idx}") for idx in range(1, 9)]
+    session.add(org)
+    session.add_all(fighters)
+    session.flush()
+
+    show = RealityShow(
+        name="Ultimate Fighter: Welterweight",
+        organization_id=org.id,
+        weight_class=WeightClass.WELTERWEIGHT,
+        status=ShowStatus.IN_PROGRESS,
+        format_size=8,
+        start_date=date(2026, 1, 1),
+        current_round=0,
+        episodes_aired=0,
+        production_cost_per_episode=75_000.0,
+        show_hype=20.0,
+    )
+    session.add(show)
+    session.flush()
+    session.add_all(
+        [
+            ShowContestant(show_id=show.id, fighter_id=f.id, seed=seed)
+            for seed, f in enumerate(fighters, start=1)
+        ]
+    )
+    session.commit()
+    return org, show, fighters
+
+
+def _single_shenanigan_pool(monkeypatch, shenanigan_type):
+    from api import services
+
+    entry = next(
+        s
+        for pool in services.SHENANIGANS.values()
+        for s in pool
+        if s["type"] == shenanigan_type
+    )
+    monkeypatch.setattr(
+        services, "SHENANIGANS", {"positive": [entry], "negative": [entry]}
+    )
+
+
+def test_callout_favorite_shenanigan_names_a_real_opponent(monkeypatch):
+    _single_shenanigan_pool(monkeypatch, "callout_favorite")
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        org, show, fighters = _start_intro_episode(session)
+        _process_reality_show(session, date(2026, 1, 1), org, random.Random(3))
+
+        episode = session.execute(
+            select(ShowEpisode).where(ShowEpisode.show_id == show.id)
+        ).scalar_one()
+        shenanigans = episode.shenanigans
+        names = {f.name for f in fighters}
+
+        assert shenanigans
+        for entry in shenanigans:
+            assert entry["type"] == "callout_favorite"
+            opponents = names - {entry["fighter_name"]}
+            assert any(name in entry["description"] for name in opponents)
+            assert "Unknown" not in entry["description"]
+
+
+def test_short_notice_step_up_skipped_without_elimination(monkeypatch):
+    _single_shenanigan_pool(monkeypatch, "short_notice_step_up")
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        org, show, fighters = _start_intro_episode(session)
+        _process_reality_show(session, date(2026, 1, 1), org, random.Random(3))
+
+        episode = session.execute(
+            select(ShowEpisode).where(ShowEpisode.show_id == show.id)
+        ).scalar_one()
+
+        assert episode.shenanigans is None
+        assert all(f.hype == 30.0 for f in fighters)